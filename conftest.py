@@ -3,6 +3,7 @@
 import os
 import sys
 import django
+import pytest
 from django.conf import settings
 
 # Add the project root directory to Python's path
@@ -11,3 +12,34 @@ sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 # Configure Django settings
 os.environ.setdefault("DJANGO_SETTINGS_MODULE", "portfoliocmsproject.settings")
 django.setup()
+
+
+@pytest.fixture(autouse=True, scope="session")
+def api_response_cache_in_memory():
+    """
+    Keeps the API response cache in memory for the test run, so tests never write
+    to the file or Redis backend configured for the server. Tests that need a
+    cache shared with other processes override CACHES with their own location.
+    """
+    from django.test import override_settings
+
+    backend = {
+        **settings.CACHES["api_responses"],
+        "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+        "LOCATION": "api-responses",
+        "OPTIONS": {"MAX_ENTRIES": settings.API_RESPONSE_CACHE["MAX_ENTRIES"]},
+    }
+    with override_settings(CACHES={**settings.CACHES, "api_responses": backend}):
+        yield
+
+
+@pytest.fixture(autouse=True)
+def clear_api_response_cache():
+    """
+    Empties the API response cache before each test. Test transactions are rolled
+    back without sending signals, so responses cached by one test could otherwise
+    be served to the next.
+    """
+    from django.core.cache import caches
+
+    caches["api_responses"].clear()
@@ -4,3 +4,7 @@ from django.apps import AppConfig
 class BlogConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "portfoliocmsapi.blog"
+
+    def ready(self):
+        # Register the API response cache invalidation
+        from . import signals  # noqa: F401
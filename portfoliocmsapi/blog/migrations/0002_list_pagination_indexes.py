@@ -0,0 +1,28 @@
+# Generated by Django 5.1.4 on 2026-10-18 12:08
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("blog", "0001_initial"),
+        ("projects", "0006_list_pagination_indexes"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AlterModelOptions(
+            name="media",
+            options={"ordering": ["-upload_date"]},
+        ),
+        migrations.AddIndex(
+            model_name="media",
+            index=models.Index(fields=["-upload_date", "-id"], name="media_list_idx"),
+        ),
+        migrations.AddIndex(
+            model_name="post",
+            index=models.Index(fields=["-date_created", "-id"], name="post_list_idx"),
+        ),
+    ]
@@ -0,0 +1,34 @@
+# Generated by Django 5.1.4 on 2026-10-18 12:12
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("blog", "0002_list_pagination_indexes"),
+        ("projects", "0007_lookup_indexes"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="media",
+            index=models.Index(
+                fields=["project", "-upload_date", "-id"], name="media_project_list_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="media",
+            index=models.Index(
+                fields=["post", "-upload_date", "-id"], name="media_post_list_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="post",
+            index=models.Index(
+                fields=["user", "-date_created", "-id"], name="post_user_list_idx"
+            ),
+        ),
+    ]
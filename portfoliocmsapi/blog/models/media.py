@@ -19,3 +19,17 @@ class Media(models.Model):
         if self.file:
             self.file_size = self.file.size
         super().save(*args, **kwargs)
+
+    class Meta:
+        ordering = ["-upload_date"]  # newest first
+        indexes = [
+            # Keyset pagination seeks on (upload_date, id) in list order
+            models.Index(fields=["-upload_date", "-id"], name="media_list_idx"),
+            # The same, for the media of one project or post
+            models.Index(
+                fields=["project", "-upload_date", "-id"], name="media_project_list_idx"
+            ),
+            models.Index(
+                fields=["post", "-upload_date", "-id"], name="media_post_list_idx"
+            ),
+        ]
@@ -20,3 +20,11 @@ class Post(models.Model):
         verbose_name = "post"
         verbose_name_plural = "posts"
         ordering = ["-date_created"]  # newest first
+        indexes = [
+            # Keyset pagination seeks on (date_created, id) in list order
+            models.Index(fields=["-date_created", "-id"], name="post_list_idx"),
+            # The same, for one user's posts
+            models.Index(
+                fields=["user", "-date_created", "-id"], name="post_user_list_idx"
+            ),
+        ]
@@ -1,6 +1,8 @@
 from rest_framework import serializers
 from django.contrib.auth.models import User
+from django.db.models import Prefetch
 from ..models import Post
+from portfoliocmsapi.projects.models import Project
 from portfoliocmsapi.projects.serializers import (
     TagSerializer,
     TechStackSerializer,
@@ -32,6 +34,31 @@ class PostSerializer(serializers.ModelSerializer):
             "last_update",
         ]
 
+    @staticmethod
+    def setup_eager_loading(queryset):
+        """
+        Loads everything the serializer reads in a fixed number of queries, however
+        many posts there are: the user is joined, and projects (id and title only),
+        tags and tech stack are prefetched.
+        """
+        return (
+            queryset.select_related("user")
+            .only(
+                "user",
+                "title",
+                "content",
+                "date_created",
+                "last_update",
+                "user__first_name",
+                "user__last_name",
+            )
+            .prefetch_related(
+                Prefetch("project", queryset=Project.objects.only("id", "title")),
+                "tag",
+                "tech_stack",
+            )
+        )
+
     def to_representation(self, instance):
         ret = super().to_representation(instance)
         ret["user"] = {
@@ -0,0 +1,13 @@
+from django.db.models.signals import m2m_changed, post_delete, post_save
+from .models import Post, PostTag, PostTechStack
+from ..utils.response_cache import invalidate_cached_responses
+
+# Cached post responses read these models, besides the project models and users
+# handled by the projects app. As there, through rows don't invalidate on delete,
+# so deleting a post still deletes its links in bulk.
+post_save.connect(invalidate_cached_responses, sender=Post)
+post_delete.connect(invalidate_cached_responses, sender=Post)
+for through_model in (PostTag, PostTechStack):
+    post_save.connect(invalidate_cached_responses, sender=through_model)
+for through_model in (Post.project.through, PostTag, PostTechStack):
+    m2m_changed.connect(invalidate_cached_responses, sender=through_model)
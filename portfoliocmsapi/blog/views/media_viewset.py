@@ -1,8 +1,25 @@
 from rest_framework import viewsets
+from rest_framework.exceptions import ValidationError
 from ..models import Media
 from ..serializers import MediaSerializer
+from ...utils import KeysetPagination
 
 
 class MediaViewSet(viewsets.ModelViewSet):
     queryset = Media.objects.all()
     serializer_class = MediaSerializer
+    pagination_class = KeysetPagination
+
+    def get_queryset(self):
+        """
+        Media, optionally only those of one project (?project=<id>) or post
+        (?post=<id>).
+        """
+        queryset = super().get_queryset()
+        for field in ("project", "post"):
+            value = self.request.query_params.get(field)
+            if value is not None:
+                if not value.isdigit():
+                    raise ValidationError({field: f"Must be a {field} id"})
+                queryset = queryset.filter(**{f"{field}_id": value})
+        return queryset
@@ -1,20 +1,56 @@
+from django.contrib.auth.models import User
 from rest_framework import viewsets
+from rest_framework.exceptions import ValidationError
 from rest_framework.permissions import AllowAny
-from ..models import Post
+from ..models import Post, PostTag, PostTechStack
 from portfoliocmsapi.projects.models import Project, Tag, TechStack
 from ..serializers.post_serializer import PostSerializer
-from ...utils import CreateRelationshipMixin, UpdateRelationshipMixin
+from ...utils import (
+    ConditionalGetMixin,
+    CreateRelationshipMixin,
+    KeysetPagination,
+    UpdateRelationshipMixin,
+)
 
 
 class PostViewSet(
-    CreateRelationshipMixin, UpdateRelationshipMixin, viewsets.ModelViewSet
+    ConditionalGetMixin,
+    CreateRelationshipMixin,
+    UpdateRelationshipMixin,
+    viewsets.ModelViewSet,
 ):
     permission_classes = [AllowAny]
     queryset = Post.objects.all()
     serializer_class = PostSerializer
+    pagination_class = KeysetPagination
+    cache_models = (
+        Post,
+        PostTag,
+        PostTechStack,
+        Post.project.through,
+        Project,
+        Tag,
+        TechStack,
+        User,
+    )
 
     relationship_configs = {
         "project": {"model": Project},
         "tag": {"model": Tag},
         "tech_stack": {"model": TechStack},
     }
+
+    def get_queryset(self):
+        """
+        Posts, optionally only one user's with ?user=<id>.
+        """
+        queryset = super().get_queryset()
+        if self.action in ("list", "retrieve"):
+            queryset = PostSerializer.setup_eager_loading(queryset)
+
+        user = self.request.query_params.get("user")
+        if user is not None:
+            if not user.isdigit():
+                raise ValidationError({"user": "Must be a user id"})
+            queryset = queryset.filter(user_id=user)
+        return queryset
@@ -0,0 +1,39 @@
+import os
+import socket
+from django.core.management.base import BaseCommand
+from portfoliocmsapi.jobs import queue
+
+
+class Command(BaseCommand):
+    help = "Runs queued background jobs, such as GitHub syncs."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--once",
+            action="store_true",
+            help="Exit once no job is due instead of polling for new ones",
+        )
+        parser.add_argument(
+            "--max-jobs",
+            type=int,
+            help="Exit after running this many jobs",
+        )
+        parser.add_argument(
+            "--poll-interval",
+            type=float,
+            help="Seconds to wait between polls when the queue is empty",
+        )
+        parser.add_argument(
+            "--worker-id",
+            default=f"{socket.gethostname()}:{os.getpid()}",
+            help="Name recorded on the jobs this worker claims",
+        )
+
+    def handle(self, *args, **options):
+        processed = queue.work(
+            options["worker_id"],
+            once=options["once"],
+            poll_interval=options["poll_interval"],
+            max_jobs=options["max_jobs"],
+        )
+        self.stdout.write(self.style.SUCCESS(f"Ran {processed} jobs"))
@@ -0,0 +1,43 @@
+# Generated by Django 5.1.4 on 2026-10-18 12:42
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+def backfill_job_user(apps, schema_editor):
+    """
+    Assigns existing jobs to the user named in their payload, where there is one.
+    """
+    Job = apps.get_model("jobs", "Job")
+    User = apps.get_model(*settings.AUTH_USER_MODEL.split("."))
+    user_ids = set(User.objects.values_list("id", flat=True))
+    jobs = []
+    for job in Job.objects.only("id", "payload"):
+        user_id = (job.payload or {}).get("user_id")
+        if user_id in user_ids:
+            job.user_id = user_id
+            jobs.append(job)
+    Job.objects.bulk_update(jobs, ["user"], batch_size=500)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("jobs", "0001_initial"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="job",
+            name="user",
+            field=models.ForeignKey(
+                blank=True,
+                null=True,
+                on_delete=django.db.models.deletion.CASCADE,
+                to=settings.AUTH_USER_MODEL,
+            ),
+        ),
+        migrations.RunPython(backfill_job_user, migrations.RunPython.noop),
+    ]
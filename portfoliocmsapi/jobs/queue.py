@@ -0,0 +1,230 @@
+import logging
+import random
+import time
+from datetime import timedelta
+from typing import Callable, Optional
+from django.conf import settings
+from django.db import transaction
+from django.db.models import F
+from django.utils import timezone
+from .models import Job
+
+logger = logging.getLogger(__name__)
+
+# Task functions by job name. Each task takes the job payload and returns a
+# JSON-serializable result.
+_tasks = {}
+# Decides, for each job name, whether a failure is worth retrying
+_retry_policies = {}
+
+
+def task(name: str, retry_on: Callable[[Exception], bool] = None) -> Callable:
+    """
+    Registers a function as the handler for jobs with the given name.
+
+    Args:
+        name: The job name
+        retry_on: Returns whether a failure may succeed on a later attempt. Failures
+                 it rejects (a missing row, invalid input) fail the job at once.
+                 By default every failure is retried.
+
+    Example:
+        @task("reports.build", retry_on=lambda error: isinstance(error, TimeoutError))
+        def build_report(payload):
+            ...
+    """
+
+    def decorator(func):
+        _tasks[name] = func
+        _retry_policies[name] = retry_on or (lambda error: True)
+        return func
+
+    return decorator
+
+
+def enqueue(
+    name: str, payload: dict = None, max_attempts: int = None, user=None
+) -> Job:
+    """
+    Adds a job to the queue.
+
+    Args:
+        name: The registered task name
+        payload: JSON-serializable arguments for the task
+        max_attempts: How many times the job is tried before it is marked failed.
+                    Defaults to settings.JOB_QUEUE["MAX_ATTEMPTS"].
+        user: The user the job runs for, who alone can see it through the API
+
+    Returns:
+        The queued Job
+    """
+    if name not in _tasks:
+        raise ValueError(f"No task registered with name '{name}'")
+
+    return Job.objects.create(
+        name=name,
+        payload=payload or {},
+        max_attempts=max_attempts or _config("MAX_ATTEMPTS"),
+        user=user if user is not None and user.is_authenticated else None,
+    )
+
+
+def claim(worker_id: str) -> Optional[Job]:
+    """
+    Claims the oldest due job for a worker.
+
+    The candidate row is locked with SELECT ... FOR UPDATE SKIP LOCKED where the
+    database supports it. The status change is also made conditional on the job
+    still being queued, so two workers can never claim the same job, even on
+    databases without row locking.
+
+    Returns:
+        The claimed Job, now running, or None if nothing is due
+    """
+    while True:
+        with transaction.atomic():
+            job = (
+                Job.objects.select_for_update(skip_locked=True)
+                .filter(status="queued", run_after__lte=timezone.now())
+                .order_by("run_after", "id")
+                .first()
+            )
+            if job is None:
+                return None
+
+            now = timezone.now()
+            claimed = Job.objects.filter(id=job.id, status="queued").update(
+                status="running",
+                locked_by=worker_id,
+                locked_at=now,
+                attempts=job.attempts + 1,
+            )
+            if claimed:
+                job.refresh_from_db()
+                return job
+
+
+def run(job: Job) -> Job:
+    """
+    Runs a claimed job and records the outcome.
+
+    A failing job is queued again with exponential backoff and jitter until it runs
+    out of attempts, after which it is marked failed. Failures the task's retry
+    policy doesn't consider transient fail the job right away.
+    """
+    handler = _tasks.get(job.name)
+    try:
+        if handler is None:
+            raise LookupError(f"No task registered with name '{job.name}'")
+        result = handler(job.payload)
+    except Exception as e:
+        job.last_error = f"{type(e).__name__}: {e}"
+        retry = handler is not None and _retry_policies[job.name](e)
+        if retry and job.attempts < job.max_attempts:
+            job.status = "queued"
+            job.run_after = timezone.now() + retry_delay(job.attempts)
+        else:
+            job.status = "failed"
+            job.date_finished = timezone.now()
+        logger.warning(
+            "Job %s failed (attempt %s%s): %s",
+            job,
+            job.attempts,
+            "" if retry else ", not retried",
+            e,
+        )
+    else:
+        job.status = "succeeded"
+        job.result = result
+        job.last_error = ""
+        job.date_finished = timezone.now()
+
+    job.locked_by = ""
+    job.locked_at = None
+    job.save(
+        update_fields=[
+            "status",
+            "result",
+            "run_after",
+            "last_error",
+            "locked_by",
+            "locked_at",
+            "date_finished",
+        ]
+    )
+    return job
+
+
+def retry_delay(attempts: int) -> timedelta:
+    """
+    Returns how long to wait before retrying a job that has failed `attempts` times.
+    """
+    base = _config("RETRY_BACKOFF")
+    delay = min(base * 2 ** (attempts - 1), _config("MAX_RETRY_BACKOFF"))
+    return timedelta(seconds=delay * random.uniform(0.5, 1.0))
+
+
+def requeue_stale() -> int:
+    """
+    Puts running jobs whose worker stopped responding back in the queue.
+
+    A job that has used up its attempts is marked failed instead, so a job that
+    keeps killing its worker (out of memory, a hard timeout) isn't retried forever.
+
+    Returns:
+        The number of jobs requeued
+    """
+    cutoff = timezone.now() - timedelta(seconds=_config("LOCK_TIMEOUT"))
+    stale = Job.objects.filter(status="running", locked_at__lt=cutoff)
+    stale.filter(attempts__gte=F("max_attempts")).update(
+        status="failed",
+        last_error="Worker stopped responding",
+        locked_by="",
+        locked_at=None,
+        date_finished=timezone.now(),
+    )
+    return stale.update(status="queued", locked_by="", locked_at=None)
+
+
+def work(
+    worker_id: str, once: bool = False, poll_interval: float = None, max_jobs=None
+) -> int:
+    """
+    Claims and runs jobs until stopped.
+
+    Args:
+        worker_id: Identifies this worker in the locked_by column
+        once: Stop as soon as no job is due instead of polling
+        poll_interval: Seconds to sleep when the queue is empty
+        max_jobs: Stop after running this many jobs
+
+    Returns:
+        The number of jobs run
+    """
+    poll_interval = poll_interval or _config("POLL_INTERVAL")
+    processed = 0
+
+    while max_jobs is None or processed < max_jobs:
+        requeue_stale()
+        job = claim(worker_id)
+        if job is None:
+            if once:
+                break
+            time.sleep(poll_interval)
+            continue
+
+        run(job)
+        processed += 1
+
+    return processed
+
+
+def _config(key: str):
+    defaults = {
+        "MAX_ATTEMPTS": 5,
+        "RETRY_BACKOFF": 30,
+        "MAX_RETRY_BACKOFF": 3600,
+        "LOCK_TIMEOUT": 600,
+        "POLL_INTERVAL": 1.0,
+    }
+    return getattr(settings, "JOB_QUEUE", {}).get(key, defaults[key])
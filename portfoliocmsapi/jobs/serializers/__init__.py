@@ -0,0 +1 @@
+from .job_serializer import JobSerializer
@@ -0,0 +1,21 @@
+from rest_framework import serializers
+from ..models import Job
+
+
+class JobSerializer(serializers.ModelSerializer):
+
+    class Meta:
+        model = Job
+        fields = [
+            "id",
+            "name",
+            "status",
+            "result",
+            "attempts",
+            "max_attempts",
+            "run_after",
+            "last_error",
+            "date_created",
+            "date_finished",
+        ]
+        read_only_fields = fields
@@ -0,0 +1,2 @@
+from .test_queue import *
+from .test_views import *
@@ -0,0 +1,123 @@
+import pytest
+from datetime import timedelta
+from django.utils import timezone
+from portfoliocmsapi.jobs import queue
+from portfoliocmsapi.jobs.models import Job
+
+calls = []
+
+
+@queue.task("tests.record")
+def record(payload):
+    calls.append(payload)
+    return {"echo": payload["value"]}
+
+
+@queue.task("tests.explode")
+def explode(payload):
+    raise RuntimeError("GitHub is down")
+
+
+@queue.task("tests.lookup", retry_on=lambda error: isinstance(error, TimeoutError))
+def lookup(payload):
+    if payload["missing"]:
+        raise LookupError("No such row")
+    raise TimeoutError("Timed out")
+
+
+class TestJobQueue:
+    def setup_method(self):
+        calls.clear()
+
+    def test_enqueue_claim_and_run(self, db):
+        job = queue.enqueue("tests.record", {"value": 42})
+        assert job.status == "queued"
+
+        claimed = queue.claim("worker-1")
+        assert claimed.id == job.id
+        assert claimed.status == "running"
+        assert claimed.locked_by == "worker-1"
+        assert claimed.attempts == 1
+
+        # A claimed job can't be claimed by another worker
+        assert queue.claim("worker-2") is None
+
+        queue.run(claimed)
+        job.refresh_from_db()
+        assert job.status == "succeeded"
+        assert job.result == {"echo": 42}
+        assert job.date_finished is not None
+        assert calls == [{"value": 42}]
+
+    def test_failed_job_is_retried_with_backoff(self, db):
+        job = queue.enqueue("tests.explode", max_attempts=2)
+
+        queue.run(queue.claim("worker-1"))
+        job.refresh_from_db()
+        assert job.status == "queued"
+        assert job.run_after > timezone.now()
+        assert "GitHub is down" in job.last_error
+
+        # Not due yet, so workers leave it alone until the backoff expires
+        assert queue.claim("worker-1") is None
+        Job.objects.filter(id=job.id).update(run_after=timezone.now())
+
+        queue.run(queue.claim("worker-1"))
+        job.refresh_from_db()
+        assert job.status == "failed"
+        assert job.attempts == 2
+
+    def test_only_transient_failures_are_retried(self, db):
+        permanent = queue.enqueue("tests.lookup", {"missing": True}, max_attempts=3)
+        queue.run(queue.claim("worker-1"))
+        permanent.refresh_from_db()
+        assert permanent.status == "failed"
+        assert permanent.attempts == 1
+        assert "No such row" in permanent.last_error
+
+        transient = queue.enqueue("tests.lookup", {"missing": False}, max_attempts=3)
+        queue.run(queue.claim("worker-1"))
+        transient.refresh_from_db()
+        assert transient.status == "queued"
+        assert transient.run_after > timezone.now()
+
+    def test_retry_delay_grows_exponentially(self, settings):
+        settings.JOB_QUEUE = {"RETRY_BACKOFF": 10, "MAX_RETRY_BACKOFF": 60}
+
+        assert timedelta(seconds=5) <= queue.retry_delay(1) <= timedelta(seconds=10)
+        assert timedelta(seconds=20) <= queue.retry_delay(3) <= timedelta(seconds=40)
+        assert queue.retry_delay(10) <= timedelta(seconds=60)
+
+    def test_stale_running_jobs_are_requeued(self, db):
+        job = queue.enqueue("tests.record", {"value": 1})
+        queue.claim("worker-1")
+        Job.objects.filter(id=job.id).update(
+            locked_at=timezone.now() - timedelta(hours=1)
+        )
+
+        assert queue.requeue_stale() == 1
+        assert queue.claim("worker-2").id == job.id
+
+    def test_stale_jobs_out_of_attempts_fail(self, db):
+        job = queue.enqueue("tests.record", {"value": 1}, max_attempts=1)
+        queue.claim("worker-1")
+        Job.objects.filter(id=job.id).update(
+            locked_at=timezone.now() - timedelta(hours=1)
+        )
+
+        assert queue.requeue_stale() == 0
+        job.refresh_from_db()
+        assert job.status == "failed"
+        assert job.date_finished is not None
+        assert queue.claim("worker-2") is None
+
+    def test_work_runs_due_jobs_once(self, db):
+        for value in range(3):
+            queue.enqueue("tests.record", {"value": value})
+
+        assert queue.work("worker-1", once=True) == 3
+        assert sorted(call["value"] for call in calls) == [0, 1, 2]
+
+    def test_unknown_task_is_rejected(self, db):
+        with pytest.raises(ValueError):
+            queue.enqueue("tests.missing")
@@ -0,0 +1,28 @@
+from django.contrib.auth.models import User
+from rest_framework.test import APITestCase
+from portfoliocmsapi.jobs import queue
+from .test_queue import record  # noqa: F401 (registers the tests.record task)
+
+
+class TestJobViewSet(APITestCase):
+    def setUp(self):
+        self.owner = User.objects.create_user(username="owner", password="testpass")
+        self.other = User.objects.create_user(username="other", password="testpass")
+        self.job = queue.enqueue("tests.record", {"value": 1}, user=self.owner)
+
+    def test_users_only_see_their_own_jobs(self):
+        self.client.force_authenticate(user=self.other)
+        assert self.client.get("/api/jobs").json() == []
+        assert self.client.get(f"/api/jobs/{self.job.id}").status_code == 404
+
+        self.client.force_authenticate(user=self.owner)
+        assert [job["id"] for job in self.client.get("/api/jobs").json()] == [
+            self.job.id
+        ]
+        assert self.client.get(f"/api/jobs/{self.job.id}").status_code == 200
+
+    def test_staff_see_every_job(self):
+        self.other.is_staff = True
+        self.other.save()
+        self.client.force_authenticate(user=self.other)
+        assert self.client.get(f"/api/jobs/{self.job.id}").status_code == 200
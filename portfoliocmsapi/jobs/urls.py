@@ -0,0 +1,8 @@
+from rest_framework import routers
+from portfoliocmsapi.jobs.views import *
+
+router = routers.DefaultRouter(trailing_slash=False)
+router.register(r"jobs", JobViewSet, "job")
+
+
+urlpatterns = [] + router.urls
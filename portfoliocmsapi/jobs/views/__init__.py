@@ -0,0 +1 @@
+from .job_viewset import JobViewSet
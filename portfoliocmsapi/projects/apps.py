@@ -4,3 +4,7 @@ from django.apps import AppConfig
 class ProjectsConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "portfoliocmsapi.projects"
+
+    def ready(self):
+        # Register the GitHub background job handlers and cache invalidation
+        from . import signals, tasks  # noqa: F401
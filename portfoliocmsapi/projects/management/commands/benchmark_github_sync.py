@@ -0,0 +1,91 @@
+import json
+from pathlib import Path
+from django.core.management.base import BaseCommand, CommandError
+from portfoliocmsapi.services.github.benchmark import (
+    compare_to_baseline,
+    run_benchmarks,
+)
+
+
+class Command(BaseCommand):
+    help = (
+        "Benchmarks project creation and syncing against a simulated GitHub, "
+        "optionally failing if a saved baseline regresses."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--sizes",
+            type=int,
+            nargs="+",
+            default=[10, 100, 1000],
+            help="Numbers of repositories to benchmark with",
+        )
+        parser.add_argument(
+            "--latency",
+            type=float,
+            default=0.0,
+            help="Simulated GitHub latency per request, in seconds",
+        )
+        parser.add_argument(
+            "--workers",
+            type=int,
+            default=8,
+            help="Worker threads used by the bulk sync",
+        )
+        parser.add_argument("--output", help="Write the results to this JSON file")
+        parser.add_argument(
+            "--baseline",
+            help="Fail if the results regress against this JSON results file",
+        )
+        parser.add_argument(
+            "--tolerance",
+            type=float,
+            default=0.1,
+            help="Allowed growth of request and query counts over the baseline",
+        )
+        parser.add_argument(
+            "--timing-tolerance",
+            type=float,
+            default=0.5,
+            help="Allowed growth of wall time and peak memory over the baseline",
+        )
+
+    def handle(self, *args, **options):
+        results = run_benchmarks(
+            sizes=options["sizes"],
+            latency=options["latency"],
+            workers=options["workers"],
+        )
+
+        for size, scenarios in results.items():
+            self.stdout.write(f"{size} repositories:")
+            for scenario, metrics in scenarios.items():
+                self.stdout.write(
+                    f"  {scenario:<28} {metrics['wall_seconds']:>8.3f}s "
+                    f"{metrics['upstream_requests']:>6} requests "
+                    f"{metrics['quota_used']:>6} quota "
+                    f"{metrics['queries']:>7} queries "
+                    f"{metrics['peak_memory_bytes'] / 1024 / 1024:>7.1f} MiB"
+                )
+
+        if options["output"]:
+            Path(options["output"]).write_text(
+                json.dumps(results, indent=2), encoding="utf-8"
+            )
+            self.stdout.write(f"Wrote results to {options['output']}")
+
+        if options["baseline"]:
+            baseline = json.loads(Path(options["baseline"]).read_text(encoding="utf-8"))
+            regressions = compare_to_baseline(
+                results,
+                baseline,
+                tolerance=options["tolerance"],
+                timing_tolerance=options["timing_tolerance"],
+            )
+            if regressions:
+                raise CommandError(
+                    "Benchmark regressed against the baseline:\n"
+                    + "\n".join(regressions)
+                )
+            self.stdout.write(self.style.SUCCESS("No regressions against the baseline"))
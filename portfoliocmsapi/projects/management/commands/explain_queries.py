@@ -0,0 +1,103 @@
+from django.conf import settings
+from django.contrib.auth.models import User
+from django.core.management.base import BaseCommand, CommandError
+from django.db.models.functions import Lower
+from django.test.utils import override_settings
+from rest_framework.test import APIClient
+from portfoliocmsapi.blog.models import Post
+from portfoliocmsapi.projects.models import Project, Tag, TechStack
+from portfoliocmsapi.utils import KeysetPagination
+from portfoliocmsapi.utils.query_plans import check_query_plans
+
+
+class Command(BaseCommand):
+    help = (
+        "Runs EXPLAIN on the queries behind the main API endpoints and flags full "
+        "table scans. Plans depend on table statistics, so run it against a "
+        "database of realistic size."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--verbose-plans",
+            action="store_true",
+            help="Print the SQL and plan of every query, not just the flagged ones",
+        )
+
+    def handle(self, *args, **options):
+        results = check_query_plans(self.checks())
+
+        flagged = [result for result in results if result["full_scans"]]
+        for result in results:
+            if result["full_scans"]:
+                self.stdout.write(
+                    self.style.WARNING(
+                        f"{result['label']}: full scan of "
+                        f"{', '.join(result['full_scans'])}"
+                    )
+                )
+            if result["full_scans"] or options["verbose_plans"]:
+                self.stdout.write(f"  {result['sql']}")
+                for line in result["plan"]:
+                    self.stdout.write(f"    {line}")
+
+        if flagged:
+            raise CommandError(
+                f"{len(flagged)} of {len(results)} queries scan a whole table"
+            )
+        self.stdout.write(
+            self.style.SUCCESS(f"All {len(results)} queries use an index")
+        )
+
+    def checks(self) -> dict:
+        """
+        The queries to check: the main list, filtered and detail endpoints, and the
+        name lookups done by the GitHub sync. Ids of existing rows are used where
+        there are any; the plans don't depend on rows existing.
+        """
+        user = User.objects.order_by("id").first() or User(id=1)
+        project_id = Project.objects.values_list("id", flat=True).first() or 1
+        post_id = Post.objects.values_list("id", flat=True).first() or 1
+        cursor = KeysetPagination().encode_cursor(
+            ["2024-01-01T00:00:00+00:00", 1], reverse=False
+        )
+
+        client = APIClient()
+        client.force_authenticate(user=user)
+
+        def get(url):
+            def request():
+                # A cached response would send no queries to explain
+                with override_settings(
+                    ALLOWED_HOSTS=[*settings.ALLOWED_HOSTS, "testserver"],
+                    API_RESPONSE_CACHE={
+                        **getattr(settings, "API_RESPONSE_CACHE", {}),
+                        "ENABLED": False,
+                    },
+                ):
+                    client.get(url)
+
+            return request
+
+        def by_name(model):
+            # As GitHubSyncService._get_or_create_named looks names up
+            return lambda: list(
+                model.objects.annotate(lower_name=Lower("name"))
+                .filter(lower_name__in=["python"])
+                .order_by()
+            )
+
+        return {
+            "GET /api/projects": get("/api/projects"),
+            "GET /api/projects (next page)": get(f"/api/projects?cursor={cursor}"),
+            "GET /api/projects?user=": get(f"/api/projects?user={user.id}"),
+            "GET /api/projects/<id>": get(f"/api/projects/{project_id}"),
+            "GET /api/posts": get("/api/posts"),
+            "GET /api/posts (next page)": get(f"/api/posts?cursor={cursor}"),
+            "GET /api/posts?user=": get(f"/api/posts?user={user.id}"),
+            "GET /api/posts/<id>": get(f"/api/posts/{post_id}"),
+            "GET /api/media?project=": get(f"/api/media?project={project_id}"),
+            "GET /api/media?post=": get(f"/api/media?post={post_id}"),
+            "TechStack by name": by_name(TechStack),
+            "Tag by name": by_name(Tag),
+        }
@@ -0,0 +1,33 @@
+import requests
+from django.core.management.base import BaseCommand, CommandError
+from portfoliocmsapi.services.github import get_github_client
+from portfoliocmsapi.services.github.dev import record_fixtures
+
+
+class Command(BaseCommand):
+    help = (
+        "Records the GitHub account's repositories to a JSON file that the fake "
+        "GitHub server can replay."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("output", help="Path of the fixture file to write")
+        parser.add_argument(
+            "--limit",
+            type=int,
+            help="Record at most this many repositories",
+        )
+
+    def handle(self, *args, **options):
+        github_client = get_github_client()
+        try:
+            github_client.verify_token()
+            count = record_fixtures(
+                github_client, options["output"], limit=options["limit"]
+            )
+        except (ValueError, requests.exceptions.RequestException) as e:
+            raise CommandError(str(e)) from e
+
+        self.stdout.write(
+            self.style.SUCCESS(f"Recorded {count} repositories to {options['output']}")
+        )
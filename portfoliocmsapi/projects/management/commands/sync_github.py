@@ -0,0 +1,118 @@
+import time
+from django.core.management.base import BaseCommand, CommandError
+from portfoliocmsapi.projects.models import Project
+from portfoliocmsapi.services.github import GitHubSyncService, get_github_client
+
+
+class Command(BaseCommand):
+    help = "Syncs projects with their GitHub repositories, fetching them concurrently."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--project",
+            type=int,
+            action="append",
+            dest="project_ids",
+            help="Only sync the project with this id (can be repeated)",
+        )
+        parser.add_argument(
+            "--owner",
+            help="Only sync projects whose repository belongs to this GitHub owner",
+        )
+        parser.add_argument(
+            "--status",
+            choices=[value for value, _ in Project.STATUS_CHOICES],
+            help="Only sync projects with this status",
+        )
+        parser.add_argument(
+            "--workers",
+            type=int,
+            help="Number of repositories fetched in parallel "
+            "(defaults to settings.GITHUB_SYNC_WORKERS)",
+        )
+        parser.add_argument(
+            "--force",
+            action="store_true",
+            help="Rewrite every project, even if GitHub reports no changes",
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=100,
+            help="Number of projects written per database transaction",
+        )
+
+    def handle(self, *args, **options):
+        projects = Project.objects.all()
+        if options["project_ids"]:
+            projects = projects.filter(id__in=options["project_ids"])
+        if options["owner"]:
+            projects = projects.filter(github_owner=options["owner"].lower())
+        if options["status"]:
+            projects = projects.filter(status=options["status"])
+
+        github_client = get_github_client()
+        try:
+            github_client.verify_token()
+        except ValueError as e:
+            raise CommandError(str(e)) from e
+
+        sync_service = GitHubSyncService(github_client=github_client)
+
+        started = time.perf_counter()
+        results = sync_service.sync_projects(
+            projects,
+            workers=options["workers"],
+            batch_size=options["batch_size"],
+            force=options["force"],
+        )
+        elapsed = time.perf_counter() - started
+
+        failures = 0
+        unchanged = 0
+        for result in results:
+            owner, repo_name = result.project.github_repository
+            if result.ok and not result.changed:
+                unchanged += 1
+                self.stdout.write(
+                    f"{owner}/{repo_name}: unchanged ({result.elapsed:.2f}s)"
+                )
+            elif result.ok:
+                self.stdout.write(
+                    f"{owner}/{repo_name}: synced in {result.elapsed:.2f}s"
+                )
+            else:
+                failures += 1
+                self.stderr.write(
+                    self.style.ERROR(
+                        f"{owner}/{repo_name}: failed after "
+                        f"{result.elapsed:.2f}s - {result.error}"
+                    )
+                )
+
+        summary = (
+            f"Synced {len(results) - failures} of {len(results)} projects "
+            f"({unchanged} unchanged) in {elapsed:.2f}s"
+        )
+        if failures:
+            self.stdout.write(self.style.WARNING(f"{summary} ({failures} failed)"))
+        else:
+            self.stdout.write(self.style.SUCCESS(summary))
+
+        quota = github_client.rate_limit_metrics()
+        if quota["remaining"] is not None:
+            self.stdout.write(
+                f"GitHub quota: {quota['remaining']}/{quota['limit']} remaining, "
+                f"{quota['throttled_requests']} requests throttled "
+                f"({quota['total_wait']:.1f}s waiting)"
+            )
+
+        transport = github_client.transport_metrics()
+        if transport["requests"]:
+            self.stdout.write(
+                f"GitHub requests: {transport['requests']} "
+                f"({transport['failures']} failed), "
+                f"{transport['average_seconds'] * 1000:.0f}ms average, "
+                f"{transport['max_seconds'] * 1000:.0f}ms max, "
+                f"{transport['bytes_received'] / 1024:.1f} KiB received"
+            )
@@ -0,0 +1,39 @@
+# Generated by Django 5.1.4 on 2026-10-18 11:37
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("projects", "0002_project_sync_watermarks"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="GitHubWebhookEvent",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("delivery_id", models.CharField(max_length=64, unique=True)),
+                ("event", models.CharField(max_length=50)),
+                ("action", models.CharField(blank=True, default="", max_length=50)),
+                ("payload", models.JSONField()),
+                ("received_at", models.DateTimeField(auto_now_add=True)),
+                ("processed_at", models.DateTimeField(blank=True, null=True)),
+                ("error", models.TextField(blank=True, default="")),
+            ],
+            options={
+                "verbose_name": "GitHub webhook event",
+                "verbose_name_plural": "GitHub webhook events",
+                "ordering": ["-received_at"],
+            },
+        ),
+    ]
@@ -0,0 +1,86 @@
+# Generated by Django 5.1.4 on 2026-10-18 11:53
+
+import logging
+from urllib.parse import urlparse
+from django.conf import settings
+from django.db import migrations, models
+
+logger = logging.getLogger(__name__)
+
+
+def backfill_github_identity(apps, schema_editor):
+    """
+    Fills in github_owner/github_name from repo_url for existing projects.
+
+    The numeric repository id isn't known without asking GitHub; the next sync
+    records it. If several projects point at the same repository, only the oldest
+    (lowest id) gets the identity, so the unique constraint can be added. The
+    others keep NULL github_owner/github_name, which saving or syncing them
+    preserves, and are logged as warnings, to be merged or deleted.
+    """
+    Project = apps.get_model("projects", "Project")
+    seen = {}
+    duplicates = []
+    updated = []
+    for project in Project.objects.order_by("id").only("id", "repo_url"):
+        segments = [s for s in urlparse(project.repo_url.strip()).path.split("/") if s]
+        if len(segments) < 2:
+            continue
+        owner, name = segments[0].lower(), segments[1].lower()
+        if name.endswith(".git"):
+            name = name[: -len(".git")]
+        if (owner, name) in seen:
+            duplicates.append((project.id, owner, name, seen[(owner, name)]))
+            continue
+        seen[(owner, name)] = project.id
+        project.github_owner = owner
+        project.github_name = name
+        updated.append(project)
+
+    Project.objects.bulk_update(
+        updated, ["github_owner", "github_name"], batch_size=500
+    )
+
+    for project_id, owner, name, linked_id in duplicates:
+        logger.warning(
+            "Project %s points at %s/%s, which is already linked to project %s; "
+            "it was left unlinked.",
+            project_id,
+            owner,
+            name,
+            linked_id,
+        )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("projects", "0003_githubwebhookevent"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="project",
+            name="github_name",
+            field=models.CharField(blank=True, max_length=100, null=True),
+        ),
+        migrations.AddField(
+            model_name="project",
+            name="github_owner",
+            field=models.CharField(blank=True, max_length=100, null=True),
+        ),
+        migrations.AddField(
+            model_name="project",
+            name="github_repo_id",
+            field=models.BigIntegerField(blank=True, null=True, unique=True),
+        ),
+        migrations.RunPython(backfill_github_identity, migrations.RunPython.noop),
+        migrations.AddConstraint(
+            model_name="project",
+            constraint=models.UniqueConstraint(
+                fields=("github_owner", "github_name"),
+                name="unique_project_github_repository",
+            ),
+        ),
+    ]
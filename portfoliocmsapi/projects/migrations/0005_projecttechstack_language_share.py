@@ -0,0 +1,58 @@
+# Generated by Django 5.1.4 on 2026-10-18 11:57
+
+from django.db import migrations, models
+
+
+def reset_sync_watermarks(apps, schema_editor):
+    """
+    Forgets what the last sync saw upstream, so the next sync fetches every
+    repository's languages again and fills in the byte counts.
+
+    Clearing the /languages ETags alone isn't enough: a sync only asks for
+    languages when the repository details come back changed (no 304, and new
+    updated_at/pushed_at watermarks).
+    """
+    Project = apps.get_model("projects", "Project")
+    Project.objects.update(
+        github_etag="",
+        github_languages_etag="",
+        github_updated_at=None,
+        github_pushed_at=None,
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("projects", "0004_project_github_identity"),
+    ]
+
+    operations = [
+        migrations.AlterModelOptions(
+            name="projecttechstack",
+            options={"ordering": ["-bytes"], "verbose_name": "project tech stack"},
+        ),
+        migrations.AddField(
+            model_name="projecttechstack",
+            name="bytes",
+            field=models.PositiveBigIntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name="projecttechstack",
+            name="percentage",
+            field=models.DecimalField(decimal_places=2, default=0, max_digits=5),
+        ),
+        migrations.AddIndex(
+            model_name="projecttechstack",
+            index=models.Index(
+                fields=["project", "-bytes"], name="projecttechstack_size_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="projecttechstack",
+            index=models.Index(
+                fields=["tech_stack", "-percentage"], name="projecttechstack_share_idx"
+            ),
+        ),
+        migrations.RunPython(reset_sync_watermarks, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,21 @@
+# Generated by Django 5.1.4 on 2026-10-18 12:08
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("projects", "0005_projecttechstack_language_share"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="project",
+            index=models.Index(
+                fields=["-date_created", "-id"], name="project_list_idx"
+            ),
+        ),
+    ]
@@ -0,0 +1,35 @@
+# Generated by Django 5.1.4 on 2026-10-18 12:12
+
+import django.db.models.functions.text
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("projects", "0006_list_pagination_indexes"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="project",
+            index=models.Index(
+                fields=["user", "-date_created", "-id"], name="project_user_list_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="tag",
+            index=models.Index(
+                django.db.models.functions.text.Lower("name"), name="tag_name_lower_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="techstack",
+            index=models.Index(
+                django.db.models.functions.text.Lower("name"),
+                name="techstack_name_lower_idx",
+            ),
+        ),
+    ]
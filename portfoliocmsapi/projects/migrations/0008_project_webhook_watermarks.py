@@ -0,0 +1,23 @@
+# Generated by Django 5.1.4 on 2026-10-18 12:36
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("projects", "0007_lookup_indexes"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="project",
+            name="github_webhook_pushed_at",
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name="project",
+            name="github_webhook_updated_at",
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+    ]
@@ -0,0 +1,35 @@
+# Generated by Django 5.1.4 on 2026-10-18 13:04
+
+from django.db import migrations, models
+
+
+def mark_synced_languages(apps, schema_editor):
+    """
+    Marks the tech stack links that carry GitHub byte counts as synced; only the
+    sync records those. Every other existing link, tags included, can't be told
+    apart from one added in the CMS, so it is kept as hand-added and no sync will
+    remove it.
+    """
+    ProjectTechStack = apps.get_model("projects", "ProjectTechStack")
+    ProjectTechStack.objects.filter(bytes__gt=0).update(synced=True)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("projects", "0008_project_webhook_watermarks"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="projecttag",
+            name="synced",
+            field=models.BooleanField(default=False),
+        ),
+        migrations.AddField(
+            model_name="projecttechstack",
+            name="synced",
+            field=models.BooleanField(default=False),
+        ),
+        migrations.RunPython(mark_synced_languages, migrations.RunPython.noop),
+    ]
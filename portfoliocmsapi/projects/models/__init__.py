@@ -3,3 +3,4 @@ from .tech_stack import TechStack
 from .project import Project
 from .project_tag import ProjectTag
 from .project_tech_stack import ProjectTechStack
+from .github_webhook_event import GitHubWebhookEvent
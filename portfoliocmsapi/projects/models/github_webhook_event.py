@@ -0,0 +1,21 @@
+from django.db import models
+
+
+class GitHubWebhookEvent(models.Model):
+    # Inbox of received GitHub webhook deliveries. Events are stored before they
+    # are applied, so a failed delivery can be retried or replayed later.
+    delivery_id = models.CharField(max_length=64, unique=True)
+    event = models.CharField(max_length=50)
+    action = models.CharField(max_length=50, blank=True, default="")
+    payload = models.JSONField()
+    received_at = models.DateTimeField(auto_now_add=True)
+    processed_at = models.DateTimeField(blank=True, null=True)
+    error = models.TextField(blank=True, default="")
+
+    def __str__(self):
+        return f"{self.event} ({self.delivery_id})"
+
+    class Meta:
+        verbose_name = "GitHub webhook event"
+        verbose_name_plural = "GitHub webhook events"
+        ordering = ["-received_at"]  # newest first
@@ -2,6 +2,7 @@ from django.db import models
 from django.contrib.auth.models import User
 from .tag import Tag
 from .tech_stack import TechStack
+from ...utils.github import parse_github_repo_url
 
 
 class Project(models.Model):
@@ -26,6 +27,27 @@ class Project(models.Model):
     date_created = models.DateTimeField()
     last_update = models.DateTimeField()
 
+    # GitHub sync watermarks: what the last sync saw upstream, so unchanged
+    # repositories can be skipped without rewriting the project
+    github_updated_at = models.DateTimeField(blank=True, null=True)
+    github_pushed_at = models.DateTimeField(blank=True, null=True)
+    github_etag = models.CharField(max_length=255, blank=True, default="")
+    github_languages_etag = models.CharField(max_length=255, blank=True, default="")
+    last_synced_at = models.DateTimeField(blank=True, null=True)
+
+    # The newest updated_at/pushed_at applied from a webhook delivery. Kept apart
+    # from the sync watermarks, which only a full sync (languages included) may
+    # advance; deliveries older than either are skipped.
+    github_webhook_updated_at = models.DateTimeField(blank=True, null=True)
+    github_webhook_pushed_at = models.DateTimeField(blank=True, null=True)
+
+    # Canonical identity of the GitHub repository. The numeric id survives renames
+    # and transfers; owner and name are stored lowercased, since GitHub matches them
+    # case-insensitively. Both are unique, so lookups are a single index hit.
+    github_repo_id = models.BigIntegerField(blank=True, null=True, unique=True)
+    github_owner = models.CharField(max_length=100, blank=True, null=True)
+    github_name = models.CharField(max_length=100, blank=True, null=True)
+
     def __str__(self):
         return str(self.title)
 
@@ -33,3 +55,33 @@ class Project(models.Model):
         verbose_name = "project"
         verbose_name_plural = "projects"
         ordering = ["-date_created"]  # newest first
+        indexes = [
+            # Keyset pagination seeks on (date_created, id) in list order
+            models.Index(fields=["-date_created", "-id"], name="project_list_idx"),
+            # The same, for one user's projects
+            models.Index(
+                fields=["user", "-date_created", "-id"], name="project_user_list_idx"
+            ),
+        ]
+        constraints = [
+            models.UniqueConstraint(
+                fields=["github_owner", "github_name"],
+                name="unique_project_github_repository",
+            )
+        ]
+
+    @property
+    def github_repository(self) -> tuple[str, str]:
+        """
+        The (owner, name) of the project's repository, from the identity columns or,
+        until those are filled in, from repo_url.
+        """
+        if self.github_owner and self.github_name:
+            return self.github_owner, self.github_name
+        return parse_github_repo_url(self.repo_url)
+
+    def set_github_identity(self, owner: str, name: str, repo_id: int = None) -> None:
+        self.github_owner = owner.lower()
+        self.github_name = name.lower()
+        if repo_id is not None:
+            self.github_repo_id = repo_id
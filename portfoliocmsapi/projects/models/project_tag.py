@@ -6,6 +6,9 @@ from .tag import Tag
 class ProjectTag(models.Model):
     project = models.ForeignKey(Project, on_delete=models.CASCADE)
     tag = models.ForeignKey(Tag, on_delete=models.CASCADE)
+    # Created by the GitHub sync from a repository topic, and removed by it once
+    # the topic is dropped. Tags added in the CMS are never removed by a sync.
+    synced = models.BooleanField(default=False)
 
     def __str__(self):
         return f"{self.project.title} - {self.tag.name}"
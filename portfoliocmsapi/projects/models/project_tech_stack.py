@@ -7,9 +7,29 @@ class ProjectTechStack(models.Model):
     project = models.ForeignKey(Project, on_delete=models.CASCADE)
     tech_stack = models.ForeignKey(TechStack, on_delete=models.CASCADE)
 
+    # How much of the repository is written in this language, from GitHub's
+    # /languages byte counts. Links added by hand have no byte count until GitHub
+    # reports the language.
+    bytes = models.PositiveBigIntegerField(default=0)
+    percentage = models.DecimalField(max_digits=5, decimal_places=2, default=0)
+    # Created by the GitHub sync, which may remove the link again once GitHub stops
+    # reporting the language. Links added in the CMS are never removed by a sync.
+    synced = models.BooleanField(default=False)
+
     def __str__(self):
         return f"{self.project.title} - {self.tech_stack.name}"
 
     class Meta:
         verbose_name = "project tech stack"
         unique_together = ("project", "tech_stack")
+        ordering = ["-bytes"]  # largest share first
+        indexes = [
+            # A project's languages by size; the first row is its dominant language
+            models.Index(
+                fields=["project", "-bytes"], name="projecttechstack_size_idx"
+            ),
+            # Projects using a language, by how much of each project it makes up
+            models.Index(
+                fields=["tech_stack", "-percentage"], name="projecttechstack_share_idx"
+            ),
+        ]
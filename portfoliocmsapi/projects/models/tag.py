@@ -1,4 +1,5 @@
 from django.db import models
+from django.db.models.functions import Lower
 
 
 class Tag(models.Model):
@@ -11,3 +12,7 @@ class Tag(models.Model):
         verbose_name = "tag"
         verbose_name_plural = "tags"
         ordering = ["name"]  # alphabetical order
+        indexes = [
+            # Case-insensitive lookups by name, as done by the GitHub sync
+            models.Index(Lower("name"), name="tag_name_lower_idx")
+        ]
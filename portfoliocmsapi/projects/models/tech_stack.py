@@ -1,4 +1,5 @@
 from django.db import models
+from django.db.models.functions import Lower
 
 
 class TechStack(models.Model):
@@ -10,3 +11,7 @@ class TechStack(models.Model):
     class Meta:
         verbose_name = "tech stack"
         ordering = ["name"]  # alphabetical order
+        indexes = [
+            # Case-insensitive lookups by name, as done by the GitHub sync
+            models.Index(Lower("name"), name="techstack_name_lower_idx")
+        ]
@@ -1,4 +1,11 @@
 from .tag_serializer import TagSerializer
-from .tech_stack_serializer import TechStackSerializer
+from .tech_stack_serializer import (
+    TechStackSerializer,
+    ProjectLanguageSerializer,
+    LanguageStatsSerializer,
+)
 from .project_serializer import ProjectSerializer
-from .github_repository_serializer import GitHubRepositorySerializer
+from .github_repository_serializer import (
+    GitHubRepositorySerializer,
+    GitHubImportResultSerializer,
+)
@@ -13,3 +13,10 @@ class GitHubRepositorySerializer(serializers.Serializer):
     topics = serializers.ListField(child=serializers.CharField(), default=list)
     created_at = serializers.DateTimeField()
     updated_at = serializers.DateTimeField()
+
+
+class GitHubImportResultSerializer(serializers.Serializer):
+    repository = serializers.CharField()
+    status = serializers.CharField()
+    project = serializers.PrimaryKeyRelatedField(read_only=True)
+    error = serializers.CharField()
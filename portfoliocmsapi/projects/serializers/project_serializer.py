@@ -1,8 +1,10 @@
 from rest_framework import serializers
 from django.contrib.auth.models import User
-from ..models import Project
+from django.db.models import Prefetch
+from ..models import Project, ProjectTechStack
+from ...utils.github import parse_github_repo_url
 from .tag_serializer import TagSerializer
-from .tech_stack_serializer import TechStackSerializer
+from .tech_stack_serializer import TechStackSerializer, ProjectLanguageSerializer
 
 
 class ProjectSerializer(serializers.ModelSerializer):
@@ -11,6 +13,10 @@ class ProjectSerializer(serializers.ModelSerializer):
     )
     tag = TagSerializer(many=True, read_only=True)
     tech_stack = TechStackSerializer(many=True, read_only=True)
+    languages = ProjectLanguageSerializer(
+        source="projecttechstack_set", many=True, read_only=True
+    )
+    primary_language = serializers.SerializerMethodField()
 
     class Meta:
         model = Project
@@ -22,6 +28,8 @@ class ProjectSerializer(serializers.ModelSerializer):
             "status",
             "tag",
             "tech_stack",
+            "languages",
+            "primary_language",
             "repo_url",
             "deploy_url",
             "date_created",
@@ -33,6 +41,67 @@ class ProjectSerializer(serializers.ModelSerializer):
             "last_update": {"read_only": False, "required": True},
         }
 
+    @staticmethod
+    def setup_eager_loading(queryset):
+        """
+        Loads everything the serializer reads in a fixed number of queries, however
+        many projects there are: the user is joined, tags, tech stack and weighted
+        languages are prefetched, and only the serialized columns are selected.
+        """
+        return (
+            queryset.select_related("user")
+            .only(
+                "user",
+                "title",
+                "description",
+                "status",
+                "repo_url",
+                "deploy_url",
+                "date_created",
+                "last_update",
+                "user__first_name",
+                "user__last_name",
+            )
+            .prefetch_related(
+                "tag",
+                "tech_stack",
+                Prefetch(
+                    "projecttechstack_set",
+                    queryset=ProjectTechStack.objects.select_related("tech_stack").only(
+                        "project",
+                        "tech_stack",
+                        "bytes",
+                        "percentage",
+                        "tech_stack__name",
+                    ),
+                ),
+            )
+        )
+
+    def validate_repo_url(self, value):
+        try:
+            owner, name = parse_github_repo_url(value)
+        except ValueError:
+            return value
+
+        duplicates = Project.objects.filter(
+            github_owner=owner.lower(), github_name=name.lower()
+        )
+        if self.instance is not None:
+            duplicates = duplicates.exclude(pk=self.instance.pk)
+        if duplicates.exists():
+            raise serializers.ValidationError(
+                f"A project already exists for {owner}/{name}"
+            )
+        return value
+
+    def get_primary_language(self, instance):
+        # Annotated by ProjectViewSet; otherwise the largest of the project's links
+        if hasattr(instance, "primary_language"):
+            return instance.primary_language or None
+        largest = next(iter(instance.projecttechstack_set.all()), None)
+        return largest.tech_stack.name if largest and largest.bytes else None
+
     def to_representation(self, instance):
         ret = super().to_representation(instance)
         ret["user"] = {
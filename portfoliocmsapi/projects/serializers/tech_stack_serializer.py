@@ -1,5 +1,6 @@
 from rest_framework import serializers
 from ..models.tech_stack import TechStack
+from ..models.project_tech_stack import ProjectTechStack
 
 
 class TechStackSerializer(serializers.ModelSerializer):
@@ -7,3 +8,21 @@ class TechStackSerializer(serializers.ModelSerializer):
     class Meta:
         model = TechStack
         fields = ["id", "name"]
+
+
+class ProjectLanguageSerializer(serializers.ModelSerializer):
+    id = serializers.IntegerField(source="tech_stack_id", read_only=True)
+    name = serializers.CharField(source="tech_stack.name", read_only=True)
+
+    class Meta:
+        model = ProjectTechStack
+        fields = ["id", "name", "bytes", "percentage"]
+
+
+class LanguageStatsSerializer(serializers.Serializer):
+    id = serializers.IntegerField()
+    name = serializers.CharField()
+    bytes = serializers.IntegerField()
+    percentage = serializers.DecimalField(max_digits=5, decimal_places=2)
+    projects = serializers.IntegerField()
+    primary_projects = serializers.IntegerField()
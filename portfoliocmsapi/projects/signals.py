@@ -0,0 +1,52 @@
+from django.contrib.auth.models import User
+from django.db.models.signals import m2m_changed, post_delete, post_save, pre_save
+from django.dispatch import receiver
+from .models import Project, ProjectTag, ProjectTechStack, Tag, TechStack
+from ..services.github.repository_cache import invalidate_project_repositories
+from ..utils.github import parse_github_repo_url
+from ..utils.response_cache import invalidate_cached_responses
+
+
+@receiver(pre_save, sender=Project)
+def set_github_identity(sender, instance, **kwargs):
+    # Until a sync has recorded the repository's numeric id, the identity columns
+    # follow repo_url; afterwards GitHub's answers keep them current
+    if instance.github_repo_id is not None:
+        return
+    try:
+        owner, name = parse_github_repo_url(instance.repo_url)
+    except ValueError:
+        return
+    owner, name = owner.lower(), name.lower()
+    if (instance.github_owner, instance.github_name) == (owner, name):
+        return
+
+    # Another project already holds the repository: one of the duplicates left
+    # unlinked by migration 0004. The API and the GitHub services refuse new
+    # duplicates before saving, so this project just stays unlinked.
+    holders = Project.objects.filter(github_owner=owner, github_name=name)
+    if instance.pk is not None:
+        holders = holders.exclude(pk=instance.pk)
+    if holders.exists():
+        instance.github_owner = instance.github_name = None
+        return
+    instance.set_github_identity(owner, name)
+
+
+@receiver(post_save, sender=Project)
+@receiver(post_delete, sender=Project)
+def invalidate_available_repositories(sender, **kwargs):
+    # The available-repositories listing hides repos that already have a project
+    invalidate_project_repositories()
+
+
+# Cached API responses read these models; any write makes them rebuild. Through rows
+# have no post_delete receiver, which would stop Django from deleting them in bulk:
+# they are removed through m2m_changed, by cascades from a model that has one, or by
+# the GitHub sync, which invalidates explicitly.
+for model in (Project, Tag, TechStack, User):
+    post_save.connect(invalidate_cached_responses, sender=model)
+    post_delete.connect(invalidate_cached_responses, sender=model)
+for through_model in (ProjectTag, ProjectTechStack):
+    post_save.connect(invalidate_cached_responses, sender=through_model)
+    m2m_changed.connect(invalidate_cached_responses, sender=through_model)
@@ -0,0 +1,57 @@
+import requests
+from django.contrib.auth.models import User
+from portfoliocmsapi.jobs.queue import task
+from portfoliocmsapi.services.github import (
+    GitHubRequestError,
+    GitHubSyncService,
+    get_github_client,
+)
+from portfoliocmsapi.utils import parse_github_repo_url
+from .models import Project
+from .serializers import GitHubImportResultSerializer
+
+
+def _sync_service() -> GitHubSyncService:
+    github_client = get_github_client()
+    github_client.verify_token()
+    return GitHubSyncService(github_client=github_client)
+
+
+def _is_transient(error: Exception) -> bool:
+    # Network failures, rate limits and GitHub outages may clear up; a missing
+    # project or user, an invalid URL or an existing project won't
+    if isinstance(error, GitHubRequestError):
+        return error.transient
+    return isinstance(error, requests.exceptions.RequestException)
+
+
+@task("github.create_project", retry_on=_is_transient)
+def create_project(payload: dict) -> dict:
+    """
+    Creates a project from a GitHub repository in the background.
+    """
+    owner, repo_name = parse_github_repo_url(payload["repo_url"])
+    user = User.objects.get(id=payload["user_id"])
+
+    project = _sync_service().create_project(owner, repo_name, user)
+    return {"project_id": project.id}
+
+
+@task("github.sync_project", retry_on=_is_transient)
+def sync_project(payload: dict) -> dict:
+    """
+    Syncs an existing project with its GitHub repository in the background.
+    """
+    project = Project.objects.get(id=payload["project_id"])
+    _sync_service().refresh_project(project, force=payload.get("force", False))
+    return {"project_id": project.id}
+
+
+@task("github.import_repositories", retry_on=_is_transient)
+def import_repositories(payload: dict) -> dict:
+    """
+    Imports many GitHub repositories as projects in the background.
+    """
+    user = User.objects.get(id=payload["user_id"])
+    results = _sync_service().import_repositories(payload["repositories"], user)
+    return {"results": GitHubImportResultSerializer(results, many=True).data}
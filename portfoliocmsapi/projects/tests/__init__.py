@@ -1 +1,10 @@
 from .test_views import TestProjectViewSetGitHub
+from .test_commands import TestSyncGitHubCommand
+from .test_webhooks import TestGitHubWebhookView
+from .test_benchmark import TestBenchmarkGitHubSyncCommand
+from .test_languages import TestProjectLanguages
+from .test_query_budget import TestQueryBudgets
+from .test_pagination import TestKeysetPagination
+from .test_explain_queries import TestExplainQueriesCommand
+from .test_response_cache import TestResponseCache
+from .test_conditional_get import TestConditionalGet
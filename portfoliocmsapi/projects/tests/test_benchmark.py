@@ -0,0 +1,79 @@
+import json
+import tempfile
+from io import StringIO
+from pathlib import Path
+from django.contrib.auth.models import User
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from django.test import TestCase
+from portfoliocmsapi.projects.models import Project
+from portfoliocmsapi.services.github.benchmark import compare_to_baseline
+
+
+class TestBenchmarkGitHubSyncCommand(TestCase):
+    def setUp(self):
+        self.directory = Path(tempfile.mkdtemp())
+        self.output = self.directory / "results.json"
+
+    def run_benchmark(self, *args):
+        out = StringIO()
+        call_command(
+            "benchmark_github_sync",
+            "--sizes",
+            "3",
+            "--output",
+            str(self.output),
+            *args,
+            stdout=out,
+        )
+        return out.getvalue()
+
+    def test_writes_results(self):
+        """Tests that every scenario is measured and the database is left untouched"""
+        output = self.run_benchmark()
+
+        results = json.loads(self.output.read_text())
+        scenarios = results["3"]
+        assert set(scenarios) == {
+            "create_project",
+            "sync_project_unchanged",
+            "sync_project_changed",
+            "bulk_sync_rest_changed",
+            "bulk_sync_rest_unchanged",
+            "bulk_sync_graphql_changed",
+        }
+        assert scenarios["create_project"]["quota_used"] == 6
+        assert scenarios["sync_project_unchanged"]["quota_used"] == 0
+        assert scenarios["bulk_sync_graphql_changed"]["upstream_requests"] == 1
+        assert "create_project" in output
+        assert not Project.objects.exists()
+        assert not User.objects.exists()
+
+    def test_fails_on_regression(self):
+        """Tests that exceeding the baseline makes the command fail"""
+        self.run_benchmark()
+        results = json.loads(self.output.read_text())
+        results["3"]["create_project"]["queries"] = 1
+        baseline = self.directory / "baseline.json"
+        baseline.write_text(json.dumps(results))
+
+        with self.assertRaises(CommandError) as raised:
+            self.run_benchmark("--baseline", str(baseline))
+
+        assert "create_project: queries" in str(raised.exception)
+
+    def test_compare_to_baseline_tolerances(self):
+        """Tests that counts and timings are held to their own tolerances"""
+        baseline = {"10": {"bulk": {"queries": 100, "wall_seconds": 1.0}}}
+
+        assert not compare_to_baseline(
+            {"10": {"bulk": {"queries": 110, "wall_seconds": 1.5}}}, baseline
+        )
+        assert (
+            len(
+                compare_to_baseline(
+                    {"10": {"bulk": {"queries": 111, "wall_seconds": 1.6}}}, baseline
+                )
+            )
+            == 2
+        )
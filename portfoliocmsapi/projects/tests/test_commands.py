@@ -0,0 +1,87 @@
+from io import StringIO
+from django.contrib.auth.models import User
+from django.core.management import call_command
+from django.test import TestCase
+from unittest.mock import Mock, patch
+from portfoliocmsapi.projects.models import Project
+
+
+class TestSyncGitHubCommand(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(username="testuser", password="testpass")
+        self.github_client = Mock()
+        # The sync service asks for conditional fetches; answer them with the
+        # plain mocks so tests can keep configuring get_repository_details etc.
+        self.github_client.get_repository_details_if_changed.side_effect = (
+            lambda owner, repo, etag=None: (
+                self.github_client.get_repository_details(owner, repo),
+                None,
+            )
+        )
+        self.github_client.get_repository_languages_if_changed.side_effect = (
+            lambda owner, repo, etag=None: (
+                self.github_client.get_repository_languages(owner, repo),
+                None,
+            )
+        )
+        # No GraphQL batch results, so bulk syncs fall back to the REST mocks
+        self.github_client.get_repositories_batch.return_value = {}
+        self.github_client.get_repository_languages.return_value = {"Python": 100}
+        self.github_client.rate_limit_metrics.return_value = {
+            "limit": 5000,
+            "remaining": 4990,
+            "throttled_requests": 0,
+            "total_wait": 0.0,
+        }
+        self.github_client.transport_metrics.return_value = {
+            "requests": 6,
+            "failures": 0,
+            "average_seconds": 0.1,
+            "max_seconds": 0.2,
+            "bytes_received": 4096,
+        }
+        self.github_client.get_repository_details.side_effect = lambda owner, repo: {
+            "name": repo,
+            "description": f"{repo} from GitHub",
+            "html_url": f"https://github.com/{owner}/{repo}",
+            "updated_at": "2024-01-05T00:00:00Z",
+            "topics": [],
+        }
+
+        for owner, repo in [
+            ("testuser", "repo1"),
+            ("testuser", "repo2"),
+            ("other", "repo3"),
+        ]:
+            Project.objects.create(
+                user=self.user,
+                title="Old Title",
+                description="Old description",
+                repo_url=f"https://github.com/{owner}/{repo}",
+                date_created="2024-01-01T00:00:00Z",
+                last_update="2024-01-02T00:00:00Z",
+            )
+
+    def test_sync_github_filters_and_reports(self):
+        out = StringIO()
+        with patch(
+            "portfoliocmsapi.projects.management.commands.sync_github.get_github_client",
+            return_value=self.github_client,
+        ):
+            call_command(
+                "sync_github", "--owner", "testuser", "--workers", "2", stdout=out
+            )
+
+        output = out.getvalue()
+        assert "testuser/repo1: synced in" in output
+        assert "testuser/repo2: synced in" in output
+        assert "Synced 2 of 2 projects" in output
+        assert "GitHub quota: 4990/5000 remaining" in output
+
+        synced_titles = set(
+            Project.objects.filter(repo_url__contains="testuser").values_list(
+                "title", flat=True
+            )
+        )
+        assert synced_titles == {"repo1", "repo2"}
+        assert Project.objects.get(repo_url__contains="other").title == "Old Title"
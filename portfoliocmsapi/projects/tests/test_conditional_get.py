@@ -0,0 +1,121 @@
+from unittest.mock import Mock, patch
+from django.contrib.auth.models import User
+from django.db import connection
+from django.test import override_settings
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APITestCase
+from portfoliocmsapi.blog.models import Post
+from portfoliocmsapi.projects.models import Project, Tag
+from portfoliocmsapi.projects.serializers import ProjectSerializer
+
+
+# Off, so a 200 always reaches the database and a 304 is the only way to skip it
+@override_settings(API_RESPONSE_CACHE={"ENABLED": False})
+class TestConditionalGet(APITestCase):
+    def setUp(self):
+        # One clock for the write times in the generation tokens and for "now"
+        self.clock = Mock()
+        self.clock.time.return_value = 1_700_000_000.5
+        for module in ("conditional_get", "response_cache"):
+            clock = patch(f"portfoliocmsapi.utils.{module}.time", self.clock)
+            clock.start()
+            self.addCleanup(clock.stop)
+
+        self.user = User.objects.create_user(username="testuser", password="testpass")
+        self.project = Project.objects.create(
+            user=self.user,
+            title="Project",
+            description="Test project",
+            repo_url="https://github.com/testuser/project",
+            date_created="2024-01-01T00:00:00Z",
+            last_update="2024-01-02T00:00:00Z",
+        )
+        self.post = Post.objects.create(
+            user=self.user,
+            title="Post",
+            content="Test post",
+            date_created="2024-01-01T00:00:00Z",
+            last_update="2024-01-02T00:00:00Z",
+        )
+        # Generations are created on first read; once they and every write so far
+        # lie in the past, Last-Modified is sent
+        self.client.get("/api/projects")
+        self.client.get("/api/posts")
+        self.clock.time.return_value += 5
+
+    def get(self, url, **headers):
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(url, headers=headers)
+        return response, len(queries)
+
+    def test_responses_carry_validators(self):
+        for url in (
+            "/api/projects",
+            f"/api/projects/{self.project.id}",
+            "/api/posts",
+            f"/api/posts/{self.post.id}",
+        ):
+            response, _ = self.get(url)
+            assert response.status_code == 200
+            assert response.headers["ETag"].startswith('W/"')
+            assert "Last-Modified" in response.headers
+            assert "no-cache" in response.headers["Cache-Control"]
+
+    def test_matching_etag_returns_304_without_serializing(self):
+        etag = self.get("/api/projects")[0].headers["ETag"]
+
+        with patch.object(ProjectSerializer, "to_representation") as serialize:
+            response, queries = self.get("/api/projects", if_none_match=etag)
+
+        assert response.status_code == 304
+        assert response.headers["ETag"] == etag
+        assert not response.content
+        assert queries == 0
+        serialize.assert_not_called()
+
+    def test_writes_change_the_etag(self):
+        etag = self.get("/api/projects")[0].headers["ETag"]
+        self.project.tag.add(Tag.objects.create(name="Django"))
+
+        response, _ = self.get("/api/projects", if_none_match=etag)
+        assert response.status_code == 200
+        assert response.headers["ETag"] != etag
+        assert response.json()["results"][0]["tag"][0]["name"] == "Django"
+
+    def test_etag_depends_on_the_url(self):
+        etag = self.get("/api/projects")[0].headers["ETag"]
+
+        response, _ = self.get("/api/projects?page_size=1", if_none_match=etag)
+        assert response.status_code == 200
+
+    def test_if_modified_since(self):
+        last_modified = self.get(f"/api/posts/{self.post.id}")[0].headers[
+            "Last-Modified"
+        ]
+        response, queries = self.get(
+            f"/api/posts/{self.post.id}", if_modified_since=last_modified
+        )
+        assert response.status_code == 304
+        assert queries == 0
+
+        self.clock.time.return_value += 1
+        self.post.title = "Renamed"
+        self.post.save()
+        self.clock.time.return_value += 5
+        response, _ = self.get(
+            f"/api/posts/{self.post.id}", if_modified_since=last_modified
+        )
+        assert response.status_code == 200
+        assert response.json()["title"] == "Renamed"
+
+    def test_last_modified_waits_for_the_current_second_to_pass(self):
+        self.project.save()
+
+        response, _ = self.get("/api/projects")
+        assert "Last-Modified" not in response.headers
+        assert "ETag" in response.headers
+
+    def test_errors_carry_no_validators(self):
+        response, _ = self.get("/api/projects/999999")
+        assert response.status_code == 404
+        assert "ETag" not in response.headers
@@ -0,0 +1,60 @@
+from io import StringIO
+from django.contrib.auth.models import User
+from django.core.management import call_command
+from django.test import TestCase
+from portfoliocmsapi.blog.models import Post
+from portfoliocmsapi.projects.models import Project, Tag, TechStack
+from portfoliocmsapi.utils.query_plans import check_query_plans, full_scans
+
+
+class TestExplainQueriesCommand(TestCase):
+    def setUp(self):
+        user = User.objects.create_user(username="testuser", password="testpass")
+        project = Project.objects.create(
+            user=user,
+            title="Project",
+            description="Test project",
+            repo_url="https://github.com/testuser/project",
+            date_created="2024-01-01T00:00:00Z",
+            last_update="2024-01-02T00:00:00Z",
+        )
+        project.tag.add(Tag.objects.create(name="Django"))
+        project.tech_stack.add(TechStack.objects.create(name="Python"))
+        post = Post.objects.create(
+            user=user,
+            title="Post",
+            content="Test post",
+            date_created="2024-01-01T00:00:00Z",
+            last_update="2024-01-02T00:00:00Z",
+        )
+        post.project.add(project)
+
+    def test_endpoint_queries_use_indexes(self):
+        out = StringIO()
+
+        call_command("explain_queries", stdout=out)
+
+        assert "use an index" in out.getvalue()
+
+    def test_full_scans_are_flagged(self):
+        results = check_query_plans(
+            {
+                "unindexed": lambda: list(Project.objects.filter(title="Project")),
+                "unordered": lambda: list(Project.objects.order_by()),
+            }
+        )
+
+        assert [result["full_scans"] for result in results] == [
+            ["projects_project"],
+            ["projects_project"],
+        ]
+
+    def test_limited_index_scans_are_not_flagged(self):
+        plan = [
+            "SCAN projects_project USING INDEX project_list_idx",
+            "SEARCH auth_user USING INTEGER PRIMARY KEY (rowid=?)",
+        ]
+
+        assert full_scans(plan, "SELECT ... LIMIT 51") == []
+        assert full_scans(plan, "SELECT ...") == ["projects_project"]
+        assert full_scans(["SCAN blog_post"], "SELECT ... LIMIT 51") == ["blog_post"]
@@ -0,0 +1,125 @@
+from django.contrib.auth.models import User
+from rest_framework.test import APITestCase
+from portfoliocmsapi.projects.models import Project, ProjectTechStack, TechStack
+
+
+class TestProjectLanguages(APITestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(username="testuser", password="testpass")
+        self.other_user = User.objects.create_user(username="other", password="pass")
+        self.python = TechStack.objects.create(name="Python")
+        self.javascript = TechStack.objects.create(name="JavaScript")
+        self.html = TechStack.objects.create(name="HTML")
+
+        self.api = self.create_project(
+            self.user, "api", {self.python: 8000, self.html: 2000}
+        )
+        self.frontend = self.create_project(
+            self.user, "frontend", {self.javascript: 6000, self.html: 4000}
+        )
+        self.scripts = self.create_project(
+            self.other_user, "scripts", {self.python: 5000}
+        )
+        # Linked by hand, so there are no byte counts
+        self.manual = self.create_project(self.user, "manual", {self.javascript: 0})
+
+    def create_project(self, user, name, languages):
+        project = Project.objects.create(
+            user=user,
+            title=name,
+            description="Test project",
+            repo_url=f"https://github.com/{user.username}/{name}",
+            date_created="2024-01-01T00:00:00Z",
+            last_update="2024-01-02T00:00:00Z",
+        )
+        total = sum(languages.values())
+        ProjectTechStack.objects.bulk_create(
+            ProjectTechStack(
+                project=project,
+                tech_stack=language,
+                bytes=size,
+                percentage=round(size * 100 / total, 2) if total else 0,
+            )
+            for language, size in languages.items()
+        )
+        return project
+
+    def test_project_lists_weighted_languages(self):
+        response = self.client.get(f"/api/projects/{self.frontend.id}")
+
+        assert response.status_code == 200
+        assert response.json()["primary_language"] == "JavaScript"
+        assert response.json()["languages"] == [
+            {
+                "id": self.javascript.id,
+                "name": "JavaScript",
+                "bytes": 6000,
+                "percentage": "60.00",
+            },
+            {"id": self.html.id, "name": "HTML", "bytes": 4000, "percentage": "40.00"},
+        ]
+
+    def test_filter_and_order_by_primary_language(self):
+        response = self.client.get("/api/projects?language=python")
+
+        assert response.status_code == 200
+        assert {project["title"] for project in response.json()["results"]} == {
+            "api",
+            "scripts",
+        }
+
+        response = self.client.get("/api/projects?ordering=-primary_language_share")
+
+        titles = [project["title"] for project in response.json()["results"]]
+        assert titles[:3] == ["scripts", "api", "frontend"]
+
+    def test_unknown_ordering_is_rejected(self):
+        response = self.client.get("/api/projects?ordering=password")
+
+        assert response.status_code == 400
+
+    def test_language_stats(self):
+        with self.assertNumQueries(2):
+            response = self.client.get("/api/tech_stack/stats")
+
+        assert response.status_code == 200
+        assert response.json() == [
+            {
+                "id": self.python.id,
+                "name": "Python",
+                "bytes": 13000,
+                "percentage": "52.00",
+                "projects": 2,
+                "primary_projects": 2,
+            },
+            {
+                "id": self.html.id,
+                "name": "HTML",
+                "bytes": 6000,
+                "percentage": "24.00",
+                "projects": 2,
+                "primary_projects": 0,
+            },
+            {
+                "id": self.javascript.id,
+                "name": "JavaScript",
+                "bytes": 6000,
+                "percentage": "24.00",
+                "projects": 1,
+                "primary_projects": 1,
+            },
+        ]
+
+    def test_language_stats_for_one_user(self):
+        response = self.client.get(f"/api/tech_stack/stats?user={self.other_user.id}")
+
+        assert response.json() == [
+            {
+                "id": self.python.id,
+                "name": "Python",
+                "bytes": 5000,
+                "percentage": "100.00",
+                "projects": 1,
+                "primary_projects": 1,
+            }
+        ]
@@ -0,0 +1,122 @@
+from django.contrib.auth.models import User
+from django.db import connection
+from django.test import override_settings
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APITestCase
+from portfoliocmsapi.blog.models import Post
+from portfoliocmsapi.projects.models import Project, ProjectTechStack, TechStack
+
+
+@override_settings(PAGINATION={"PAGE_SIZE": 3, "MAX_PAGE_SIZE": 5})
+class TestKeysetPagination(APITestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(username="testuser", password="testpass")
+        # Pairs of projects share a date_created, so pages have to break ties by id
+        self.projects = [
+            self.create_project(index, f"2024-01-{10 - index // 2:02d}T00:00:00Z")
+            for index in range(10)
+        ]
+
+    def create_project(self, index, date_created):
+        return Project.objects.create(
+            user=self.user,
+            title=f"Project {index}",
+            description="Test project",
+            repo_url=f"https://github.com/testuser/project-{index}",
+            date_created=date_created,
+            last_update=date_created,
+        )
+
+    def walk(self, url):
+        pages = []
+        while url:
+            response = self.client.get(url)
+            assert response.status_code == 200
+            pages.append([row["id"] for row in response.json()["results"]])
+            url = response.json()["next"]
+        return pages
+
+    def test_pages_follow_list_order_without_gaps(self):
+        pages = self.walk("/api/projects")
+
+        expected = list(
+            Project.objects.order_by("-date_created", "-id").values_list(
+                "id", flat=True
+            )
+        )
+        assert [len(page) for page in pages] == [3, 3, 3, 1]
+        assert [row for page in pages for row in page] == expected
+
+    def test_pages_are_stable_while_rows_are_inserted(self):
+        expected = list(
+            Project.objects.order_by("-date_created", "-id").values_list(
+                "id", flat=True
+            )[3:6]
+        )
+        first = self.client.get("/api/projects").json()
+
+        # A new project at the top of the list doesn't shift the next page
+        self.create_project(99, "2025-01-01T00:00:00Z")
+        second = self.client.get(first["next"]).json()
+
+        assert [row["id"] for row in second["results"]] == expected
+
+    def test_previous_link_returns_the_page_before(self):
+        first = self.client.get("/api/projects").json()
+        second = self.client.get(first["next"]).json()
+        assert first["previous"] is None
+
+        back = self.client.get(second["previous"]).json()
+
+        assert back["results"] == first["results"]
+        assert back["previous"] is None
+        assert back["next"] is not None
+
+    def test_page_size_is_limited(self):
+        response = self.client.get("/api/projects?page_size=100")
+
+        assert len(response.json()["results"]) == 5
+
+    def test_no_count_query(self):
+        with CaptureQueriesContext(connection) as queries:
+            self.client.get("/api/projects")
+
+        assert not any("COUNT(" in query["sql"].upper() for query in queries)
+
+    def test_invalid_cursor(self):
+        response = self.client.get("/api/projects?cursor=not-a-cursor")
+
+        assert response.status_code == 404
+
+    def test_custom_ordering_is_paged(self):
+        languages = [TechStack.objects.create(name=name) for name in ("A", "B")]
+        for index, project in enumerate(self.projects[:4]):
+            ProjectTechStack.objects.create(
+                project=project,
+                tech_stack=languages[index % 2],
+                bytes=100,
+                percentage=25 * (index + 1),
+            )
+
+        pages = self.walk("/api/projects?ordering=-primary_language_share")
+
+        rows = [row for page in pages for row in page]
+        assert len(rows) == len(set(rows)) == 10
+        assert rows[:4] == [project.id for project in reversed(self.projects[:4])]
+
+    def test_posts_are_paged(self):
+        for index in range(4):
+            Post.objects.create(
+                user=self.user,
+                title=f"Post {index}",
+                content="Test post",
+                date_created="2024-01-01T00:00:00.123456Z",
+                last_update="2024-01-01T00:00:00Z",
+            )
+
+        pages = self.walk("/api/posts")
+
+        assert [len(page) for page in pages] == [3, 1]
+        assert sorted(row for page in pages for row in page) == sorted(
+            Post.objects.values_list("id", flat=True)
+        )
@@ -0,0 +1,111 @@
+from django.contrib.auth.models import User
+from django.db import connection
+from django.test import override_settings
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APITestCase
+from portfoliocmsapi.blog.models import Post
+from portfoliocmsapi.projects.models import Project, ProjectTechStack, Tag, TechStack
+
+
+@override_settings(API_RESPONSE_CACHE={"ENABLED": False})
+class TestQueryBudgets(APITestCase):
+    """
+    Every list endpoint has to cost the same number of queries whether it returns a
+    few rows or many; a query count that grows with the rows is an N+1. The response
+    cache is off, so every request reaches the database.
+    """
+
+    def setUp(self):
+        self.user = User.objects.create_user(
+            username="testuser", password="testpass", first_name="Test"
+        )
+        self.client.force_authenticate(user=self.user)
+        self.tags = [Tag.objects.create(name=f"Tag {i}") for i in range(3)]
+        self.tech_stack = [TechStack.objects.create(name=f"Lang {i}") for i in range(3)]
+        self.rows = 0
+
+    def add_rows(self, count):
+        """
+        Adds count projects and count posts, each linked to tags, tech stack and
+        (for posts) projects.
+        """
+        for _ in range(count):
+            self.rows += 1
+            project = Project.objects.create(
+                user=self.user,
+                title=f"Project {self.rows}",
+                description="Test project",
+                repo_url=f"https://github.com/testuser/project-{self.rows}",
+                date_created="2024-01-01T00:00:00Z",
+                last_update="2024-01-02T00:00:00Z",
+            )
+            project.tag.add(*self.tags)
+            ProjectTechStack.objects.bulk_create(
+                ProjectTechStack(project=project, tech_stack=language, bytes=100)
+                for language in self.tech_stack
+            )
+            post = Post.objects.create(
+                user=self.user,
+                title=f"Post {self.rows}",
+                content="Test post",
+                date_created="2024-01-01T00:00:00Z",
+                last_update="2024-01-02T00:00:00Z",
+            )
+            post.project.add(project)
+            post.tag.add(*self.tags)
+            post.tech_stack.add(*self.tech_stack)
+
+    def count_queries(self, url):
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(url)
+        assert response.status_code == 200
+        return len(queries)
+
+    def assert_constant_queries(self, url, budget):
+        """
+        Asserts url costs the same queries for 2 rows as for 20, and no more than
+        budget.
+        """
+        self.add_rows(2)
+        few = self.count_queries(url)
+        self.add_rows(18)
+        many = self.count_queries(url)
+
+        assert few == many, f"{url}: {few} queries for 2 rows, {many} for 20"
+        assert many <= budget, f"{url}: {many} queries, budget is {budget}"
+
+    def test_project_list(self):
+        # projects + tags + tech stack + weighted languages
+        self.assert_constant_queries("/api/projects", budget=4)
+
+    def test_filtered_project_list(self):
+        self.assert_constant_queries(
+            "/api/projects?language=lang%200&ordering=-primary_language_share",
+            budget=4,
+        )
+
+    def test_project_detail(self):
+        self.add_rows(1)
+        project = Project.objects.get()
+
+        assert self.count_queries(f"/api/projects/{project.id}") <= 4
+
+    def test_post_list(self):
+        # posts + projects + tags + tech stack
+        self.assert_constant_queries("/api/posts", budget=4)
+
+    def test_post_detail(self):
+        self.add_rows(1)
+        post = Post.objects.get()
+
+        assert self.count_queries(f"/api/posts/{post.id}") <= 4
+
+    def test_tag_and_tech_stack_lists(self):
+        self.assert_constant_queries("/api/tags", budget=1)
+        self.assert_constant_queries("/api/tech_stack", budget=1)
+
+    def test_language_stats(self):
+        self.assert_constant_queries("/api/tech_stack/stats", budget=2)
+
+    def test_media_list(self):
+        self.assert_constant_queries("/api/media", budget=1)
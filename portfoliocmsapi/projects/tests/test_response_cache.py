@@ -0,0 +1,207 @@
+import os
+import subprocess
+import sys
+import tempfile
+from unittest.mock import Mock
+from django.conf import settings
+from django.contrib.auth.models import User
+from django.core.cache import caches
+from django.db import connection
+from django.test import override_settings
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APITestCase
+from portfoliocmsapi.blog.models import Post
+from portfoliocmsapi.projects.models import Project, ProjectTechStack, Tag, TechStack
+from portfoliocmsapi.services.github.sync import GitHubSyncService
+
+
+class TestResponseCache(APITestCase):
+    """
+    Read-only responses are served from the cache until a write to a model they
+    read, whichever way the write is made.
+    """
+
+    def setUp(self):
+        self.user = User.objects.create_user(
+            username="testuser", password="testpass", first_name="Test"
+        )
+        self.project = self.create_project("Project 1")
+
+    def create_project(self, title):
+        return Project.objects.create(
+            user=self.user,
+            title=title,
+            description="Test project",
+            repo_url=f"https://github.com/testuser/{title.replace(' ', '-')}",
+            date_created="2024-01-01T00:00:00Z",
+            last_update="2024-01-02T00:00:00Z",
+        )
+
+    def get(self, url):
+        """
+        Returns the response data and the number of queries the request made.
+        """
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(url)
+        assert response.status_code == 200
+        return response.json(), len(queries)
+
+    def project_titles(self):
+        data, _ = self.get("/api/projects")
+        return [project["title"] for project in data["results"]]
+
+    def test_repeated_reads_skip_the_database(self):
+        first, _ = self.get("/api/projects")
+        second, queries = self.get("/api/projects")
+
+        assert second == first
+        assert queries == 0
+
+    def test_query_string_is_part_of_the_key(self):
+        self.create_project("Project 2")
+        self.get("/api/projects?page_size=1")
+
+        data, queries = self.get("/api/projects?page_size=2")
+        assert queries > 0
+        assert len(data["results"]) == 2
+
+    def test_saves_and_deletes_invalidate(self):
+        self.project_titles()
+        self.project.title = "Renamed"
+        self.project.save()
+        assert self.project_titles() == ["Renamed"]
+
+        self.project.delete()
+        assert self.project_titles() == []
+
+    def test_related_writes_invalidate(self):
+        tag = Tag.objects.create(name="Django")
+        self.get("/api/projects")
+        self.get("/api/posts")
+        post = Post.objects.create(
+            user=self.user,
+            title="Post",
+            content="Test post",
+            date_created="2024-01-01T00:00:00Z",
+            last_update="2024-01-02T00:00:00Z",
+        )
+        self.get("/api/posts")
+
+        # m2m_changed on the through models
+        self.project.tag.add(tag)
+        post.project.add(self.project)
+        projects, _ = self.get("/api/projects")
+        posts, _ = self.get("/api/posts")
+        assert projects["results"][0]["tag"] == [{"id": tag.id, "name": "Django"}]
+        assert posts["results"][0]["project"] == [
+            {"id": self.project.id, "title": "Project 1"}
+        ]
+
+        # A renamed tag or user shows up in the responses that embed them
+        tag.name = "Flask"
+        tag.save()
+        self.user.first_name = "Renamed"
+        self.user.save()
+        projects, _ = self.get("/api/projects")
+        assert projects["results"][0]["tag"][0]["name"] == "Flask"
+        assert projects["results"][0]["user"]["full_name"] == "Renamed"
+
+    def test_writes_through_the_api_invalidate(self):
+        self.client.force_authenticate(user=self.user)
+        self.get("/api/tags")
+        response = self.client.post("/api/tags", {"name": "Django"}, format="json")
+        assert response.status_code == 201
+
+        data, _ = self.get("/api/tags")
+        assert [tag["name"] for tag in data] == ["Django"]
+
+    def test_bulk_writes_by_the_github_sync_invalidate(self):
+        github_client = Mock()
+        github_client.get_repository_languages_if_changed.return_value = (
+            {"Python": 3000, "Shell": 1000},
+            None,
+        )
+        self.get("/api/projects")
+        self.get("/api/tech_stack/stats")
+
+        # Languages are written with bulk_create/bulk_update, which send no signals
+        GitHubSyncService(github_client=github_client).sync_repository_languages(
+            self.project
+        )
+
+        projects, _ = self.get("/api/projects")
+        stats, _ = self.get("/api/tech_stack/stats")
+        assert projects["results"][0]["primary_language"] == "Python"
+        assert [row["name"] for row in stats] == ["Python", "Shell"]
+
+    def test_lost_generations_only_cause_misses(self):
+        self.get("/api/projects")
+        caches["api_responses"].clear()
+
+        _, queries = self.get("/api/projects")
+        assert queries > 0
+        _, queries = self.get("/api/projects")
+        assert queries == 0
+
+    def test_writes_in_another_process_invalidate(self):
+        with tempfile.TemporaryDirectory() as location:
+            backend = {
+                "BACKEND": "django.core.cache.backends.filebased.FileBasedCache",
+                "LOCATION": location,
+            }
+            with override_settings(
+                CACHES={**settings.CACHES, "api_responses": backend}
+            ):
+                self.get("/api/projects")
+
+                # Another worker saving a project bumps the generation in the
+                # shared cache
+                subprocess.run(
+                    [
+                        sys.executable,
+                        "-c",
+                        "import django; django.setup(); "
+                        "from portfoliocmsapi.projects.models import Project; "
+                        "from portfoliocmsapi.utils.response_cache "
+                        "import bump_generations; "
+                        "bump_generations(Project)",
+                    ],
+                    check=True,
+                    cwd=settings.BASE_DIR,
+                    env={
+                        **os.environ,
+                        "API_RESPONSE_CACHE_BACKEND": "file",
+                        "API_RESPONSE_CACHE_LOCATION": location,
+                    },
+                )
+
+                _, queries = self.get("/api/projects")
+                assert queries > 0
+
+    @override_settings(API_RESPONSE_CACHE={"ENABLED": False})
+    def test_can_be_disabled(self):
+        self.get("/api/projects")
+        _, queries = self.get("/api/projects")
+        assert queries > 0
+
+    def test_file_backend(self):
+        with tempfile.TemporaryDirectory() as location:
+            backend = {
+                "BACKEND": "django.core.cache.backends.filebased.FileBasedCache",
+                "LOCATION": location,
+            }
+            with override_settings(
+                CACHES={**settings.CACHES, "api_responses": backend}
+            ):
+                self.get("/api/projects")
+                _, queries = self.get("/api/projects")
+                assert queries == 0
+
+                ProjectTechStack.objects.create(
+                    project=self.project,
+                    tech_stack=TechStack.objects.create(name="Python"),
+                    bytes=100,
+                    percentage=100,
+                )
+                projects, _ = self.get("/api/projects")
+                assert projects["results"][0]["primary_language"] == "Python"
@@ -1,8 +1,16 @@
+import requests
 from django.contrib.auth.models import User
+from django.test import override_settings
 from rest_framework.test import APITestCase
 from unittest.mock import Mock, patch
+from portfoliocmsapi.jobs import queue
 from portfoliocmsapi.projects.models import Project
-from portfoliocmsapi.services.github import GitHubClient, GitHubSyncService
+from portfoliocmsapi.services.github import (
+    GitHubClient,
+    GitHubRequestError,
+    GitHubSyncService,
+)
+from portfoliocmsapi.services.github.repository_cache import reset_repository_caches
 
 
 class TestProjectViewSetGitHub(APITestCase):
@@ -10,6 +18,9 @@ class TestProjectViewSetGitHub(APITestCase):
         # Create a test user
         self.user = User.objects.create_user(username="testuser", password="testpass")
 
+        # Start every test without a repository snapshot or cached project repositories
+        reset_repository_caches()
+
         # Mock the GitHub client
         self.github_client = Mock(spec=GitHubClient)
         self.sync_service = GitHubSyncService(github_client=self.github_client)
@@ -36,6 +47,60 @@ class TestProjectViewSetGitHub(APITestCase):
             },
         ]
 
+    def test_project_crud_makes_no_github_requests(self):
+        """
+        Tests that plain project endpoints never touch the GitHub API.
+        """
+        Project.objects.create(
+            user=self.user,
+            title="Existing Project",
+            repo_url="https://github.com/testuser/repo1",
+            description="Test project",
+            date_created="2024-01-01T00:00:00Z",
+            last_update="2024-01-02T00:00:00Z",
+        )
+
+        with patch("requests.Session.get") as mock_get:
+            response = self.client.get("/api/projects")
+
+            assert response.status_code == 200
+            assert len(response.json()["results"]) == 1
+            mock_get.assert_not_called()
+
+    def test_duplicate_repository_projects_can_still_be_edited(self):
+        """
+        Tests that a project sharing its repository with an older one (left
+        unlinked by the identity backfill) stays unlinked instead of failing to save.
+        """
+        linked = Project.objects.create(
+            user=self.user,
+            title="Original",
+            repo_url="https://github.com/testuser/repo1",
+            description="Test project",
+            date_created="2024-01-01T00:00:00Z",
+            last_update="2024-01-02T00:00:00Z",
+        )
+        duplicate = Project.objects.create(
+            user=self.user,
+            title="Duplicate",
+            repo_url="https://github.com/TestUser/repo1.git",
+            description="Test project",
+            date_created="2024-01-01T00:00:00Z",
+            last_update="2024-01-02T00:00:00Z",
+        )
+        assert (duplicate.github_owner, duplicate.github_name) == (None, None)
+
+        response = self.client.patch(
+            f"/api/projects/{duplicate.id}", {"title": "Renamed"}, format="json"
+        )
+
+        assert response.status_code == 200
+        duplicate.refresh_from_db()
+        linked.refresh_from_db()
+        assert duplicate.title == "Renamed"
+        assert duplicate.github_owner is None
+        assert linked.github_repository == ("testuser", "repo1")
+
     def test_list_available_repositories(self):
         # Create a project for repo1 (so it shouldn't show up in available repos)
         Project.objects.create(
@@ -51,6 +116,8 @@ class TestProjectViewSetGitHub(APITestCase):
         with patch("requests.Session.get") as mock_get:
             mock_get.return_value.json.return_value = self.mock_repos
             mock_get.return_value.status_code = 200
+            mock_get.return_value.headers = {}
+            mock_get.return_value.links = {}
 
             response = self.client.get("/api/projects/github")
 
@@ -58,6 +125,67 @@ class TestProjectViewSetGitHub(APITestCase):
             assert len(response.json()) == 1  # Should only get repo2
             assert response.json()[0]["name"] == "repo2"
 
+    def test_available_repositories_are_cached(self):
+        """
+        Tests that the listing is served from the snapshot, while still reflecting
+        projects created since it was taken.
+        """
+        with patch("requests.Session.get") as mock_get:
+            mock_get.return_value.json.return_value = self.mock_repos
+            mock_get.return_value.status_code = 200
+            mock_get.return_value.headers = {}
+            mock_get.return_value.links = {}
+
+            response = self.client.get("/api/projects/github")
+            assert len(response.json()) == 2
+            calls = mock_get.call_count
+
+            Project.objects.create(
+                user=self.user,
+                title="Existing Project",
+                repo_url="https://github.com/testuser/repo1",
+                description="Test project",
+                date_created="2024-01-01T00:00:00Z",
+                last_update="2024-01-02T00:00:00Z",
+            )
+            response = self.client.get("/api/projects/github")
+
+            assert [repo["name"] for repo in response.json()] == ["repo2"]
+            assert mock_get.call_count == calls
+
+    def test_available_repositories_unavailable_without_snapshot(self):
+        """
+        Tests that the listing answers 503 while GitHub keeps failing and there is
+        no snapshot to fall back on.
+        """
+        with patch("requests.Session.get") as mock_get:
+            mock_get.side_effect = requests.exceptions.ConnectionError("down")
+
+            for _ in range(3):
+                response = self.client.get("/api/projects/github")
+                assert response.status_code == 503
+            mock_get.reset_mock()
+
+            # Once the circuit opens, GitHub isn't asked at all
+            response = self.client.get("/api/projects/github")
+
+            assert response.status_code == 503
+            mock_get.assert_not_called()
+
+    def test_available_repositories_unavailable_with_a_rejected_token(self):
+        self.github_client.verify_token.side_effect = GitHubRequestError(
+            "Invalid GitHub token or authentication failed: 401"
+        )
+
+        with patch(
+            "portfoliocmsapi.projects.views.project_viewset.get_github_client",
+            return_value=self.github_client,
+        ):
+            response = self.client.get("/api/projects/github")
+
+        assert response.status_code == 503
+        self.github_client.get_all_repositories.assert_not_called()
+
     def test_create_project_from_github(self):
         test_repo = self.mock_repos[0]
 
@@ -74,6 +202,8 @@ class TestProjectViewSetGitHub(APITestCase):
             def mock_response(*args, **kwargs):
                 mock = Mock()
                 mock.status_code = 200
+                mock.headers = {}
+                mock.links = {}
                 # Get the endpoint from the URL
                 url = args[0]
                 if "languages" in url:
@@ -105,6 +235,134 @@ class TestProjectViewSetGitHub(APITestCase):
             assert project.tech_stack.filter(name="Python").exists()
             assert project.tag.filter(name__in=["Django", "Api"]).count() == 2
 
+            # Each repository resource is fetched from GitHub exactly once
+            repo_calls = [
+                call.args[0]
+                for call in mock_get.call_args_list
+                if "/repos/" in call.args[0]
+            ]
+            assert sorted(repo_calls) == [
+                "https://api.github.com/repos/testuser/repo1",
+                "https://api.github.com/repos/testuser/repo1/languages",
+            ]
+
+    def test_create_project_rejects_invalid_urls(self):
+        self.client.force_authenticate(user=self.user)
+
+        with patch("requests.Session.get") as mock_get:
+            for url in (
+                "/api/projects/github/create",
+                "/api/projects/github/create?async=true",
+            ):
+                response = self.client.post(
+                    url, {"repo_url": "https://example.com/repo1"}, format="json"
+                )
+                assert response.status_code == 400
+            mock_get.assert_not_called()
+
+        assert not queue.claim("test-worker")
+
+    def test_github_failures_return_bad_gateway(self):
+        """
+        Tests that creating or syncing a project answers 502 when GitHub fails.
+        """
+        self.client.force_authenticate(user=self.user)
+        project = Project.objects.create(
+            user=self.user,
+            title="repo2",
+            description="Second test repo",
+            repo_url="https://github.com/testuser/repo2",
+            date_created="2024-01-01T00:00:00Z",
+            last_update="2024-01-02T00:00:00Z",
+        )
+
+        with patch("requests.Session.get") as mock_get:
+            mock_get.side_effect = requests.exceptions.ConnectionError("down")
+
+            response = self.client.post(
+                "/api/projects/github/create",
+                {"repo_url": self.mock_repos[0]["html_url"]},
+                format="json",
+            )
+            assert response.status_code == 502
+            assert not Project.objects.filter(title="repo1").exists()
+
+            response = self.client.put(f"/api/projects/{project.id}/sync")
+            assert response.status_code == 502
+
+    @override_settings(GITHUB_SYNC_GRAPHQL=False)
+    def test_import_repositories_from_github(self):
+        """
+        Tests importing several repositories in one request, each reported
+        separately.
+        """
+        existing = Project.objects.create(
+            user=self.user,
+            title="Existing Project",
+            repo_url="https://github.com/testuser/repo1",
+            description="Test project",
+            date_created="2024-01-01T00:00:00Z",
+            last_update="2024-01-02T00:00:00Z",
+        )
+        self.client.force_authenticate(user=self.user)
+
+        with patch("requests.Session.get") as mock_get:
+
+            def mock_response(*args, **kwargs):
+                mock = Mock()
+                mock.status_code = 200
+                mock.headers = {}
+                mock.links = {}
+                if args[0].endswith("/languages"):
+                    mock.json.return_value = {"JavaScript": 300, "CSS": 100}
+                else:
+                    mock.json.return_value = self.mock_repos[1]
+                return mock
+
+            mock_get.side_effect = mock_response
+
+            response = self.client.post(
+                "/api/projects/github/import",
+                {"repositories": ["testuser/repo1", "testuser/repo2"]},
+                format="json",
+            )
+
+        assert response.status_code == 201
+        created = Project.objects.get(title="repo2")
+        assert response.json()["results"] == [
+            {
+                "repository": "testuser/repo1",
+                "status": "exists",
+                "project": existing.id,
+                "error": "",
+            },
+            {
+                "repository": "testuser/repo2",
+                "status": "created",
+                "project": created.id,
+                "error": "",
+            },
+        ]
+        assert created.user == self.user
+        assert list(
+            created.projecttechstack_set.values_list("tech_stack__name", "bytes")
+        ) == [("JavaScript", 300), ("CSS", 100)]
+        assert set(created.tag.values_list("name", flat=True)) == {
+            "React",
+            "Frontend",
+        }
+
+    def test_import_requires_a_list_of_repositories(self):
+        self.client.force_authenticate(user=self.user)
+
+        response = self.client.post(
+            "/api/projects/github/import",
+            {"repositories": "testuser/repo1"},
+            format="json",
+        )
+
+        assert response.status_code == 400
+
     def test_sync_project_with_github(self):
         """
         Tests syncing an existing project with updated GitHub repository data.
@@ -140,6 +398,8 @@ class TestProjectViewSetGitHub(APITestCase):
             def mock_response(*args, **kwargs):
                 mock = Mock()
                 mock.status_code = 200
+                mock.headers = {}
+                mock.links = {}
                 if "languages" in args[0]:
                     mock.json.return_value = updated_languages
                 else:
@@ -172,3 +432,86 @@ class TestProjectViewSetGitHub(APITestCase):
             # Verify certain fields remained unchanged
             assert project.status == "completed"
             assert str(project.date_created) == "2024-01-01 00:00:00+00:00"
+
+    def test_sync_project_as_background_job(self):
+        """
+        Tests that ?async=true queues the sync and returns 202 with a job id,
+        and that a worker then applies it.
+        """
+        self.client.force_authenticate(user=self.user)
+        project = Project.objects.create(
+            user=self.user,
+            title="Old Title",
+            description="Old description",
+            repo_url="https://github.com/testuser/repo1",
+            date_created="2024-01-01T00:00:00Z",
+            last_update="2024-01-02T00:00:00Z",
+        )
+
+        with patch("requests.Session.get") as mock_get:
+            response = self.client.put(f"/api/projects/{project.id}/sync?async=true")
+
+            # Queuing the job doesn't wait on GitHub
+            mock_get.assert_not_called()
+
+        assert response.status_code == 202
+        job_id = response.json()["job"]
+        assert response["Location"].endswith(f"/api/jobs/{job_id}")
+
+        with patch("requests.Session.get") as mock_get:
+
+            def mock_response(*args, **kwargs):
+                mock = Mock()
+                mock.status_code = 200
+                mock.headers = {}
+                mock.links = {}
+                if "languages" in args[0]:
+                    mock.json.return_value = {"Python": 100}
+                else:
+                    mock.json.return_value = self.mock_repos[0]
+                return mock
+
+            mock_get.side_effect = mock_response
+            assert queue.work("test-worker", once=True) == 1
+
+        job = self.client.get(f"/api/jobs/{job_id}").json()
+        assert job["status"] == "succeeded"
+        assert job["result"] == {"project_id": project.id}
+
+        project.refresh_from_db()
+        assert project.description == "First test repo"
+
+    def test_background_jobs_require_authentication(self):
+        project = Project.objects.create(
+            user=self.user,
+            title="repo1",
+            description="First test repo",
+            repo_url="https://github.com/testuser/repo1",
+            date_created="2024-01-01T00:00:00Z",
+            last_update="2024-01-02T00:00:00Z",
+        )
+
+        response = self.client.put(f"/api/projects/{project.id}/sync?async=true")
+
+        assert response.status_code == 401
+        assert not queue.claim("test-worker")
+
+    def test_background_sync_of_a_deleted_project_is_not_retried(self):
+        self.client.force_authenticate(user=self.user)
+        project = Project.objects.create(
+            user=self.user,
+            title="repo1",
+            description="First test repo",
+            repo_url="https://github.com/testuser/repo1",
+            date_created="2024-01-01T00:00:00Z",
+            last_update="2024-01-02T00:00:00Z",
+        )
+        job_id = self.client.put(f"/api/projects/{project.id}/sync?async=true").json()[
+            "job"
+        ]
+        project.delete()
+
+        assert queue.work("test-worker", once=True) == 1
+        job = self.client.get(f"/api/jobs/{job_id}").json()
+        assert job["status"] == "failed"
+        assert job["attempts"] == 1
@@ -0,0 +1,189 @@
+import hashlib
+import hmac
+import json
+from django.contrib.auth.models import User
+from django.test import override_settings
+from rest_framework.test import APITestCase
+from unittest.mock import patch
+from portfoliocmsapi.projects.models import GitHubWebhookEvent, Project
+
+
+@override_settings(GITHUB_WEBHOOK_SECRET="webhook-secret")
+class TestGitHubWebhookView(APITestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(username="testuser", password="testpass")
+        self.project = Project.objects.create(
+            user=self.user,
+            title="repo1",
+            description="Old description",
+            repo_url="https://github.com/testuser/repo1",
+            date_created="2024-01-01T00:00:00Z",
+            last_update="2024-01-02T00:00:00Z",
+        )
+        self.repository = {
+            "name": "repo1",
+            "description": "Updated on GitHub",
+            "html_url": "https://github.com/testuser/repo1",
+            "owner": {"login": "testuser"},
+            "topics": ["django", "api"],
+            "created_at": "2024-01-01T00:00:00Z",
+            "updated_at": "2024-01-05T00:00:00Z",
+            "pushed_at": "2024-01-05T00:00:00Z",
+        }
+
+    def deliver(self, event, payload, delivery_id="delivery-1", secret=None):
+        body = json.dumps(payload).encode()
+        signature = hmac.new(
+            (secret or "webhook-secret").encode(), body, hashlib.sha256
+        ).hexdigest()
+        return self.client.post(
+            "/api/github/webhook",
+            data=body,
+            content_type="application/json",
+            HTTP_X_GITHUB_EVENT=event,
+            HTTP_X_GITHUB_DELIVERY=delivery_id,
+            HTTP_X_HUB_SIGNATURE_256=f"sha256={signature}",
+        )
+
+    def test_invalid_signature_is_rejected(self):
+        response = self.deliver(
+            "repository",
+            {"action": "edited", "repository": self.repository},
+            secret="wrong-secret",
+        )
+
+        assert response.status_code == 403
+        assert not GitHubWebhookEvent.objects.exists()
+
+    def test_repository_event_updates_project_without_api_calls(self):
+        with patch("requests.Session.get") as mock_get:
+            response = self.deliver(
+                "repository", {"action": "edited", "repository": self.repository}
+            )
+            mock_get.assert_not_called()
+
+        assert response.status_code == 200
+        assert response.json() == {"status": "applied", "project": self.project.id}
+
+        self.project.refresh_from_db()
+        assert self.project.description == "Updated on GitHub"
+        assert str(self.project.last_update) == "2024-01-05 00:00:00+00:00"
+        assert set(self.project.tag.values_list("name", flat=True)) == {
+            "Django",
+            "Api",
+        }
+
+        event = GitHubWebhookEvent.objects.get(delivery_id="delivery-1")
+        assert event.processed_at is not None
+
+    def test_push_event_uses_unix_timestamps(self):
+        repository = {**self.repository, "pushed_at": 1704585600}  # 2024-01-07
+
+        response = self.deliver(
+            "push", {"ref": "refs/heads/main", "repository": repository}
+        )
+
+        assert response.status_code == 200
+        assert response.json()["status"] == "applied"
+        self.project.refresh_from_db()
+        assert self.project.description == "Updated on GitHub"
+        # Only a full sync, which also fetches languages, advances its watermarks
+        assert self.project.github_pushed_at is None
+        assert str(self.project.github_webhook_pushed_at) == (
+            "2024-01-07 00:00:00+00:00"
+        )
+
+    def test_out_of_order_deliveries_are_skipped(self):
+        newer = {
+            **self.repository,
+            "description": "Newer",
+            "updated_at": "2024-01-09T00:00:00Z",
+        }
+        self.deliver("repository", {"action": "edited", "repository": newer})
+
+        # Sent before the newer one, but delivered after it
+        response = self.deliver(
+            "repository",
+            {"action": "edited", "repository": self.repository},
+            delivery_id="delivery-2",
+        )
+
+        assert response.json() == {"status": "ignored", "project": None}
+        self.project.refresh_from_db()
+        assert self.project.description == "Newer"
+        assert GitHubWebhookEvent.objects.get(delivery_id="delivery-2").processed_at
+
+    def test_deliveries_older_than_the_last_sync_are_skipped(self):
+        self.project.github_updated_at = "2024-01-06T00:00:00Z"
+        self.project.github_pushed_at = "2024-01-06T00:00:00Z"
+        self.project.save()
+
+        response = self.deliver(
+            "repository", {"action": "edited", "repository": self.repository}
+        )
+
+        assert response.json()["status"] == "ignored"
+        self.project.refresh_from_db()
+        assert self.project.description == "Old description"
+
+    def test_payload_must_be_a_json_object(self):
+        for payload in ([{"repository": self.repository}], "push", 42):
+            response = self.deliver("push", payload)
+
+            assert response.status_code == 400
+        assert not GitHubWebhookEvent.objects.exists()
+
+    def test_renamed_repository_updates_repo_url(self):
+        repository = {
+            **self.repository,
+            "name": "renamed-repo",
+            "html_url": "https://github.com/testuser/renamed-repo",
+        }
+        payload = {
+            "action": "renamed",
+            "changes": {"repository": {"name": {"from": "repo1"}}},
+            "repository": repository,
+        }
+
+        response = self.deliver("repository", payload)
+
+        assert response.status_code == 200
+        self.project.refresh_from_db()
+        assert self.project.repo_url == "https://github.com/testuser/renamed-repo"
+        assert self.project.title == "renamed-repo"
+
+    def test_event_is_routed_by_repository_id(self):
+        self.project.github_repo_id = 1234
+        self.project.save()
+        # A rename the webhook missed: only the numeric id still matches
+        repository = {
+            **self.repository,
+            "id": 1234,
+            "name": "moved-repo",
+            "html_url": "https://github.com/testuser/moved-repo",
+        }
+
+        response = self.deliver(
+            "repository", {"action": "edited", "repository": repository}
+        )
+
+        assert response.status_code == 200
+        self.project.refresh_from_db()
+        assert self.project.repo_url == "https://github.com/testuser/moved-repo"
+        assert self.project.github_repository == ("testuser", "moved-repo")
+
+    def test_redelivery_is_not_applied_twice(self):
+        payload = {"action": "edited", "repository": self.repository}
+        self.deliver("repository", payload)
+
+        response = self.deliver("repository", payload)
+
+        assert response.json() == {"status": "duplicate"}
+        assert GitHubWebhookEvent.objects.count() == 1
+
+    def test_unrelated_events_are_recorded_and_ignored(self):
+        response = self.deliver("ping", {"zen": "Keep it logically awesome."})
+
+        assert response.status_code == 200
+        assert response.json()["status"] == "ignored"
+        assert GitHubWebhookEvent.objects.get().event == "ping"
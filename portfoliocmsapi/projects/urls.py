@@ -1,4 +1,5 @@
 from rest_framework import routers
+from django.urls import path
 from portfoliocmsapi.projects.views import *
 
 router = routers.DefaultRouter(trailing_slash=False)
@@ -7,4 +8,6 @@ router.register(r"tech_stack", TechStackViewSet, "techstack")
 router.register(r"projects", ProjectViewSet, "project")
 
 
-urlpatterns = [] + router.urls
+urlpatterns = [
+    path("github/webhook", GitHubWebhookView.as_view(), name="github-webhook"),
+] + router.urls
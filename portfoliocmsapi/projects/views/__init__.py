@@ -1,3 +1,4 @@
 from .tag_viewset import TagViewSet
 from .tech_stack_viewset import TechStackViewSet
 from .project_viewset import ProjectViewSet
+from .github_webhook_view import GitHubWebhookView
@@ -0,0 +1,100 @@
+import hashlib
+import hmac
+import json
+from django.conf import settings
+from django.db import IntegrityError
+from django.utils import timezone
+from rest_framework import status
+from rest_framework.permissions import AllowAny
+from rest_framework.response import Response
+from rest_framework.views import APIView
+from ..models import GitHubWebhookEvent
+from ...services.github import GitHubSyncService, get_github_client
+
+
+class GitHubWebhookView(APIView):
+    """
+    Receives GitHub webhook deliveries and applies them to projects.
+
+    Deliveries are authenticated with the X-Hub-Signature-256 HMAC rather than a
+    user token, stored in the GitHubWebhookEvent inbox, and then applied straight
+    from the payload, so keeping projects fresh costs no API quota.
+    """
+
+    authentication_classes = []
+    permission_classes = [AllowAny]
+
+    def post(self, request):
+        secret = settings.GITHUB_WEBHOOK_SECRET
+        if not secret:
+            return Response(
+                {"error": "GitHub webhooks are not configured"},
+                status=status.HTTP_403_FORBIDDEN,
+            )
+
+        body = request.body
+        signature = request.headers.get("X-Hub-Signature-256", "")
+        expected = (
+            "sha256=" + hmac.new(secret.encode(), body, hashlib.sha256).hexdigest()
+        )
+        if not hmac.compare_digest(signature, expected):
+            return Response(
+                {"error": "Invalid signature"}, status=status.HTTP_403_FORBIDDEN
+            )
+
+        event_name = request.headers.get("X-GitHub-Event", "")
+        delivery_id = request.headers.get("X-GitHub-Delivery", "")
+        if not event_name or not delivery_id:
+            return Response(
+                {"error": "X-GitHub-Event and X-GitHub-Delivery headers are required"},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        try:
+            payload = json.loads(body)
+        except ValueError:
+            payload = None
+        if not isinstance(payload, dict):
+            return Response(
+                {"error": "Payload must be a JSON object"},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        # Record the delivery first. GitHub redelivers with the same id, so a
+        # delivery that was already applied is acknowledged without reapplying it.
+        try:
+            event, _ = GitHubWebhookEvent.objects.get_or_create(
+                delivery_id=delivery_id,
+                defaults={
+                    "event": event_name,
+                    "action": payload.get("action", ""),
+                    "payload": payload,
+                },
+            )
+        except IntegrityError:
+            event = GitHubWebhookEvent.objects.get(delivery_id=delivery_id)
+
+        if event.processed_at is not None:
+            return Response({"status": "duplicate"})
+
+        sync_service = GitHubSyncService(github_client=get_github_client())
+        try:
+            project = sync_service.apply_webhook_event(event)
+        except Exception as e:
+            event.error = str(e)
+            event.save(update_fields=["error"])
+            return Response(
+                {"error": "Unable to apply event"},
+                status=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            )
+
+        event.processed_at = timezone.now()
+        event.error = ""
+        event.save(update_fields=["processed_at", "error"])
+
+        return Response(
+            {
+                "status": "applied" if project else "ignored",
+                "project": project.id if project else None,
+            }
+        )
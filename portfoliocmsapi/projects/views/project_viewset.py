@@ -1,33 +1,145 @@
+import requests
+from django.conf import settings
+from django.contrib.auth.models import User
+from decimal import Decimal
+from django.db.models import DecimalField, OuterRef, Subquery, Value
+from django.db.models.functions import Coalesce
+from django.urls import reverse
 from rest_framework import viewsets
 from rest_framework.decorators import action
+from rest_framework.exceptions import NotAuthenticated, ValidationError
 from rest_framework.permissions import AllowAny
 from rest_framework.response import Response
-from ..models import Project, Tag, TechStack
-from ..serializers import ProjectSerializer, GitHubRepositorySerializer
-from ...utils import CreateRelationshipMixin, UpdateRelationshipMixin
-from ...services.github import GitHubClient, GitHubSyncService
+from ..models import Project, ProjectTag, ProjectTechStack, Tag, TechStack
+from ..serializers import (
+    ProjectSerializer,
+    GitHubRepositorySerializer,
+    GitHubImportResultSerializer,
+)
+from ...utils import (
+    ConditionalGetMixin,
+    CreateRelationshipMixin,
+    KeysetPagination,
+    UpdateRelationshipMixin,
+    parse_github_repo_url,
+)
+from ...jobs.queue import enqueue
+from ...services.github import (
+    GitHubRequestError,
+    GitHubSyncService,
+    get_github_client,
+)
+from ...services.github.sync import ProjectExistsError
 
 
 class ProjectViewSet(
-    CreateRelationshipMixin, UpdateRelationshipMixin, viewsets.ModelViewSet
+    ConditionalGetMixin,
+    CreateRelationshipMixin,
+    UpdateRelationshipMixin,
+    viewsets.ModelViewSet,
 ):
     permission_classes = [AllowAny]
     queryset = Project.objects.all()
     serializer_class = ProjectSerializer
+    pagination_class = KeysetPagination
     relationship_configs = {"tag": {"model": Tag}, "tech_stack": {"model": TechStack}}
+    cache_models = (Project, ProjectTag, ProjectTechStack, Tag, TechStack, User)
 
-    def __init__(self, *args, **kwargs):
-        super().__init__(*args, **kwargs)
-        # Initialize GitHub services
-        self.github_client = GitHubClient()
-        self.sync_service = GitHubSyncService(github_client=self.github_client)
+    # Values accepted by ?ordering=, optionally prefixed with "-" for descending
+    ORDERING_FIELDS = {
+        "date_created",
+        "last_update",
+        "title",
+        "primary_language",
+        "primary_language_share",
+    }
+
+    def get_queryset(self):
+        """
+        Projects annotated with their dominant language and its share. Reads load
+        their user, tags and languages up front, so a page costs the same number
+        of queries however many projects it holds.
+
+        Query parameters:
+            user: Only this user's projects
+            language: Only projects whose dominant language has this name
+            ordering: One of ORDERING_FIELDS, with a "-" prefix for descending order
+        """
+        # The largest language link of each project, served by the
+        # (project, -bytes) index
+        largest = ProjectTechStack.objects.filter(
+            project=OuterRef("pk"), bytes__gt=0
+        ).order_by("-bytes")
+        # Projects without languages sort as "" / 0, so every row has a key to page by
+        queryset = Project.objects.annotate(
+            primary_language=Coalesce(
+                Subquery(largest.values("tech_stack__name")[:1]), Value("")
+            ),
+            primary_language_share=Coalesce(
+                Subquery(largest.values("percentage")[:1]),
+                Value(Decimal(0)),
+                output_field=DecimalField(max_digits=5, decimal_places=2),
+            ),
+        )
+        if self.action in ("list", "retrieve"):
+            queryset = ProjectSerializer.setup_eager_loading(queryset)
+
+        user = self.request.query_params.get("user")
+        if user is not None:
+            if not user.isdigit():
+                raise ValidationError({"user": "Must be a user id"})
+            queryset = queryset.filter(user_id=user)
+
+        language = self.request.query_params.get("language")
+        if language:
+            queryset = queryset.filter(primary_language__iexact=language)
+
+        ordering = self.request.query_params.get("ordering")
+        if ordering:
+            if ordering.lstrip("-") not in self.ORDERING_FIELDS:
+                raise ValidationError(
+                    {"ordering": f"Must be one of {sorted(self.ORDERING_FIELDS)}"}
+                )
+            if ordering.lstrip("-") == "date_created":
+                queryset = queryset.order_by(ordering)
+            else:
+                queryset = queryset.order_by(ordering, "-date_created")
+        return queryset
+
+    @property
+    def sync_service(self):
+        """
+        GitHub sync service backed by the shared, lazily created client.
+
+        Only the GitHub actions touch this, so plain CRUD on projects never makes a
+        network call. The token check is cached by the client for a TTL.
+        """
+        if not hasattr(self, "_sync_service"):
+            github_client = get_github_client()
+            github_client.verify_token()
+            self._sync_service = GitHubSyncService(github_client=github_client)
+        return self._sync_service
 
     @action(methods=["get"], detail=False, url_path="github")
     def list_github_repositories(self, request):
         """
         Lists GitHub repositories that aren't already linked to projects.
+
+        The list comes from a snapshot refreshed in the background once it is older
+        than settings.GITHUB_REPOSITORY_CACHE["TTL"].
         """
-        available_repos = self.sync_service.get_available_repositories()
+        # The token is verified inside the cached refresh, so a GitHub outage doesn't
+        # stop the last good snapshot from being served. Without one, a failed
+        # request, a rejected token or an open circuit all mean GitHub can't be
+        # listed right now.
+        sync_service = GitHubSyncService(github_client=get_github_client())
+        try:
+            available_repos = sync_service.get_available_repositories(cached=True)
+        except (GitHubRequestError, requests.exceptions.RequestException):
+            return Response(
+                {"error": "GitHub is currently unavailable, try again later"},
+                status=503,
+            )
         serializer = GitHubRepositorySerializer(available_repos, many=True)
         return Response(serializer.data)
 
@@ -41,27 +153,87 @@ class ProjectViewSet(
         if not repo_url:
             return Response({"error": "repo_url is required"}, status=400)
 
-        # Extract owner and repo name from URL
-        repo_parts = repo_url.split("/")
-        owner = repo_parts[-2]
-        repo_name = repo_parts[-1]
+        if not request.user.is_authenticated:
+            raise NotAuthenticated()
 
-        # Prepare project data from GitHub
-        project_data = self.sync_service.prepare_project_data(owner, repo_name)
-        # Add the user to the project data
-        project_data["user"] = request.user.id
+        # Extract owner and repo name from URL
+        try:
+            owner, repo_name = parse_github_repo_url(repo_url)
+        except ValueError as e:
+            return Response({"error": str(e)}, status=400)
 
-        # Create the project
-        serializer = self.get_serializer(data=project_data)
-        serializer.is_valid(raise_exception=True)
-        project = serializer.save()
+        if self._wants_async(request):
+            return self._enqueue(
+                request,
+                "github.create_project",
+                {"repo_url": repo_url, "user_id": request.user.id},
+            )
 
-        # Sync languages and topics
-        self.sync_service.sync_repository_languages(project)
-        self.sync_service.sync_repository_topics(project)
+        # Create the project along with its languages and topics, sharing one
+        # GitHub session between the steps
+        try:
+            project = self.sync_service.create_project(owner, repo_name, request.user)
+        except ProjectExistsError as e:
+            return Response({"error": str(e), "project": e.project.id}, status=409)
+        except GitHubRequestError as e:
+            return Response({"error": str(e)}, status=502)
 
         return Response(self.get_serializer(project).data, status=201)
 
+    @action(methods=["post"], detail=False, url_path="github/import")
+    def import_from_github(self, request):
+        """
+        Creates projects for many GitHub repositories in one request.
+
+        Expects "repositories", a list of repository URLs, "owner/name" strings or
+        numeric ids, or "all": true to import every repository that doesn't have a
+        project yet. Each repository is reported separately, as created, exists or
+        failed.
+        """
+        if not request.user.is_authenticated:
+            raise NotAuthenticated()
+
+        if request.data.get("all") is True:
+            try:
+                repositories = [
+                    repo["html_url"]
+                    for repo in self.sync_service.iter_available_repositories()
+                ]
+            except (GitHubRequestError, requests.exceptions.RequestException) as e:
+                return Response(
+                    {"error": f"Unable to list GitHub repositories: {e}"}, status=502
+                )
+        else:
+            repositories = request.data.get("repositories")
+            if not isinstance(repositories, list) or not repositories:
+                return Response(
+                    {"error": "repositories must be a non-empty list"}, status=400
+                )
+
+        limit = settings.GITHUB_IMPORT_MAX_REPOSITORIES
+        if len(repositories) > limit:
+            return Response(
+                {"error": f"At most {limit} repositories can be imported at once"},
+                status=400,
+            )
+
+        if self._wants_async(request):
+            return self._enqueue(
+                request,
+                "github.import_repositories",
+                {"repositories": repositories, "user_id": request.user.id},
+            )
+
+        try:
+            results = self.sync_service.import_repositories(repositories, request.user)
+        except GitHubRequestError as e:
+            return Response({"error": str(e)}, status=502)
+        created = any(result.ok for result in results)
+        return Response(
+            {"results": GitHubImportResultSerializer(results, many=True).data},
+            status=201 if created else 200,
+        )
+
     @action(methods=["put"], detail=True, url_path="sync")
     def sync_project(self, request, pk=None):
         """
@@ -69,20 +241,45 @@ class ProjectViewSet(
         """
         project = self.get_object()
 
-        # Extract owner and repo name from the project's repo_url
-        owner, repo_name = self.sync_service._get_repo_info(project.repo_url)
+        if self._wants_async(request):
+            return self._enqueue(
+                request, "github.sync_project", {"project_id": project.id}
+            )
 
-        # Get updated project data from GitHub
-        project_data = self.sync_service.prepare_project_data(owner, repo_name)
+        # Update the GitHub-sourced fields, tech stack and tags in one session
+        try:
+            project = self.sync_service.refresh_project(project)
+        except GitHubRequestError as e:
+            return Response({"error": str(e)}, status=502)
 
-        # Update only the fields that should be synced from GitHub
-        project.title = project_data["title"]
-        project.description = project_data["description"]
-        project.last_update = project_data["last_update"]
-        project.save()
+        return Response(self.get_serializer(project).data)
 
-        # Update tech stack and tags
-        self.sync_service.sync_repository_languages(project)
-        self.sync_service.sync_repository_topics(project)
+    def _wants_async(self, request) -> bool:
+        """
+        Whether a GitHub action should be queued as a background job.
 
-        return Response(self.get_serializer(project).data)
+        Clients opt in with ?async=true (or out with ?async=false); otherwise
+        settings.GITHUB_SYNC_ASYNC decides.
+        """
+        requested = request.query_params.get("async")
+        if requested is None:
+            return settings.GITHUB_SYNC_ASYNC
+        return requested.lower() in ("1", "true", "yes")
+
+    def _enqueue(self, request, name: str, payload: dict) -> Response:
+        """
+        Queues a job for the requesting user and answers 202 with its location.
+
+        Jobs can only be read back by the user who queued them, so anonymous
+        requests can't queue any.
+        """
+        if not request.user.is_authenticated:
+            raise NotAuthenticated()
+
+        job = enqueue(name, payload, user=request.user)
+        job_url = request.build_absolute_uri(reverse("job-detail", args=[job.id]))
+        return Response(
+            {"job": job.id, "status": job.status, "url": job_url},
+            status=202,
+            headers={"Location": job_url},
+        )
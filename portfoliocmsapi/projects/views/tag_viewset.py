@@ -2,9 +2,11 @@ from rest_framework import viewsets
 from rest_framework.permissions import AllowAny
 from ..models import Tag
 from ..serializers.tag_serializer import TagSerializer
+from ...utils import CachedResponseMixin
 
 
-class TagViewSet(viewsets.ModelViewSet):
+class TagViewSet(CachedResponseMixin, viewsets.ModelViewSet):
     permission_classes = [AllowAny]
     queryset = Tag.objects.all()
     serializer_class = TagSerializer
+    cache_models = (Tag,)
@@ -1,10 +1,80 @@
+from decimal import Decimal
+from django.db.models import Count, OuterRef, Subquery, Sum
 from rest_framework import viewsets
+from rest_framework.decorators import action
+from rest_framework.exceptions import ValidationError
 from rest_framework.permissions import AllowAny
-from ..models import TechStack
-from ..serializers.tech_stack_serializer import TechStackSerializer
+from rest_framework.response import Response
+from ..models import Project, ProjectTechStack, TechStack
+from ..serializers.tech_stack_serializer import (
+    LanguageStatsSerializer,
+    TechStackSerializer,
+)
+from ...utils import CachedResponseMixin
 
 
-class TechStackViewSet(viewsets.ModelViewSet):
+class TechStackViewSet(CachedResponseMixin, viewsets.ModelViewSet):
     permission_classes = [AllowAny]
     queryset = TechStack.objects.all()
     serializer_class = TechStackSerializer
+    cache_models = (TechStack, Project, ProjectTechStack)
+    cached_actions = ("list", "retrieve", "stats")
+
+    @action(methods=["get"], detail=False, url_path="stats")
+    def stats(self, request):
+        """
+        Language statistics across the portfolio, computed from the byte counts
+        stored by the GitHub sync.
+
+        Each language lists its total bytes, its share of all bytes, the number of
+        projects using it and the number of projects it is the dominant language of,
+        largest first. ?user=<id> limits the stats to one user's projects.
+        """
+        return self.cached_response(request, self._language_stats)
+
+    def _language_stats(self, request):
+        links = ProjectTechStack.objects.filter(bytes__gt=0)
+        projects = Project.objects.all()
+        user = request.query_params.get("user")
+        if user is not None:
+            if not user.isdigit():
+                raise ValidationError({"user": "Must be a user id"})
+            links = links.filter(project__user_id=user)
+            projects = projects.filter(user_id=user)
+
+        rows = (
+            links.values("tech_stack_id", "tech_stack__name")
+            .annotate(total_bytes=Sum("bytes"), projects=Count("project_id"))
+            .order_by("-total_bytes", "tech_stack__name")
+        )
+
+        # Dominant language of each project, counted per language
+        largest = ProjectTechStack.objects.filter(
+            project=OuterRef("pk"), bytes__gt=0
+        ).order_by("-bytes")
+        primary_counts = dict(
+            projects.annotate(
+                primary_language_id=Subquery(largest.values("tech_stack_id")[:1])
+            )
+            .exclude(primary_language_id=None)
+            .values("primary_language_id")
+            .annotate(count=Count("id"))
+            .values_list("primary_language_id", "count")
+        )
+
+        rows = list(rows)
+        total = sum(row["total_bytes"] for row in rows)
+        stats = [
+            {
+                "id": row["tech_stack_id"],
+                "name": row["tech_stack__name"],
+                "bytes": row["total_bytes"],
+                "percentage": (
+                    Decimal(row["total_bytes"]) * 100 / total if total else Decimal(0)
+                ).quantize(Decimal("0.01")),
+                "projects": row["projects"],
+                "primary_projects": primary_counts.get(row["tech_stack_id"], 0),
+            }
+            for row in rows
+        ]
+        return Response(LanguageStatsSerializer(stats, many=True).data)
@@ -1,2 +1,4 @@
-from .client import GitHubClient
+from .async_client import AsyncGitHubClient
+from .client import GitHubClient, GitHubRequestError
+from .registry import get_github_client, reset_github_clients
 from .sync import GitHubSyncService
@@ -0,0 +1,148 @@
+import asyncio
+import weakref
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import AsyncIterator, Iterable, List, Tuple
+from django.conf import settings
+from .client import GitHubClient
+from .registry import get_github_client
+
+
+class AsyncGitHubClient:
+    """
+    asyncio counterpart of GitHubClient, for fanning out many requests at once.
+
+    It exposes the same methods as GitHubClient as coroutines and runs them on a
+    wrapped GitHubClient. That client's pooled session, ETag cache and rate-limit
+    scheduler are shared by every call, whether it comes from async or sync code.
+    The project has no async HTTP library among its dependencies, so the blocking
+    requests run on a dedicated thread pool sized to the connection pool.
+    A semaphore per event loop bounds how many requests are in flight.
+
+    Example:
+        async_client = AsyncGitHubClient()
+        results = await async_client.fetch_repositories(
+            [("jeremywhitney", "portfolio-cms_api"), ("jeremywhitney", "other")]
+        )
+    """
+
+    def __init__(self, github_client: GitHubClient = None, max_concurrency: int = None):
+        """
+        Args:
+            github_client: The client to run requests on. Defaults to the shared
+                        client from the registry.
+            max_concurrency: Maximum number of requests in flight. Defaults to
+                        settings.GITHUB_ASYNC_CONCURRENCY.
+        """
+        self.github_client = github_client or get_github_client()
+        self.max_concurrency = max_concurrency or getattr(
+            settings, "GITHUB_ASYNC_CONCURRENCY", 10
+        )
+        self._executor = ThreadPoolExecutor(
+            max_workers=self.max_concurrency, thread_name_prefix="github-async"
+        )
+        # asyncio primitives belong to one event loop, so keep a semaphore per loop
+        self._semaphores = weakref.WeakKeyDictionary()
+
+    async def _call(self, func, *args, **kwargs):
+        loop = asyncio.get_running_loop()
+        semaphore = self._semaphores.get(loop)
+        if semaphore is None:
+            semaphore = asyncio.Semaphore(self.max_concurrency)
+            self._semaphores[loop] = semaphore
+
+        async with semaphore:
+            return await loop.run_in_executor(
+                self._executor, partial(func, *args, **kwargs)
+            )
+
+    async def verify_token(self, force: bool = False) -> None:
+        await self._call(self.github_client.verify_token, force=force)
+
+    async def get_all_repositories(self) -> list:
+        return [repo async for repo in self.iter_repositories()]
+
+    async def iter_repositories(self, concurrency: int = None) -> AsyncIterator[dict]:
+        """
+        Streams the authenticated user's repositories, one page per thread hop.
+        """
+        pages = self.github_client.iter_repository_pages(concurrency)
+        done = object()
+        try:
+            while True:
+                page = await self._call(next, pages, done)
+                if page is done:
+                    return
+                for repo in page:
+                    yield repo
+        finally:
+            # A cancelled consumer may leave the generator running on a worker thread
+            if not pages.gi_running:
+                pages.close()
+
+    async def get_repository_details(self, owner: str, repo: str) -> dict:
+        return await self._call(self.github_client.get_repository_details, owner, repo)
+
+    async def get_repository_details_if_changed(
+        self, owner: str, repo: str, etag: str = None
+    ) -> tuple:
+        return await self._call(
+            self.github_client.get_repository_details_if_changed, owner, repo, etag
+        )
+
+    async def get_repository_languages(self, owner: str, repo: str) -> dict:
+        return await self._call(
+            self.github_client.get_repository_languages, owner, repo
+        )
+
+    async def get_repository_languages_if_changed(
+        self, owner: str, repo: str, etag: str = None
+    ) -> tuple:
+        return await self._call(
+            self.github_client.get_repository_languages_if_changed, owner, repo, etag
+        )
+
+    async def check_rate_limit(self) -> dict:
+        return await self._call(self.github_client.check_rate_limit)
+
+    def rate_limit_metrics(self) -> dict:
+        return self.github_client.rate_limit_metrics()
+
+    async def fetch_repositories(
+        self, repositories: Iterable[Tuple[str, str]]
+    ) -> List[dict]:
+        """
+        Fetches details and languages for many repositories concurrently.
+
+        Args:
+            repositories: (owner, repo) pairs
+
+        Returns:
+            One dict per repository, in input order, with "details" and "languages"
+            on success or "error" holding the exception if either request failed.
+        """
+
+        async def fetch(owner, repo):
+            try:
+                details, languages = await asyncio.gather(
+                    self.get_repository_details(owner, repo),
+                    self.get_repository_languages(owner, repo),
+                )
+            except Exception as e:
+                return {"owner": owner, "repo": repo, "error": e}
+            return {
+                "owner": owner,
+                "repo": repo,
+                "details": details,
+                "languages": languages,
+            }
+
+        return await asyncio.gather(
+            *(fetch(owner, repo) for owner, repo in repositories)
+        )
+
+    def close(self) -> None:
+        """
+        Shuts down the thread pool. The wrapped client and its session stay open.
+        """
+        self._executor.shutdown(wait=False, cancel_futures=True)
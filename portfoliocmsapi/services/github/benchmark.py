@@ -0,0 +1,169 @@
+import time
+import tracemalloc
+from datetime import datetime, timedelta, timezone as dt_timezone
+from typing import Callable, Dict, Iterable, List
+from django.contrib.auth.models import User
+from django.db import connection, transaction
+from django.test.utils import CaptureQueriesContext
+from portfoliocmsapi.projects.models import Project
+from .cache import InMemoryConditionalCache
+from .client import GitHubClient
+from .dev import FakeGitHubServer
+from .rate_limit import RateLimitScheduler
+from .sync import GitHubSyncService
+
+# Metrics that count work and should be stable from run to run, and metrics that
+# depend on the machine and are compared with a looser tolerance
+COUNT_METRICS = ("upstream_requests", "quota_used", "queries")
+TIMING_METRICS = ("wall_seconds", "peak_memory_bytes")
+
+
+def run_benchmarks(
+    sizes: Iterable[int] = (10, 100, 1000),
+    latency: float = 0.0,
+    workers: int = 8,
+    seed: int = 0,
+) -> Dict:
+    """
+    Benchmarks the GitHub sync paths against a FakeGitHubServer.
+
+    For each size, a fake server with that many synthetic repositories is started.
+    A project is then created for every repository (what create_from_github does),
+    each project is refreshed one by one (what the sync action does), and the bulk
+    sync is run over REST and GraphQL. The repositories are touched between runs,
+    so the runs covering changed repositories really have work to do.
+
+    Everything happens in a transaction that is rolled back, so the database is left
+    as it was.
+
+    Args:
+        sizes: Repository counts to benchmark
+        latency: Seconds of simulated network latency per GitHub request
+        workers: Worker threads for the bulk sync
+        seed: Seed for the synthetic repositories
+
+    Returns:
+        dict: {"<size>": {"<scenario>": {metric: value}}}
+    """
+    results = {}
+    for size in sizes:
+        with FakeGitHubServer.synthetic(
+            size, owner="benchmark", seed=seed, latency=latency
+        ) as server:
+            results[str(size)] = _run_size(server, workers)
+    return results
+
+
+def _run_size(server: FakeGitHubServer, workers: int) -> Dict:
+    github_client = GitHubClient(
+        access_token="benchmark",
+        cache=InMemoryConditionalCache(),
+        # The fake quota is never the bottleneck being measured
+        rate_limiter=RateLimitScheduler(reserve=0),
+        base_url=server.url,
+    )
+    sync_service = GitHubSyncService(github_client)
+    clock = iter(
+        datetime(2030, 1, 1, tzinfo=dt_timezone.utc) + timedelta(minutes=minute)
+        for minute in range(10**6)
+    )
+
+    def touch_all():
+        # Each touch moves updated_at forward, so every repository counts as changed
+        timestamp = next(clock).strftime("%Y-%m-%dT%H:%M:%SZ")
+        for full_name in server.repositories:
+            server.touch(full_name, updated_at=timestamp, pushed_at=timestamp)
+
+    def refresh_each():
+        for project in Project.objects.filter(user=user):
+            sync_service.refresh_project(project)
+
+    def bulk_sync(graphql):
+        return lambda: sync_service.sync_projects(
+            Project.objects.filter(user=user), workers=workers, graphql=graphql
+        )
+
+    scenarios = {}
+    with transaction.atomic():
+        user = User.objects.create_user(username="github-sync-benchmark")
+
+        scenarios["create_project"] = _measure(
+            server,
+            lambda: [
+                sync_service.create_project(*full_name.split("/"), user)
+                for full_name in list(server.repositories)
+            ],
+        )
+        scenarios["sync_project_unchanged"] = _measure(server, refresh_each)
+        touch_all()
+        scenarios["sync_project_changed"] = _measure(server, refresh_each)
+        touch_all()
+        scenarios["bulk_sync_rest_changed"] = _measure(server, bulk_sync(False))
+        scenarios["bulk_sync_rest_unchanged"] = _measure(server, bulk_sync(False))
+        touch_all()
+        scenarios["bulk_sync_graphql_changed"] = _measure(server, bulk_sync(True))
+
+        transaction.set_rollback(True)
+
+    return scenarios
+
+
+def _measure(server: FakeGitHubServer, func: Callable) -> Dict:
+    """
+    Runs func once and returns its wall time, GitHub traffic, SQL queries and peak
+    Python memory.
+    """
+    server.reset_metrics()
+    tracemalloc.start()
+    try:
+        with CaptureQueriesContext(connection) as queries:
+            started = time.perf_counter()
+            func()
+            elapsed = time.perf_counter() - started
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    upstream = server.metrics()
+    return {
+        "wall_seconds": round(elapsed, 4),
+        "upstream_requests": upstream["requests"],
+        "quota_used": upstream["quota_used"],
+        "queries": len(queries),
+        "peak_memory_bytes": peak,
+    }
+
+
+def compare_to_baseline(
+    results: Dict,
+    baseline: Dict,
+    tolerance: float = 0.1,
+    timing_tolerance: float = 0.5,
+) -> List[str]:
+    """
+    Lists the metrics that got worse than the baseline allows.
+
+    Count metrics may grow by `tolerance` (a fraction of the baseline value) and
+    timing and memory metrics by `timing_tolerance`. Sizes and scenarios missing
+    from either side are skipped.
+
+    Returns:
+        One description per regression; empty if nothing regressed
+    """
+    regressions = []
+    for size, scenarios in results.items():
+        for scenario, metrics in scenarios.items():
+            expected = baseline.get(size, {}).get(scenario)
+            if expected is None:
+                continue
+            for metric, value in metrics.items():
+                if metric not in expected:
+                    continue
+                allowed = tolerance if metric in COUNT_METRICS else timing_tolerance
+                limit = expected[metric] * (1 + allowed)
+                if value > limit:
+                    regressions.append(
+                        f"{size} repos / {scenario}: {metric} {value} exceeds "
+                        f"baseline {expected[metric]} (+{allowed:.0%})"
+                    )
+    return regressions
@@ -0,0 +1,224 @@
+import hashlib
+import json
+import os
+import tempfile
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Optional
+from django.conf import settings
+
+
+@dataclass
+class CachedResponse:
+    """
+    A GitHub response body stored alongside the ETag it was served with.
+
+    The Link header relations are kept too, since a 304 doesn't always repeat them
+    and pagination needs them to find the next page.
+    """
+
+    etag: str
+    body: str
+    links: dict = field(default_factory=dict)
+
+    @property
+    def size(self) -> int:
+        return len(self.body)
+
+    def json(self):
+        return json.loads(self.body)
+
+
+class ConditionalRequestCache:
+    """
+    Base class for the ETag caches used by GitHubClient for conditional requests.
+
+    The client sends the stored ETag as If-None-Match. GitHub answers 304 Not Modified
+    when nothing changed, and those responses don't count against the rate limit, so
+    the stored body can be reused. Backends implement _load, _store and _evict; this
+    class keeps the hit/miss counters and the size limit.
+    """
+
+    def __init__(self, max_bytes: int = 50 * 1024 * 1024):
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[CachedResponse]:
+        with self._lock:
+            return self._load(key)
+
+    def set(self, key: str, etag: str, body, links: dict = None) -> None:
+        entry = CachedResponse(etag=etag, body=json.dumps(body), links=links or {})
+        if entry.size > self.max_bytes:
+            return
+
+        with self._lock:
+            self._store(key, entry)
+            self.evictions += self._evict()
+
+    def record_hit(self) -> None:
+        with self._lock:
+            self.hits += 1
+
+    def record_miss(self) -> None:
+        with self._lock:
+            self.misses += 1
+
+    def stats(self) -> dict:
+        """
+        Returns the hit/miss counters along with the current cache size.
+        """
+        with self._lock:
+            entries, size = self._usage()
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "entries": entries,
+                "bytes": size,
+            }
+
+    @staticmethod
+    def make_key(url: str, params: dict = None) -> str:
+        if not params:
+            return url
+        return f"{url}?{json.dumps(params, sort_keys=True)}"
+
+    def _load(self, key: str) -> Optional[CachedResponse]:
+        raise NotImplementedError
+
+    def _store(self, key: str, entry: CachedResponse) -> None:
+        raise NotImplementedError
+
+    def _evict(self) -> int:
+        raise NotImplementedError
+
+    def _usage(self) -> tuple[int, int]:
+        raise NotImplementedError
+
+
+class InMemoryConditionalCache(ConditionalRequestCache):
+    """
+    Process-local LRU cache. The least recently used entries are dropped once the
+    stored bodies exceed max_bytes.
+    """
+
+    def __init__(self, max_bytes: int = 50 * 1024 * 1024):
+        super().__init__(max_bytes=max_bytes)
+        self._entries = OrderedDict()
+        self._size = 0
+
+    def _load(self, key):
+        entry = self._entries.get(key)
+        if entry is not None:
+            self._entries.move_to_end(key)
+        return entry
+
+    def _store(self, key, entry):
+        previous = self._entries.pop(key, None)
+        if previous is not None:
+            self._size -= previous.size
+        self._entries[key] = entry
+        self._size += entry.size
+
+    def _evict(self):
+        evicted = 0
+        while self._size > self.max_bytes and self._entries:
+            _, entry = self._entries.popitem(last=False)
+            self._size -= entry.size
+            evicted += 1
+        return evicted
+
+    def _usage(self):
+        return len(self._entries), self._size
+
+
+class FileConditionalCache(ConditionalRequestCache):
+    """
+    On-disk cache that survives restarts and can be shared between processes.
+
+    Each entry is a JSON file named after a hash of its key. Files are written
+    atomically, and the least recently used ones (by modification time) are removed
+    once the directory exceeds max_bytes.
+    """
+
+    def __init__(self, location, max_bytes: int = 50 * 1024 * 1024):
+        super().__init__(max_bytes=max_bytes)
+        self.location = Path(location)
+        self.location.mkdir(parents=True, exist_ok=True)
+
+    def _path(self, key: str) -> Path:
+        return self.location / f"{hashlib.sha256(key.encode()).hexdigest()}.json"
+
+    def _load(self, key):
+        path = self._path(key)
+        try:
+            with open(path, encoding="utf-8") as cache_file:
+                data = json.load(cache_file)
+            # Touch the file so eviction treats it as recently used
+            os.utime(path)
+        except (OSError, ValueError):
+            return None
+        return CachedResponse(**data)
+
+    def _store(self, key, entry):
+        fd, temp_path = tempfile.mkstemp(dir=self.location, suffix=".tmp")
+        with os.fdopen(fd, "w", encoding="utf-8") as cache_file:
+            json.dump(
+                {"etag": entry.etag, "body": entry.body, "links": entry.links},
+                cache_file,
+            )
+        os.replace(temp_path, self._path(key))
+
+    def _files(self):
+        files = []
+        for path in self.location.glob("*.json"):
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+            files.append((stat.st_mtime, stat.st_size, path))
+        return files
+
+    def _evict(self):
+        files = sorted(self._files())
+        size = sum(file_size for _, file_size, _ in files)
+        evicted = 0
+        for _, file_size, path in files:
+            if size <= self.max_bytes:
+                break
+            try:
+                path.unlink()
+            except OSError:
+                continue
+            size -= file_size
+            evicted += 1
+        return evicted
+
+    def _usage(self):
+        files = self._files()
+        return len(files), sum(file_size for _, file_size, _ in files)
+
+
+def build_conditional_cache() -> Optional[ConditionalRequestCache]:
+    """
+    Builds the cache backend configured in settings.GITHUB_CONDITIONAL_CACHE.
+
+    Returns None when the backend is "none", which disables conditional requests.
+    """
+    config = getattr(settings, "GITHUB_CONDITIONAL_CACHE", {})
+    backend = config.get("BACKEND", "memory")
+    max_bytes = config.get("MAX_BYTES", 50 * 1024 * 1024)
+
+    if backend == "memory":
+        return InMemoryConditionalCache(max_bytes=max_bytes)
+    if backend == "file":
+        return FileConditionalCache(config["LOCATION"], max_bytes=max_bytes)
+    if backend == "none":
+        return None
+    raise ValueError(f"Unknown GitHub conditional cache backend: {backend}")
@@ -1,5 +1,41 @@
+import hashlib
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
+from typing import Iterator
+from urllib.parse import parse_qs, urlencode, urlparse, urlunparse
 import requests
 from django.conf import settings
+from .cache import ConditionalRequestCache, build_conditional_cache
+from .rate_limit import RateLimitScheduler
+from .single_flight import build_single_flight
+from .transport import GitHubTransport
+
+
+class GitHubRequestError(ValueError):
+    """
+    Raised by the GitHub services when a request to GitHub fails, chained to the
+    underlying RequestException.
+
+    It subclasses ValueError, which callers caught before it existed.
+    """
+
+    @property
+    def transient(self) -> bool:
+        """
+        Whether trying again later may succeed: connection errors, timeouts, rate
+        limits and 5xx responses, as opposed to bad credentials or a missing
+        repository.
+        """
+        cause = self.__cause__
+        if not isinstance(cause, requests.exceptions.RequestException):
+            return False
+        response = cause.response
+        if response is None:
+            return True
+        return response.status_code >= 500 or response.status_code in (403, 429)
 
 
 class GitHubClient:
@@ -8,23 +44,46 @@ class GitHubClient:
     Handles authentication and basic request configuration.
     """
 
-    def __init__(self, access_token=None):
+    def __init__(
+        self,
+        access_token=None,
+        token_ttl=None,
+        cache=None,
+        rate_limiter=None,
+        base_url=None,
+        single_flight=None,
+        transport=None,
+    ):
         """
         Initializes the GitHub API client with authentication and configuration.
 
-        When the client is created, it verifies that the provided token (or the one from
-        settings) is valid by making a test request to GitHub's API. This helps catch
-        authentication issues immediately rather than having them appear during later operations.
+        Creating a client does not touch the network. The token is verified lazily by
+        verify_token(), and a successful check is cached for token_ttl seconds so that
+        long-lived clients don't spend a round trip (and rate-limit quota) on every use.
 
         Args:
             access_token: Optional GitHub personal access token. If not provided,
                         uses the token from Django settings.
-
-        Raises:
-            ValueError: If the token is invalid or authentication fails
+            token_ttl: Optional number of seconds a successful token check stays valid.
+                        Defaults to settings.GITHUB_TOKEN_VERIFY_TTL.
+            cache: Optional ConditionalRequestCache used to send If-None-Match requests.
+                        Defaults to the backend configured in
+                        settings.GITHUB_CONDITIONAL_CACHE.
+            rate_limiter: Optional RateLimitScheduler that paces requests. Defaults to
+                        one configured from settings.GITHUB_RATE_LIMIT.
+            base_url: Optional API root, for GitHub Enterprise or a local stand-in.
+                        Defaults to settings.GITHUB_API_URL.
+            single_flight: Optional SingleFlight that coalesces concurrent identical
+                        requests. Defaults to one configured from
+                        settings.GITHUB_SINGLE_FLIGHT.
+            transport: Optional GitHubTransport that sends the requests. Defaults to
+                        one configured from settings.GITHUB_HTTP.
         """
-        self.base_url = "https://api.github.com"
-        self.session = requests.Session()
+        self.base_url = base_url or getattr(
+            settings, "GITHUB_API_URL", "https://api.github.com"
+        )
+        self.transport = transport or GitHubTransport()
+        self.session = self.transport.session
 
         # Use provided token or fall back to settings
         token = access_token or settings.GITHUB_ACCESS_TOKEN
@@ -37,12 +96,166 @@ class GitHubClient:
             }
         )
 
-        # Verify the token is valid by making a test request
-        try:
-            test_response = self.session.get(f"{self.base_url}/user")
-            test_response.raise_for_status()
-        except requests.exceptions.RequestException as e:
-            raise ValueError(f"Invalid GitHub token or authentication failed: {str(e)}")
+        self.token_ttl = (
+            token_ttl
+            if token_ttl is not None
+            else getattr(settings, "GITHUB_TOKEN_VERIFY_TTL", 300)
+        )
+        self._token_verified_at = None
+        self._token_lock = threading.Lock()
+
+        self.cache = cache if cache is not None else build_conditional_cache()
+        self.rate_limiter = rate_limiter or RateLimitScheduler()
+        self.single_flight = single_flight or build_single_flight()
+        # Identifies the token in coalescing keys without exposing it, since
+        # different tokens may see different repositories
+        self._token_id = hashlib.sha256(str(token).encode()).hexdigest()[:16]
+
+    def verify_token(self, force: bool = False) -> None:
+        """
+        Verifies that the configured token is valid by making a test request to GitHub.
+
+        The result of a successful check is cached for token_ttl seconds, so calling this
+        before every GitHub operation only costs a round trip once per TTL window.
+        Failed checks are not cached, so a rotated token is picked up on the next call.
+
+        Args:
+            force: Re-check the token even if a cached result is still fresh
+
+        Raises:
+            GitHubRequestError: If the token is invalid or authentication fails
+        """
+        with self._token_lock:
+            now = time.monotonic()
+            if (
+                not force
+                and self._token_verified_at is not None
+                and now - self._token_verified_at < self.token_ttl
+            ):
+                return
+
+            try:
+                test_response = self._send(f"{self.base_url}/user")
+                test_response.raise_for_status()
+            except requests.exceptions.RequestException as e:
+                self._token_verified_at = None
+                raise GitHubRequestError(
+                    f"Invalid GitHub token or authentication failed: {str(e)}"
+                ) from e
+
+            self._token_verified_at = now
+
+    @property
+    def token_verified(self) -> bool:
+        """
+        Whether a successful token check is cached and still within its TTL.
+        """
+        return (
+            self._token_verified_at is not None
+            and time.monotonic() - self._token_verified_at < self.token_ttl
+        )
+
+    def _send(self, url: str, headers=None, params: dict = None):
+        """
+        Sends a GET request through the rate-limit scheduler.
+
+        The scheduler may delay the request to spread the remaining quota over the
+        reset window, and learns the new quota from the response headers. Requests
+        rejected by a primary or secondary rate limit are retried after backing off,
+        up to the scheduler's max_retries.
+
+        Args:
+            url: The URL to request
+            headers: Headers to send in addition to the session's own
+            params: Optional query parameters
+
+        Raises:
+            RateLimitExceeded: If waiting for quota would take longer than allowed
+        """
+        attempt = 0
+        while True:
+            self.rate_limiter.acquire()
+            response = self.transport.get(url, headers=headers, params=params)
+            self.rate_limiter.update(response)
+
+            if (
+                not self.rate_limiter.is_rate_limited(response)
+                or attempt >= self.rate_limiter.max_retries
+            ):
+                return response
+
+            self.rate_limiter.backoff(response, attempt)
+            attempt += 1
+
+    def _get_json(self, url: str, params: dict = None, etag: str = None) -> tuple:
+        """
+        Makes a GET request and returns the decoded body with its Link relations.
+
+        Identical requests already in flight from other threads (or, with
+        GITHUB_SINGLE_FLIGHT["CROSS_PROCESS"], other processes) are joined instead of
+        being sent again.
+
+        When a conditional cache is configured, the ETag from an earlier response is
+        sent as If-None-Match. A 304 Not Modified costs no rate-limit quota and no body
+        bandwidth, and the cached body is returned instead.
+
+        Args:
+            url: The URL to request
+            params: Optional query parameters
+            etag: Optional ETag of a body the caller already holds. It takes precedence
+                over the cache, and a 304 for it returns None as the body.
+
+        Returns:
+            tuple: (decoded JSON body, dict of Link header relations, ETag)
+
+        Raises:
+            requests.exceptions.RequestException: If the API request fails
+        """
+        # Concurrent callers asking for the same resource share one request (and
+        # the same decoded body, which callers must treat as read-only)
+        key = " ".join(
+            [
+                self._token_id,
+                "GET",
+                ConditionalRequestCache.make_key(url, params),
+                etag or "",
+            ]
+        )
+        return self.single_flight.do(
+            key, lambda: self._fetch_json(url, params=params, etag=etag)
+        )
+
+    def _fetch_json(self, url: str, params: dict = None, etag: str = None) -> tuple:
+        cached = None
+        if self.cache is not None:
+            cache_key = ConditionalRequestCache.make_key(url, params)
+            cached = self.cache.get(cache_key)
+
+        headers = None
+        validator = etag or (cached.etag if cached is not None else None)
+        if validator:
+            headers = {"If-None-Match": validator}
+
+        response = self._send(url, headers=headers, params=params)
+
+        if validator and response.status_code == 304:
+            if self.cache is not None:
+                self.cache.record_hit()
+            if etag:
+                # The caller already has this version of the body
+                return None, cached.links if cached is not None else {}, etag
+            return cached.json(), cached.links, cached.etag
+
+        response.raise_for_status()  # This will raise an exception for HTTP errors
+        data = response.json()
+        response_etag = response.headers.get("ETag")
+
+        if self.cache is not None:
+            self.cache.record_miss()
+            if response_etag:
+                self.cache.set(cache_key, response_etag, data, links=response.links)
+
+        return data, response.links, response_etag
 
     def get_all_repositories(self) -> list:
         """
@@ -53,23 +266,133 @@ class GitHubClient:
         basic information like name and description, as well as topics and language data
         that we'll use for generating tech stack items and tags.
 
+        Every page is fetched before returning; use iter_repositories() to stream them
+        instead.
+
         Returns:
             list: A list of dictionaries containing repository information
 
         Raises:
             requests.exceptions.RequestException: If the API request fails
         """
-        response = self.session.get(
+        return list(self.iter_repositories())
+
+    def iter_repositories(self, concurrency: int = None) -> Iterator[dict]:
+        """
+        Streams all repositories for the authenticated user, one page at a time.
+
+        Pages are followed through GitHub's Link: rel="next" headers and repositories
+        are yielded as soon as their page arrives, so callers can stop early without
+        paying for the remaining pages.
+
+        When concurrency is greater than 1 and the first page advertises the last page
+        number, the remaining pages are fetched in parallel by at most that many
+        threads. Repositories are still yielded in page order.
+
+        Args:
+            concurrency: Maximum number of pages fetched at once. Defaults to
+                        settings.GITHUB_PAGE_CONCURRENCY.
+
+        Yields:
+            dict: Repository information, most recently updated first
+
+        Raises:
+            requests.exceptions.RequestException: If the API request fails
+        """
+        for page in self.iter_repository_pages(concurrency):
+            yield from page
+
+    def iter_repository_pages(self, concurrency: int = None) -> Iterator[list]:
+        """
+        Streams the authenticated user's repositories a whole page at a time.
+
+        This is the page-level form of iter_repositories(), for callers that hand
+        pages off elsewhere (such as the async client) and want one hop per page.
+
+        Args:
+            concurrency: Maximum number of pages fetched at once. Defaults to
+                        settings.GITHUB_PAGE_CONCURRENCY.
+
+        Yields:
+            list: One page of repository information
+        """
+        if concurrency is None:
+            concurrency = getattr(settings, "GITHUB_PAGE_CONCURRENCY", 1)
+
+        repos, links, _ = self._get_json(
             f"{self.base_url}/user/repos",
-            headers=self.session.headers,
             params={
                 "sort": "updated",  # Get most recently updated repos first
                 "direction": "desc",  # Descending order (newest first)
                 "per_page": 100,  # Maximum items per page to reduce API calls
             },
         )
-        response.raise_for_status()
-        return response.json()
+        yield repos
+
+        next_url = self._get_link_url(links, "next")
+        last_url = self._get_link_url(links, "last")
+
+        if concurrency > 1 and next_url and last_url:
+            yield from self._iter_pages_concurrently(next_url, last_url, concurrency)
+            return
+
+        while next_url:
+            repos, links, _ = self._get_json(next_url)
+            yield repos
+            next_url = self._get_link_url(links, "next")
+
+    def _iter_pages_concurrently(
+        self, next_url: str, last_url: str, concurrency: int
+    ) -> Iterator[list]:
+        """
+        Fetches pages next_url..last_url with a bounded pool, yielding in page order.
+
+        Only `concurrency` pages are ever in flight, and pending fetches are cancelled
+        if the caller stops consuming the generator.
+        """
+        first_page = self._get_page_number(next_url)
+        last_page = self._get_page_number(last_url)
+        page_urls = (
+            self._with_page_number(last_url, page)
+            for page in range(first_page, last_page + 1)
+        )
+
+        executor = ThreadPoolExecutor(max_workers=concurrency)
+        try:
+            in_flight = deque()
+            for url in islice(page_urls, concurrency):
+                in_flight.append(executor.submit(self._get_page, url))
+
+            while in_flight:
+                page = in_flight.popleft().result()
+                for url in islice(page_urls, 1):
+                    in_flight.append(executor.submit(self._get_page, url))
+                yield page
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def _get_page(self, url: str) -> list:
+        repos, _, _ = self._get_json(url)
+        return repos
+
+    @staticmethod
+    def _get_link_url(links: dict, rel: str):
+        """
+        Returns the URL for a relation parsed from a Link header, if present.
+        """
+        return links.get(rel, {}).get("url")
+
+    @staticmethod
+    def _get_page_number(url: str) -> int:
+        query = parse_qs(urlparse(url).query)
+        return int(query.get("page", ["1"])[0])
+
+    @staticmethod
+    def _with_page_number(url: str, page: int) -> str:
+        parts = urlparse(url)
+        query = parse_qs(parts.query)
+        query["page"] = [str(page)]
+        return urlunparse(parts._replace(query=urlencode(query, doseq=True)))
 
     def get_repository_details(self, owner: str, repo: str) -> dict:
         """
@@ -85,22 +408,195 @@ class GitHubClient:
         Example:
             client.get_repository_details('jeremywhitney', 'portfolio-cms_api')
         """
-        response = self.session.get(
-            f"{self.base_url}/repos/{owner}/{repo}", headers=self.session.headers
+        repo_data, _, _ = self._get_json(f"{self.base_url}/repos/{owner}/{repo}")
+        return repo_data
+
+    def get_repository_details_if_changed(
+        self, owner: str, repo: str, etag: str = None
+    ) -> tuple:
+        """
+        Fetches repository details unless they still match a known ETag.
+
+        Callers that store the ETag of the last payload they processed (such as the
+        project sync watermarks) can skip unchanged repositories with a 304, which
+        costs no rate-limit quota.
+
+        Args:
+            owner: The GitHub username of the repository owner
+            repo: The name of the repository
+            etag: ETag of the payload the caller already has, if any
+
+        Returns:
+            tuple: (repository details, or None if unchanged since etag; current ETag)
+        """
+        repo_data, _, new_etag = self._get_json(
+            f"{self.base_url}/repos/{owner}/{repo}", etag=etag
         )
-        response.raise_for_status()  # This will raise an exception for HTTP errors
-        return response.json()
+        return repo_data, new_etag
+
+    def get_repository_by_id_if_changed(self, repo_id: int, etag: str = None) -> tuple:
+        """
+        Fetches repository details by GitHub's numeric repository id.
+
+        Unlike owner/name, the id survives renames and transfers.
+
+        Returns:
+            tuple: (repository details, or None if unchanged since etag; current ETag)
+        """
+        repo_data, _, new_etag = self._get_json(
+            f"{self.base_url}/repositories/{int(repo_id)}", etag=etag
+        )
+        return repo_data, new_etag
 
     def get_repository_languages(self, owner: str, repo: str) -> dict:
         """
         Fetches language statistics for a repository.
         """
-        response = self.session.get(
-            f"{self.base_url}/repos/{owner}/{repo}/languages",
-            headers=self.session.headers,
+        languages, _, _ = self._get_json(
+            f"{self.base_url}/repos/{owner}/{repo}/languages"
+        )
+        return languages
+
+    def get_repository_languages_if_changed(
+        self, owner: str, repo: str, etag: str = None
+    ) -> tuple:
+        """
+        Fetches language statistics unless they still match a known ETag.
+
+        Returns:
+            tuple: (languages, or None if unchanged since etag; current ETag)
+        """
+        languages, _, new_etag = self._get_json(
+            f"{self.base_url}/repos/{owner}/{repo}/languages", etag=etag
+        )
+        return languages, new_etag
+
+    # Largest number of repositories fetched by one GraphQL query
+    GRAPHQL_BATCH_SIZE = 100
+
+    REPOSITORY_FIELDS = """
+    fragment RepositoryFields on Repository {
+      databaseId
+      name
+      description
+      url
+      createdAt
+      updatedAt
+      pushedAt
+      owner { login }
+      repositoryTopics(first: 100) { nodes { topic { name } } }
+      languages(first: 100, orderBy: {field: SIZE, direction: DESC}) {
+        edges { size node { name } }
+      }
+    }
+    """
+
+    @property
+    def graphql_url(self) -> str:
+        # GitHub Enterprise serves REST at /api/v3 and GraphQL at /api/graphql
+        if self.base_url.endswith("/api/v3"):
+            return f"{self.base_url[: -len('/v3')]}/graphql"
+        return f"{self.base_url}/graphql"
+
+    def graphql(self, query: str, variables: dict = None) -> dict:
+        """
+        Runs a GraphQL query and returns its data.
+
+        GraphQL has its own points-based quota, so the response headers aren't fed to
+        the REST rate-limit scheduler. Partial results are returned as they are:
+        fields that failed (such as a repository that doesn't exist) come back as
+        None next to the ones that worked.
+
+        Raises:
+            requests.exceptions.RequestException: If the request fails, or GitHub
+                returns errors and no data at all
+        """
+        response = self.transport.post(
+            self.graphql_url, json={"query": query, "variables": variables or {}}
         )
         response.raise_for_status()
-        return response.json()
+        body = response.json()
+        if body.get("data") is None:
+            messages = "; ".join(
+                error.get("message", "") for error in body.get("errors", [])
+            )
+            raise requests.exceptions.RequestException(
+                f"GitHub GraphQL query failed: {messages}"
+            )
+        return body["data"]
+
+    def get_repositories_batch(self, repositories) -> dict:
+        """
+        Fetches details, languages and topics for many repositories via GraphQL.
+
+        Each query covers up to GRAPHQL_BATCH_SIZE repositories, so syncing N
+        projects takes N / 100 requests instead of about 3N REST calls. The results
+        are shaped like the REST payloads, so they can be used wherever those are.
+
+        Args:
+            repositories: (owner, repo) pairs
+
+        Returns:
+            dict: Maps each (owner, repo) pair, lowercased, to a dict with "details"
+                (as from get_repository_details, including "topics") and "languages"
+                (as from get_repository_languages). Repositories GraphQL couldn't
+                return are left out, so callers can fetch them over REST.
+
+        Raises:
+            requests.exceptions.RequestException: If a batch query fails
+        """
+        pairs = list(dict.fromkeys((owner, repo) for owner, repo in repositories))
+        results = {}
+        for start in range(0, len(pairs), self.GRAPHQL_BATCH_SIZE):
+            batch = pairs[start : start + self.GRAPHQL_BATCH_SIZE]
+
+            declarations, fields, variables = [], [], {}
+            for index, (owner, repo) in enumerate(batch):
+                declarations.append(f"$owner{index}: String!, $name{index}: String!")
+                fields.append(
+                    f"r{index}: repository(owner: $owner{index}, name: $name{index}) "
+                    "{ ...RepositoryFields }"
+                )
+                variables[f"owner{index}"] = owner
+                variables[f"name{index}"] = repo
+
+            query = (
+                f"query({', '.join(declarations)}) {{\n"
+                + "\n".join(fields)
+                + "\n}\n"
+                + self.REPOSITORY_FIELDS
+            )
+            data = self.graphql(query, variables)
+
+            for index, (owner, repo) in enumerate(batch):
+                node = data.get(f"r{index}")
+                if node is not None:
+                    results[(owner.lower(), repo.lower())] = self._from_graphql(node)
+
+        return results
+
+    @staticmethod
+    def _from_graphql(node: dict) -> dict:
+        """
+        Converts a GraphQL repository node to REST-shaped details and languages.
+        """
+        details = {
+            "id": node.get("databaseId"),
+            "name": node["name"],
+            "full_name": f"{node['owner']['login']}/{node['name']}",
+            "description": node["description"],
+            "html_url": node["url"],
+            "created_at": node["createdAt"],
+            "updated_at": node["updatedAt"],
+            "pushed_at": node["pushedAt"],
+            "topics": [
+                topic["topic"]["name"] for topic in node["repositoryTopics"]["nodes"]
+            ],
+        }
+        languages = {
+            edge["node"]["name"]: edge["size"] for edge in node["languages"]["edges"]
+        }
+        return {"details": details, "languages": languages}
 
     def check_rate_limit(self) -> dict:
         """
@@ -119,8 +615,28 @@ class GitHubClient:
         Raises:
             requests.exceptions.RequestException: If the rate limit check fails
         """
-        response = self.session.get(
-            f"{self.base_url}/rate_limit", headers=self.session.headers
-        )
+        response = self._send(f"{self.base_url}/rate_limit")
         response.raise_for_status()
-        return response.json()
+        rate_limit = response.json()
+        self.rate_limiter.update_from_rate_limit(rate_limit)
+        return rate_limit
+
+    def rate_limit_metrics(self) -> dict:
+        """
+        Returns the current quota budget as tracked from response headers.
+
+        Unlike check_rate_limit(), this doesn't make a request.
+        """
+        return self.rate_limiter.metrics()
+
+    def transport_metrics(self) -> dict:
+        """
+        Returns request counts, latency and bytes received by the HTTP transport.
+        """
+        return self.transport.metrics()
+
+    def single_flight_metrics(self) -> dict:
+        """
+        Returns how many requests were made, and how many joined one in flight.
+        """
+        return self.single_flight.metrics()
@@ -0,0 +1 @@
+from .fake_server import FakeGitHubServer, generate_repositories, record_fixtures
@@ -0,0 +1,419 @@
+import hashlib
+import json
+import random
+import threading
+import time
+from datetime import datetime, timedelta, timezone as dt_timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from urllib.parse import parse_qs, urlencode, urlparse
+
+LANGUAGES = ["Python", "JavaScript", "TypeScript", "HTML", "CSS", "Shell", "Go", "Rust"]
+TOPICS = ["django", "react", "api", "cli", "portfolio", "web", "data", "devops"]
+
+
+def generate_repositories(count: int, owner: str = "octocat", seed: int = 0) -> list:
+    """
+    Builds `count` synthetic repositories, with languages, in the recorded format.
+
+    The same seed always produces the same repositories, so benchmarks are
+    repeatable.
+    """
+    rng = random.Random(seed)
+    start = datetime(2020, 1, 1, tzinfo=dt_timezone.utc)
+    repositories = []
+    for index in range(count):
+        created = start + timedelta(hours=index)
+        updated = created + timedelta(days=rng.randint(0, 365))
+        name = f"repo-{index:05d}"
+        repositories.append(
+            {
+                "id": 100_000 + seed * 1_000_000 + index,
+                "name": name,
+                "full_name": f"{owner}/{name}",
+                "owner": {"login": owner},
+                "description": f"Synthetic repository {index}",
+                "html_url": f"https://github.com/{owner}/{name}",
+                "created_at": _timestamp(created),
+                "updated_at": _timestamp(updated),
+                "pushed_at": _timestamp(updated),
+                "language": rng.choice(LANGUAGES),
+                "topics": rng.sample(TOPICS, rng.randint(0, 3)),
+                "languages": {
+                    language: rng.randint(100, 100_000)
+                    for language in rng.sample(LANGUAGES, rng.randint(1, 4))
+                },
+            }
+        )
+    return repositories
+
+
+def record_fixtures(github_client, path, limit: int = None) -> int:
+    """
+    Records the authenticated user and their repositories from the real API.
+
+    The file can be replayed with FakeGitHubServer.from_fixtures().
+
+    Args:
+        github_client: A GitHubClient for the account to record
+        path: Where to write the JSON fixture file
+        limit: Record at most this many repositories
+
+    Returns:
+        The number of repositories recorded
+    """
+    user, _, _ = github_client._get_json(f"{github_client.base_url}/user")
+    repositories = []
+    for repo in github_client.iter_repositories():
+        if limit is not None and len(repositories) >= limit:
+            break
+        owner, name = repo["full_name"].split("/")
+        repositories.append(
+            {**repo, "languages": github_client.get_repository_languages(owner, name)}
+        )
+
+    Path(path).write_text(
+        json.dumps({"user": user, "repositories": repositories}, indent=2),
+        encoding="utf-8",
+    )
+    return len(repositories)
+
+
+class FakeGitHubServer:
+    """
+    Local stand-in for the GitHub API, for offline tests and benchmarks.
+
+    It serves /user, paginated /user/repos, /repos/{owner}/{repo}, its /languages,
+    /repositories/{id}, /rate_limit and the repository part of /graphql from
+    recorded fixtures or synthetic data. Like GitHub, it sends ETags and answers
+    matching If-None-Match requests with a free 304, tracks a rate-limit quota in
+    the X-RateLimit-* headers and answers 403 once it runs out. Every request can be
+    delayed by a fixed latency to model network round trips.
+
+    Example:
+        with FakeGitHubServer.synthetic(2000, latency=0.05) as server:
+            client = GitHubClient(base_url=server.url)
+            ...
+            print(server.metrics())
+    """
+
+    def __init__(
+        self,
+        repositories: list = None,
+        user: dict = None,
+        latency: float = 0.0,
+        rate_limit: int = 5000,
+        default_per_page: int = 30,
+    ):
+        """
+        Args:
+            repositories: Repository payloads in the recorded format (REST details
+                        plus a "languages" dict)
+            user: Payload for GET /user. Defaults to the owner of the first repository.
+            latency: Seconds added to every response
+            rate_limit: Requests allowed before the quota runs out
+            default_per_page: Page size when the request doesn't set per_page
+        """
+        self.repositories = {}
+        self.languages = {}
+        for repo in repositories or []:
+            self.add_repository(repo)
+
+        owner = next(iter(self.repositories.values()), {}).get("owner", {})
+        self.user = user or {"login": owner.get("login", "octocat")}
+        self.latency = latency
+        self.rate_limit = rate_limit
+        self.remaining = rate_limit
+        self.reset_at = int(time.time()) + 3600
+        self.default_per_page = default_per_page
+
+        self.requests = 0
+        self.not_modified = 0
+        self.rate_limited = 0
+        self.graphql_requests = 0
+        self._lock = threading.Lock()
+        self._server = None
+
+    @classmethod
+    def synthetic(cls, count: int, owner: str = "octocat", seed: int = 0, **kwargs):
+        return cls(generate_repositories(count, owner=owner, seed=seed), **kwargs)
+
+    @classmethod
+    def from_fixtures(cls, path, **kwargs):
+        recording = json.loads(Path(path).read_text(encoding="utf-8"))
+        return cls(recording["repositories"], user=recording.get("user"), **kwargs)
+
+    def add_repository(self, repo: dict) -> None:
+        repo = dict(repo)
+        languages = repo.pop("languages", {})
+        key = repo["full_name"].lower()
+        self.repositories[key] = repo
+        self.languages[key] = languages
+
+    def touch(self, full_name: str, **changes) -> None:
+        """
+        Marks a repository as updated now (changing its ETag), applying any changes.
+        """
+        now = _timestamp(datetime.now(dt_timezone.utc))
+        self.repositories[full_name.lower()].update(
+            {"updated_at": now, "pushed_at": now, **changes}
+        )
+
+    @property
+    def url(self) -> str:
+        host, port = self._server.server_address
+        return f"http://{host}:{port}"
+
+    def start(self) -> "FakeGitHubServer":
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), _FakeGitHubHandler)
+        self._server.daemon_threads = True
+        self._server.fake = self
+        threading.Thread(target=self._server.serve_forever, daemon=True).start()
+        return self
+
+    def stop(self) -> None:
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc_info):
+        self.stop()
+
+    def metrics(self) -> dict:
+        with self._lock:
+            return {
+                "requests": self.requests,
+                "not_modified": self.not_modified,
+                "rate_limited": self.rate_limited,
+                "graphql_requests": self.graphql_requests,
+                "quota_used": self.rate_limit - self.remaining,
+            }
+
+    def reset_metrics(self) -> None:
+        with self._lock:
+            self.requests = 0
+            self.not_modified = 0
+            self.rate_limited = 0
+            self.graphql_requests = 0
+            self.remaining = self.rate_limit
+
+    def _spend(self, not_modified: bool) -> bool:
+        """
+        Counts a request against the quota. Returns False if the quota is exhausted.
+        """
+        with self._lock:
+            self.requests += 1
+            if not_modified:
+                # Conditional requests answered with 304 don't count against the quota
+                self.not_modified += 1
+                return True
+            if self.remaining <= 0:
+                self.rate_limited += 1
+                return False
+            self.remaining -= 1
+            return True
+
+    def _rate_limit_headers(self) -> dict:
+        with self._lock:
+            return {
+                "X-RateLimit-Limit": str(self.rate_limit),
+                "X-RateLimit-Remaining": str(self.remaining),
+                "X-RateLimit-Reset": str(self.reset_at),
+                "X-RateLimit-Used": str(self.rate_limit - self.remaining),
+            }
+
+    def _list_repositories(self, query: dict) -> tuple:
+        """
+        Returns one page of repositories, most recently updated first, with the
+        Link header relations for the page.
+        """
+        per_page = min(int(query.get("per_page", [self.default_per_page])[0]), 100)
+        page = int(query.get("page", ["1"])[0])
+        repos = sorted(
+            self.repositories.values(),
+            key=lambda repo: repo["updated_at"],
+            reverse=query.get("direction", ["desc"])[0] == "desc",
+        )
+        last_page = max((len(repos) + per_page - 1) // per_page, 1)
+        body = repos[(page - 1) * per_page : page * per_page]
+
+        def page_url(number):
+            params = {key: values[0] for key, values in query.items()}
+            params.update({"per_page": per_page, "page": number})
+            return f"{self.url}/user/repos?{urlencode(params)}"
+
+        links = {}
+        if page < last_page:
+            links["next"] = page_url(page + 1)
+            links["last"] = page_url(last_page)
+        if page > 1:
+            links["first"] = page_url(1)
+            links["prev"] = page_url(page - 1)
+        return body, links
+
+    def _graphql(self, variables: dict) -> dict:
+        data = {}
+        index = 0
+        while f"owner{index}" in variables:
+            key = f"{variables[f'owner{index}']}/{variables[f'name{index}']}".lower()
+            repo = self.repositories.get(key)
+            data[f"r{index}"] = (
+                None
+                if repo is None
+                else {
+                    "databaseId": repo.get("id"),
+                    "name": repo["name"],
+                    "description": repo["description"],
+                    "url": repo["html_url"],
+                    "createdAt": repo["created_at"],
+                    "updatedAt": repo["updated_at"],
+                    "pushedAt": repo.get("pushed_at"),
+                    "owner": {"login": repo["owner"]["login"]},
+                    "repositoryTopics": {
+                        "nodes": [
+                            {"topic": {"name": topic}}
+                            for topic in repo.get("topics", [])
+                        ]
+                    },
+                    "languages": {
+                        "edges": [
+                            {"size": size, "node": {"name": name}}
+                            for name, size in self.languages[key].items()
+                        ]
+                    },
+                }
+            )
+            index += 1
+        return {"data": data}
+
+
+class _FakeGitHubHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    # Each response goes out in one write, flushed after the handler returns, with
+    # Nagle off. Otherwise the body waits behind the delayed ACK of the headers on
+    # kept-alive connections, adding ~40ms to every request.
+    wbufsize = -1
+    disable_nagle_algorithm = True
+
+    @property
+    def fake(self) -> FakeGitHubServer:
+        return self.server.fake
+
+    def do_GET(self):
+        if self.fake.latency:
+            time.sleep(self.fake.latency)
+
+        parts = urlparse(self.path)
+        query = parse_qs(parts.query)
+        segments = [segment for segment in parts.path.split("/") if segment]
+        links = {}
+
+        if segments == ["user"]:
+            body = self.fake.user
+        elif segments == ["user", "repos"]:
+            body, links = self.fake._list_repositories(query)
+        elif segments == ["rate_limit"]:
+            body = None
+        elif len(segments) == 2 and segments[0] == "repositories":
+            body = next(
+                (
+                    repo
+                    for repo in self.fake.repositories.values()
+                    if str(repo.get("id")) == segments[1]
+                ),
+                None,
+            )
+            if body is None:
+                self._respond(404, {"message": "Not Found"})
+                return
+        elif len(segments) in (3, 4) and segments[0] == "repos":
+            key = f"{segments[1]}/{segments[2]}".lower()
+            if key not in self.fake.repositories or (
+                len(segments) == 4 and segments[3] != "languages"
+            ):
+                self._respond(404, {"message": "Not Found"})
+                return
+            if len(segments) == 4:
+                body = self.fake.languages[key]
+            else:
+                body = self.fake.repositories[key]
+        else:
+            self._respond(404, {"message": "Not Found"})
+            return
+
+        if body is None:
+            # /rate_limit is free and reports the quota as it stands
+            headers = self.fake._rate_limit_headers()
+            core = {
+                "limit": int(headers["X-RateLimit-Limit"]),
+                "remaining": int(headers["X-RateLimit-Remaining"]),
+                "reset": int(headers["X-RateLimit-Reset"]),
+            }
+            self._respond(200, {"resources": {"core": core}, "rate": core})
+            return
+
+        payload = json.dumps(body).encode()
+        etag = f'W/"{hashlib.sha1(payload).hexdigest()}"'
+        not_modified = self.headers.get("If-None-Match") == etag
+
+        if not self.fake._spend(not_modified):
+            self._respond(
+                403,
+                {"message": "API rate limit exceeded"},
+                self.fake._rate_limit_headers(),
+            )
+            return
+
+        headers = {**self.fake._rate_limit_headers(), "ETag": etag}
+        if links:
+            headers["Link"] = ", ".join(
+                f'<{url}>; rel="{rel}"' for rel, url in links.items()
+            )
+        if not_modified:
+            self._respond(304, None, headers)
+            return
+        self._respond(200, payload, headers)
+
+    def do_POST(self):
+        if self.fake.latency:
+            time.sleep(self.fake.latency)
+
+        length = int(self.headers.get("Content-Length", 0))
+        request = json.loads(self.rfile.read(length) or b"{}")
+        if urlparse(self.path).path != "/graphql":
+            self._respond(404, {"message": "Not Found"})
+            return
+
+        with self.fake._lock:
+            self.fake.requests += 1
+            self.fake.graphql_requests += 1
+        self._respond(200, self.fake._graphql(request.get("variables", {})))
+
+    def _respond(self, status: int, body, headers: dict = None) -> None:
+        if body is None:
+            payload = b""
+        elif isinstance(body, bytes):
+            payload = body
+        else:
+            payload = json.dumps(body).encode()
+
+        self.send_response(status)
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        if status != 304:
+            self.send_header("Content-Type", "application/json; charset=utf-8")
+            self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        if status != 304:
+            self.wfile.write(payload)
+
+    def log_message(self, *args):
+        pass
+
+
+def _timestamp(value: datetime) -> str:
+    return value.strftime("%Y-%m-%dT%H:%M:%SZ")
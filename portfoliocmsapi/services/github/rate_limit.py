@@ -0,0 +1,192 @@
+import threading
+import time
+import requests
+from django.conf import settings
+
+
+class RateLimitScheduler:
+    """
+    Paces GitHub requests using the quota GitHub reports on every response.
+
+    This is a token bucket whose size is the X-RateLimit-Remaining count, and which
+    refills when X-RateLimit-Reset passes. While plenty of quota is left,
+    requests go out immediately. Once the remaining quota drops to the reserve,
+    requests are spread evenly over the time left until the reset. A bulk sync then
+    slows down gradually instead of hitting 403s halfway through.
+
+    Responses that hit a primary or secondary rate limit (403/429) block every
+    request until Retry-After or the reset time. Without either header, the block
+    uses exponential backoff.
+    """
+
+    def __init__(
+        self,
+        reserve: int = None,
+        max_retries: int = None,
+        max_wait: float = None,
+        clock=time.time,
+        sleep=time.sleep,
+    ):
+        """
+        Args:
+            reserve: Remaining-request count below which requests start being spread
+                    over the reset window. Defaults to settings.GITHUB_RATE_LIMIT.
+            max_retries: How many times a rate-limited request is retried
+            max_wait: Longest single wait in seconds. A request that would have to
+                    wait longer fails instead of blocking a worker indefinitely.
+            clock: Returns the current epoch time (injectable for tests)
+            sleep: Sleeps for a number of seconds (injectable for tests)
+        """
+        config = getattr(settings, "GITHUB_RATE_LIMIT", {})
+        self.reserve = reserve if reserve is not None else config.get("RESERVE", 100)
+        self.max_retries = (
+            max_retries if max_retries is not None else config.get("MAX_RETRIES", 3)
+        )
+        self.max_wait = max_wait if max_wait is not None else config.get("MAX_WAIT", 60)
+        self.clock = clock
+        self.sleep = sleep
+
+        self.limit = None
+        self.remaining = None
+        self.reset_at = None
+        self._blocked_until = 0.0
+        self._next_slot = 0.0
+        self._lock = threading.Lock()
+
+        self.throttled_requests = 0
+        self.rate_limited_responses = 0
+        self.total_wait = 0.0
+
+    def acquire(self) -> None:
+        """
+        Blocks until the next request may be sent, and reserves one unit of quota.
+
+        Raises:
+            RateLimitExceeded: If the wait would be longer than max_wait
+        """
+        with self._lock:
+            now = self.clock()
+            send_at = max(now, self._blocked_until)
+
+            if self.remaining is not None and self.reset_at is not None:
+                until_reset = max(self.reset_at - now, 0)
+                if self.remaining <= 0:
+                    send_at = max(send_at, self.reset_at)
+                elif self.remaining <= self.reserve:
+                    interval = until_reset / self.remaining
+                    send_at = max(send_at, self._next_slot + interval)
+                self.remaining -= 1
+
+            delay = send_at - now
+            if delay > self.max_wait:
+                raise RateLimitExceeded(
+                    f"GitHub rate limit requires waiting {delay:.0f}s, "
+                    f"longer than the {self.max_wait}s allowed"
+                )
+
+            self._next_slot = send_at
+            if delay > 0:
+                self.throttled_requests += 1
+                self.total_wait += delay
+
+        if delay > 0:
+            self.sleep(delay)
+
+    def update(self, response) -> None:
+        """
+        Records the quota reported by a response's rate-limit headers.
+        """
+        headers = response.headers
+        with self._lock:
+            if "X-RateLimit-Limit" in headers:
+                self.limit = int(headers["X-RateLimit-Limit"])
+            if "X-RateLimit-Remaining" in headers:
+                self.remaining = int(headers["X-RateLimit-Remaining"])
+            if "X-RateLimit-Reset" in headers:
+                self.reset_at = float(headers["X-RateLimit-Reset"])
+
+    def is_rate_limited(self, response) -> bool:
+        """
+        Whether a response was rejected by a primary or secondary rate limit.
+
+        A 403 can also mean missing permissions, so it only counts with a
+        Retry-After header, an exhausted quota, or, for secondary limits that come
+        with neither header, a message saying a rate limit was exceeded.
+        """
+        if response.status_code == 429:
+            return True
+        if response.status_code != 403:
+            return False
+        return (
+            "Retry-After" in response.headers
+            or response.headers.get("X-RateLimit-Remaining") == "0"
+            or "rate limit" in _error_message(response).lower()
+        )
+
+    def backoff(self, response, attempt: int) -> None:
+        """
+        Blocks all requests after a rate-limited response.
+
+        Uses Retry-After when GitHub sends it, then the reset time for an exhausted
+        primary limit, and exponential backoff from one minute otherwise, as GitHub
+        recommends for secondary limits.
+        """
+        now = self.clock()
+        if "Retry-After" in response.headers:
+            wait = float(response.headers["Retry-After"])
+        elif response.headers.get("X-RateLimit-Remaining") == "0" and self.reset_at:
+            wait = max(self.reset_at - now, 0)
+        else:
+            wait = 60 * 2**attempt
+
+        with self._lock:
+            self.rate_limited_responses += 1
+            self._blocked_until = max(self._blocked_until, now + wait)
+
+    def update_from_rate_limit(self, rate_limit: dict) -> None:
+        """
+        Records the core quota from a GET /rate_limit payload.
+        """
+        core = rate_limit.get("resources", {}).get("core", {})
+        with self._lock:
+            self.limit = core.get("limit", self.limit)
+            self.remaining = core.get("remaining", self.remaining)
+            self.reset_at = core.get("reset", self.reset_at)
+
+    def metrics(self) -> dict:
+        """
+        Returns the current quota budget and how much the scheduler has throttled.
+        """
+        with self._lock:
+            now = self.clock()
+            return {
+                "limit": self.limit,
+                "remaining": self.remaining,
+                "reset_at": self.reset_at,
+                "seconds_until_reset": (
+                    max(self.reset_at - now, 0) if self.reset_at is not None else None
+                ),
+                "blocked_for": max(self._blocked_until - now, 0),
+                "throttled_requests": self.throttled_requests,
+                "rate_limited_responses": self.rate_limited_responses,
+                "total_wait": self.total_wait,
+            }
+
+
+def _error_message(response) -> str:
+    # GitHub error bodies are JSON objects with a "message"
+    try:
+        body = response.json()
+    except ValueError:
+        return ""
+    message = body.get("message") if isinstance(body, dict) else None
+    return message if isinstance(message, str) else ""
+
+
+class RateLimitExceeded(requests.exceptions.RequestException):
+    """
+    Raised when the GitHub quota can't be honoured within the allowed wait.
+
+    It subclasses RequestException so callers handle it like any other failed
+    GitHub request.
+    """
@@ -0,0 +1,46 @@
+import threading
+from django.conf import settings
+from .client import GitHubClient
+
+# Process-wide clients, keyed by access token. Each client owns one pooled
+# requests.Session, so reusing it keeps connections to api.github.com alive
+# across requests instead of opening a new one per view instantiation.
+_clients = {}
+_clients_lock = threading.Lock()
+
+
+def get_github_client(access_token=None) -> GitHubClient:
+    """
+    Returns the shared GitHubClient for a token, creating it on first use.
+
+    Creating the client never touches the network; callers that need a verified
+    token should call client.verify_token(), which caches its result for a TTL.
+
+    Args:
+        access_token: Optional GitHub personal access token. If not provided,
+                    uses the token from Django settings.
+
+    Returns:
+        The process-wide GitHubClient for that token
+    """
+    token = access_token or settings.GITHUB_ACCESS_TOKEN
+
+    with _clients_lock:
+        client = _clients.get(token)
+        if client is None:
+            client = GitHubClient(access_token=token)
+            _clients[token] = client
+
+    return client
+
+
+def reset_github_clients() -> None:
+    """
+    Drops all shared clients and closes their sessions.
+
+    Mainly useful in tests, or after rotating the token in settings.
+    """
+    with _clients_lock:
+        for client in _clients.values():
+            client.transport.close()
+        _clients.clear()
@@ -0,0 +1,317 @@
+import logging
+import threading
+import time
+import weakref
+from typing import Callable
+import requests
+from django.conf import settings
+from portfoliocmsapi.projects.models import Project
+from portfoliocmsapi.utils.github import parse_github_repo_url
+from portfoliocmsapi.utils.response_cache import get_response_cache
+
+logger = logging.getLogger(__name__)
+
+PROJECT_REPOSITORIES_KEY = "github:project_repositories"
+
+
+class CircuitOpenError(requests.exceptions.RequestException):
+    """
+    Raised when GitHub calls are short-circuited after repeated failures.
+
+    It subclasses RequestException so callers handle it like any other failed
+    GitHub request.
+    """
+
+
+class CircuitBreaker:
+    """
+    Stops calling GitHub for a while after it keeps failing or responding slowly.
+
+    The breaker is closed while calls succeed. After failure_threshold consecutive
+    failures it opens, and calls are rejected without touching the network. Once
+    reset_timeout seconds have passed it lets a single trial call through
+    (half-open): success closes the breaker again, failure re-opens it.
+
+    Calls that succeed but take longer than slow_call seconds count as failures, so
+    a GitHub that is up but degraded trips the breaker too.
+    """
+
+    def __init__(
+        self,
+        failure_threshold: int = 3,
+        reset_timeout: float = 60,
+        slow_call: float = None,
+        clock=time.monotonic,
+    ):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.slow_call = slow_call
+        self.clock = clock
+
+        self.failures = 0
+        self.opened_at = None
+        self._trial_running = False
+        self._lock = threading.Lock()
+
+    @property
+    def state(self) -> str:
+        with self._lock:
+            return self._state()
+
+    def _state(self) -> str:
+        if self.opened_at is None:
+            return "closed"
+        if self.clock() - self.opened_at >= self.reset_timeout:
+            return "half_open"
+        return "open"
+
+    def allow(self) -> bool:
+        """
+        Whether a call may go through now. In the half-open state only one trial
+        call is allowed at a time.
+        """
+        with self._lock:
+            state = self._state()
+            if state == "closed":
+                return True
+            if state == "half_open" and not self._trial_running:
+                self._trial_running = True
+                return True
+            return False
+
+    def call(self, func: Callable, *args, **kwargs):
+        """
+        Runs func through the breaker.
+
+        Raises:
+            CircuitOpenError: If the breaker is open
+        """
+        if not self.allow():
+            raise CircuitOpenError("GitHub circuit breaker is open")
+
+        started = self.clock()
+        try:
+            result = func(*args, **kwargs)
+        except Exception:
+            self._record_failure()
+            raise
+
+        elapsed = self.clock() - started
+        if self.slow_call is not None and elapsed > self.slow_call:
+            logger.warning("GitHub call took %.1fs, counting it as a failure", elapsed)
+            self._record_failure()
+        else:
+            self._record_success()
+        return result
+
+    def _record_success(self) -> None:
+        with self._lock:
+            self.failures = 0
+            self.opened_at = None
+            self._trial_running = False
+
+    def _record_failure(self) -> None:
+        with self._lock:
+            self.failures += 1
+            if self._trial_running or self.failures >= self.failure_threshold:
+                self.opened_at = self.clock()
+            self._trial_running = False
+
+
+class RepositoryListingCache:
+    """
+    Stale-while-revalidate snapshot of a GitHub account's repository list.
+
+    A snapshot younger than ttl seconds is served as is. An older one is still
+    served straight away, while a single background thread fetches a fresh copy.
+    Only the very first request (with no snapshot yet) waits for GitHub.
+
+    Fetches go through a CircuitBreaker. While it is open, the last good snapshot
+    keeps being served however old it is, and no refresh is attempted.
+    """
+
+    def __init__(
+        self,
+        fetch: Callable[[], list],
+        ttl: float = None,
+        breaker: CircuitBreaker = None,
+        clock=time.monotonic,
+    ):
+        """
+        Args:
+            fetch: Returns the full repository list from GitHub
+            ttl: Seconds a snapshot is served without a refresh. Defaults to
+                settings.GITHUB_REPOSITORY_CACHE["TTL"].
+            breaker: Optional CircuitBreaker. Defaults to one configured from
+                settings.GITHUB_REPOSITORY_CACHE.
+            clock: Returns a monotonic time in seconds (injectable for tests)
+        """
+        config = getattr(settings, "GITHUB_REPOSITORY_CACHE", {})
+        self.fetch = fetch
+        self.ttl = ttl if ttl is not None else config.get("TTL", 300)
+        self.breaker = breaker or CircuitBreaker(
+            failure_threshold=config.get("FAILURE_THRESHOLD", 3),
+            reset_timeout=config.get("RESET_TIMEOUT", 60),
+            slow_call=config.get("SLOW_CALL", 10),
+        )
+        self.clock = clock
+
+        self._repositories = None
+        self._fetched_at = None
+        self._refreshing = None
+        self._lock = threading.Lock()
+
+    def get(self) -> list:
+        """
+        Returns the repository list, refreshing it in the background when stale.
+
+        Raises:
+            requests.exceptions.RequestException: If there is no snapshot yet and
+                GitHub can't be reached (CircuitOpenError while the breaker is open)
+        """
+        with self._lock:
+            repositories = self._repositories
+            stale = (
+                repositories is not None and self.clock() - self._fetched_at >= self.ttl
+            )
+
+        if repositories is None:
+            return self.refresh()
+        if stale:
+            self._refresh_in_background()
+        return repositories
+
+    def refresh(self) -> list:
+        """
+        Fetches a fresh snapshot from GitHub and stores it.
+        """
+        repositories = self.breaker.call(self.fetch)
+        with self._lock:
+            self._repositories = repositories
+            self._fetched_at = self.clock()
+        return repositories
+
+    def _refresh_in_background(self) -> None:
+        with self._lock:
+            if self._refreshing is not None and self._refreshing.is_alive():
+                return
+            if self.breaker.state == "open":
+                return
+            self._refreshing = threading.Thread(
+                target=self._background_refresh,
+                name="github-repository-refresh",
+                daemon=True,
+            )
+            self._refreshing.start()
+
+    def _background_refresh(self) -> None:
+        try:
+            self.refresh()
+        except Exception as e:
+            logger.warning("Refreshing the GitHub repository list failed: %s", e)
+
+    def invalidate(self) -> None:
+        """
+        Drops the snapshot so the next get() fetches from GitHub.
+        """
+        with self._lock:
+            self._repositories = None
+            self._fetched_at = None
+
+
+# Listing caches per GitHub client, so each token keeps its own snapshot and
+# breaker. Keyed weakly so resetting the shared clients drops their caches.
+_listing_caches = weakref.WeakKeyDictionary()
+_listing_caches_lock = threading.Lock()
+
+
+def get_repository_listing_cache(github_client) -> RepositoryListingCache:
+    """
+    Returns the process-wide repository listing cache for a client.
+
+    The first refresh (and every one after the cached token check expires)
+    verifies the token, inside the breaker, so a GitHub outage can't hold up a
+    request that has a snapshot to serve.
+    """
+
+    # The cache must not keep its own key alive, so the fetch holds a weak reference
+    client_ref = weakref.ref(github_client)
+
+    def fetch():
+        client = client_ref()
+        client.verify_token()
+        return client.get_all_repositories()
+
+    with _listing_caches_lock:
+        listing_cache = _listing_caches.get(github_client)
+        if listing_cache is None:
+            listing_cache = RepositoryListingCache(fetch)
+            _listing_caches[github_client] = listing_cache
+    return listing_cache
+
+
+def get_project_repositories(cached: bool = True) -> dict:
+    """
+    Returns the GitHub repositories that already have projects.
+
+    The result is cached in the API response cache (settings.API_RESPONSE_CACHE),
+    which deployments with several server processes must back with a shared
+    backend ("file" on one host, "redis" across hosts): the project signals clear
+    the entry there, so every process sees the change on its next read. With a
+    per-process backend, other processes only see it once the entry expires after
+    GITHUB_REPOSITORY_CACHE["PROJECT_REPOSITORIES_TTL"] seconds.
+
+    Args:
+        cached: Read the result from the cache, where it stays until a project
+                changes or the TTL passes
+
+    Returns:
+        dict: "ids" holds the numeric repository ids and "names" the lowercased
+            "owner/name" of every project. Projects that haven't been synced yet
+            are identified by their repo_url.
+    """
+    repositories = (
+        get_response_cache().get(PROJECT_REPOSITORIES_KEY) if cached else None
+    )
+    if repositories is not None:
+        return repositories
+
+    repositories = {"ids": set(), "names": set()}
+    rows = Project.objects.values_list(
+        "github_repo_id", "github_owner", "github_name", "repo_url"
+    )
+    for repo_id, owner, name, repo_url in rows:
+        if repo_id is not None:
+            repositories["ids"].add(repo_id)
+        if owner and name:
+            repositories["names"].add(f"{owner}/{name}")
+        else:
+            try:
+                owner, name = parse_github_repo_url(repo_url)
+            except ValueError:
+                continue
+            repositories["names"].add(f"{owner}/{name}".lower())
+
+    if cached:
+        timeout = getattr(settings, "GITHUB_REPOSITORY_CACHE", {}).get(
+            "PROJECT_REPOSITORIES_TTL", 300
+        )
+        get_response_cache().set(PROJECT_REPOSITORIES_KEY, repositories, timeout)
+    return repositories
+
+
+def invalidate_project_repositories() -> None:
+    get_response_cache().delete(PROJECT_REPOSITORIES_KEY)
+
+
+def reset_repository_caches() -> None:
+    """
+    Drops every repository snapshot and the cached project repositories.
+
+    Mainly useful in tests.
+    """
+    with _listing_caches_lock:
+        for listing_cache in _listing_caches.values():
+            listing_cache.invalidate()
+        _listing_caches.clear()
+    invalidate_project_repositories()
@@ -0,0 +1,88 @@
+class SyncSession:
+    """
+    Request-scoped view of the GitHub client for one logical sync operation.
+
+    Creating a project from a repository or syncing an existing one touches the same
+    repository payloads from several steps (project fields, topics, languages). The
+    session fetches each resource at most once and hands the same payload to every
+    step that asks for it. It exposes the same read methods as GitHubClient, so the
+    sync steps don't need to know whether they're talking to a session or a client.
+
+    Sessions are meant to be short-lived: create one per operation and let it go
+    afterwards, so later operations see fresh data.
+    """
+
+    def __init__(self, github_client):
+        self.github_client = github_client
+        self._repository_details = {}
+        self._repository_languages = {}
+
+    def get_repository_details(self, owner: str, repo: str) -> dict:
+        repo_data, _ = self.get_repository_details_if_changed(owner, repo)
+        return repo_data
+
+    def get_repository_details_if_changed(
+        self, owner: str, repo: str, etag: str = None
+    ) -> tuple:
+        return self._fetch(
+            self._repository_details,
+            self.github_client.get_repository_details_if_changed,
+            owner,
+            repo,
+            etag,
+        )
+
+    def get_repository_languages(self, owner: str, repo: str) -> dict:
+        languages, _ = self.get_repository_languages_if_changed(owner, repo)
+        return languages
+
+    def get_repository_languages_if_changed(
+        self, owner: str, repo: str, etag: str = None
+    ) -> tuple:
+        return self._fetch(
+            self._repository_languages,
+            self.github_client.get_repository_languages_if_changed,
+            owner,
+            repo,
+            etag,
+        )
+
+    def prime(
+        self,
+        owner: str,
+        repo: str,
+        details: dict = None,
+        languages: dict = None,
+        etag: str = None,
+        languages_etag: str = None,
+    ) -> None:
+        """
+        Seeds the session with payloads fetched some other way (such as a GraphQL
+        batch or the async client), so the sync steps use them instead of making
+        REST calls.
+
+        Payloads primed without an ETag (as from GraphQL) don't replace the stored
+        ones. A None payload with an ETag records a conditional request that came
+        back unchanged.
+        """
+        key = (owner.lower(), repo.lower())
+        if details is not None or etag is not None:
+            self._repository_details[key] = (details, etag)
+        if languages is not None or languages_etag is not None:
+            self._repository_languages[key] = (languages, languages_etag)
+
+    def _fetch(self, memo: dict, fetch, owner: str, repo: str, etag: str) -> tuple:
+        """
+        Returns the memoized (payload, ETag) for a repository, fetching it once.
+
+        A conditional fetch that came back unchanged is memoized as a None payload, so
+        later conditional steps reuse it. A later unconditional request still fetches
+        the full payload.
+        """
+        key = (owner.lower(), repo.lower())
+        cached = memo.get(key)
+        if cached is not None and (cached[0] is not None or etag):
+            return cached
+
+        memo[key] = fetch(owner, repo, etag)
+        return memo[key]
@@ -0,0 +1,143 @@
+import hashlib
+import threading
+import time
+import uuid
+from typing import Callable
+from django.conf import settings
+from django.core.cache import cache
+
+
+class _Call:
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+        self.error = None
+
+
+class SingleFlight:
+    """
+    Coalesces concurrent identical calls into one.
+
+    The first caller for a key (the leader) runs the call; callers that arrive
+    with the same key while it is in flight wait for it and get the same result,
+    or the same exception. Once the call finishes the key is forgotten, so a later
+    caller makes a fresh call. Nothing is cached beyond the in-flight window.
+
+    An optional `shared` coalescer extends this across processes: the leader of
+    each process runs its call through it, so processes coalesce with each other
+    too.
+    """
+
+    def __init__(self, shared=None):
+        self.shared = shared
+        self.calls = 0
+        self.coalesced = 0
+        self._in_flight = {}
+        self._lock = threading.Lock()
+
+    def do(self, key: str, func: Callable):
+        with self._lock:
+            call = self._in_flight.get(key)
+            leader = call is None
+            if leader:
+                call = _Call()
+                self._in_flight[key] = call
+                self.calls += 1
+            else:
+                self.coalesced += 1
+
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        try:
+            if self.shared is not None:
+                call.result = self.shared.do(key, func)
+            else:
+                call.result = func()
+            return call.result
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._in_flight[key]
+            call.done.set()
+
+    def metrics(self) -> dict:
+        with self._lock:
+            return {
+                "calls": self.calls,
+                "coalesced": self.coalesced,
+                "in_flight": len(self._in_flight),
+            }
+
+
+class CacheSingleFlight:
+    """
+    Coalesces identical calls across processes through Django's cache.
+
+    The leader takes a lock with cache.add(), which is atomic on the shared backends
+    (database, Memcached, Redis). Other processes wait for the lock to be released
+    and then read the result the leader published under a key only they know about.
+    If the leader failed, or the wait exceeds lock_timeout, they make the call
+    themselves. Only processes sharing a cache backend coalesce, so with the default
+    local-memory cache this behaves like a per-process lock.
+    """
+
+    def __init__(
+        self,
+        lock_timeout: float = 30,
+        poll_interval: float = 0.05,
+        result_ttl: float = 30,
+        clock=time.monotonic,
+        sleep=time.sleep,
+    ):
+        self.lock_timeout = lock_timeout
+        self.poll_interval = poll_interval
+        self.result_ttl = result_ttl
+        self.clock = clock
+        self.sleep = sleep
+
+    def do(self, key: str, func: Callable):
+        digest = hashlib.sha256(key.encode()).hexdigest()
+        lock_key = f"github:single_flight:{digest}"
+
+        flight_id = uuid.uuid4().hex
+        if cache.add(lock_key, flight_id, timeout=self.lock_timeout):
+            try:
+                result = func()
+                cache.set(f"{lock_key}:{flight_id}", result, timeout=self.result_ttl)
+                return result
+            finally:
+                cache.delete(lock_key)
+
+        # Someone else is fetching; remember which flight to read the result of
+        leader_id = cache.get(lock_key)
+        deadline = self.clock() + self.lock_timeout
+        while leader_id is not None and cache.get(lock_key) == leader_id:
+            if self.clock() >= deadline:
+                break
+            self.sleep(self.poll_interval)
+
+        if leader_id is not None:
+            result = cache.get(f"{lock_key}:{leader_id}")
+            if result is not None:
+                return result
+        return func()
+
+
+def build_single_flight() -> SingleFlight:
+    """
+    Builds the coalescer configured in settings.GITHUB_SINGLE_FLIGHT.
+    """
+    config = getattr(settings, "GITHUB_SINGLE_FLIGHT", {})
+    shared = None
+    if config.get("CROSS_PROCESS", False):
+        shared = CacheSingleFlight(
+            lock_timeout=config.get("LOCK_TIMEOUT", 30),
+            poll_interval=config.get("POLL_INTERVAL", 0.05),
+        )
+    return SingleFlight(shared=shared)
@@ -1,6 +1,128 @@
+import asyncio
+import logging
+import time
+from datetime import datetime, timezone as dt_timezone
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from decimal import Decimal
+from typing import Dict, Iterable, Iterator, List, Optional
 import requests
-from typing import List, Dict
-from portfoliocmsapi.projects.models import Project, TechStack, Tag
+from django.conf import settings
+from django.db import IntegrityError, transaction
+from django.db.models import Q
+from django.db.models.functions import Lower
+from django.utils import timezone
+from django.utils.dateparse import parse_datetime
+from portfoliocmsapi.projects.models import (
+    GitHubWebhookEvent,
+    Project,
+    ProjectTag,
+    ProjectTechStack,
+    Tag,
+    TechStack,
+)
+from portfoliocmsapi.utils.github import parse_github_repo_url
+from portfoliocmsapi.utils.response_cache import bump_generations
+from .async_client import AsyncGitHubClient
+from .client import GitHubRequestError
+from .repository_cache import (
+    get_project_repositories,
+    get_repository_listing_cache,
+    invalidate_project_repositories,
+)
+from .session import SyncSession
+
+logger = logging.getLogger(__name__)
+
+
+def _as_datetime(value):
+    """
+    Parses GitHub's timestamps so they compare equal to stored datetimes.
+
+    The REST API uses ISO 8601 strings, while push webhook payloads use Unix
+    timestamps for some repository fields.
+    """
+    if isinstance(value, str):
+        return parse_datetime(value)
+    if isinstance(value, (int, float)):
+        return datetime.fromtimestamp(value, tz=dt_timezone.utc)
+    return value
+
+
+def language_shares(languages: Dict[str, int]) -> Dict[str, Dict]:
+    """
+    Turns GitHub's {language: bytes} into each language's bytes and percentage share.
+
+    Returns:
+        dict: {lowercased language: {"bytes": int, "percentage": Decimal}}, with the
+              percentages rounded to two decimal places
+    """
+    total = sum(languages.values())
+    shares = {}
+    for name, size in languages.items():
+        share = shares.setdefault(name.lower(), {"bytes": 0})
+        share["bytes"] += size
+    for share in shares.values():
+        percentage = Decimal(share["bytes"]) * 100 / total if total else Decimal(0)
+        share["percentage"] = percentage.quantize(Decimal("0.01"))
+    return shares
+
+
+class ProjectExistsError(ValueError):
+    """
+    Raised when creating a project for a repository that already has one.
+    """
+
+    def __init__(self, project: Project):
+        self.project = project
+        super().__init__(
+            "A project already exists for "
+            f"{project.github_owner}/{project.github_name}"
+        )
+
+
+def repository_identity(repo: Dict) -> tuple:
+    """
+    Returns the (id, "owner/name") identity of a GitHub repository payload, with
+    the name lowercased as stored on Project.
+    """
+    owner, name = parse_github_repo_url(repo["html_url"])
+    return repo.get("id"), f"{owner}/{name}".lower()
+
+
+@dataclass
+class SyncResult:
+    """
+    Outcome of syncing one project as part of a bulk sync.
+    """
+
+    project: Project
+    elapsed: float = 0.0
+    error: str = ""
+    changed: bool = True
+
+    @property
+    def ok(self) -> bool:
+        return not self.error
+
+
+@dataclass
+class ImportResult:
+    """
+    Outcome of importing one repository as part of a bulk import.
+
+    status ends up "created", "exists" (the repository already has a project, which
+    is given) or "failed" (with the reason in error).
+    """
+
+    repository: str
+    status: str = "pending"
+    project: Optional[Project] = None
+    error: str = ""
+
+    @property
+    def ok(self) -> bool:
+        return self.status == "created"
 
 
 class GitHubSyncService:
@@ -18,7 +140,22 @@ class GitHubSyncService:
         # concerns between API communication and data synchronization
         self.github_client = github_client
 
-    def get_available_repositories(self) -> List[Dict]:
+    def session(self) -> SyncSession:
+        """
+        Starts a sync session that fetches each GitHub resource at most once.
+
+        Pass the returned session to every step of one logical operation (for example
+        prepare_project_data, sync_repository_languages and sync_repository_topics) so
+        they share repository payloads instead of re-fetching them.
+        """
+        return SyncSession(self.github_client)
+
+    def _source(self, session: SyncSession = None):
+        # Steps read through the session when one is given, otherwise straight
+        # from the client
+        return session if session is not None else self.github_client
+
+    def get_available_repositories(self, cached: bool = False) -> List[Dict]:
         """
         Retrieves a list of GitHub repositories that aren't yet linked to any projects.
 
@@ -26,24 +163,65 @@ class GitHubSyncService:
         our database to identify repositories that are available for project creation.
         This prevents accidentally creating duplicate projects for the same repository.
 
+        Args:
+            cached: Serve the repository list from the stale-while-revalidate
+                    snapshot, and the linked repositories from the cache, instead of
+                    asking GitHub and the database every time
+
         Returns:
             List of repository data dictionaries for repositories that don't have
             corresponding projects yet.
         """
-        # First, get all repositories from GitHub
-        all_repos = self.github_client.get_all_repositories()
+        if not cached:
+            return list(self.iter_available_repositories())
+
+        repositories = get_repository_listing_cache(self.github_client).get()
+        existing = get_project_repositories()
+        return [repo for repo in repositories if not self._is_linked(repo, existing)]
+
+    def iter_available_repositories(self) -> Iterator[Dict]:
+        """
+        Streams GitHub repositories that aren't yet linked to any projects.
 
-        # Get the repo URLs of existing projects from our database
-        existing_urls = set(Project.objects.values_list("repo_url", flat=True))
+        Repositories are filtered as each page arrives from GitHub, so only the
+        unlinked ones are ever held by the caller.
+
+        Yields:
+            Repository data dictionaries for repositories without a project
+        """
+        # Get the repository identities of existing projects from our database
+        existing = get_project_repositories(cached=False)
 
         # Filter out any repositories that already have associated projects
-        available_repos = [
-            repo for repo in all_repos if repo["html_url"] not in existing_urls
-        ]
+        for repo in self.github_client.iter_repositories():
+            if not self._is_linked(repo, existing):
+                yield repo
+
+    @staticmethod
+    def _is_linked(repo: Dict, existing: Dict) -> bool:
+        # Matching on the numeric id as well catches renamed repositories whose
+        # project hasn't been synced since the rename
+        repo_id, full_name = repository_identity(repo)
+        return repo_id in existing["ids"] or full_name in existing["names"]
+
+    def find_project(self, owner: str, name: str, repo_id: int = None):
+        """
+        Looks up the project for a repository by its numeric id or owner/name.
+
+        Both are unique, indexed columns, so this is a single index lookup however
+        the repository URL was written.
 
-        return available_repos
+        Returns:
+            The Project, or None if the repository has no project
+        """
+        match = Q(github_owner=owner.lower(), github_name=name.lower())
+        if repo_id is not None:
+            match |= Q(github_repo_id=repo_id)
+        return Project.objects.filter(match).first()
 
-    def prepare_project_data(self, owner: str, repo_name: str) -> Dict:
+    def prepare_project_data(
+        self, owner: str, repo_name: str, session: SyncSession = None
+    ) -> Dict:
         """
         Prepares GitHub repository data for project creation by transforming
         it to match the Project model's structure.
@@ -51,11 +229,12 @@ class GitHubSyncService:
         Args:
             owner: GitHub username of the repository owner
             repo_name: Name of the repository
+            session: Optional SyncSession shared with the other steps of the operation
 
         Returns:
             Dictionary containing transformed data ready for Project creation
         """
-        repo_data = self.github_client.get_repository_details(owner, repo_name)
+        repo_data = self._source(session).get_repository_details(owner, repo_name)
 
         project_data = {
             "title": repo_data["name"],
@@ -68,7 +247,66 @@ class GitHubSyncService:
 
         return project_data
 
-    def sync_project(self, project: Project) -> Project:
+    def create_project(
+        self, owner: str, repo_name: str, user, session: SyncSession = None
+    ) -> Project:
+        """
+        Creates a project from a GitHub repository, with its tech stack and tags.
+
+        The sync watermarks are recorded at creation, so the first regular sync of
+        the new project is already incremental.
+
+        Args:
+            owner: GitHub username of the repository owner
+            repo_name: Name of the repository
+            user: The User the project belongs to
+            session: Optional SyncSession shared with other steps of the operation
+
+        Returns:
+            The created Project instance
+
+        Raises:
+            ProjectExistsError: If the repository already has a project
+            ValueError: If the repository can't be fetched from GitHub
+        """
+        existing = self.find_project(owner, repo_name)
+        if existing is not None:
+            raise ProjectExistsError(existing)
+
+        session = session or self.session()
+        try:
+            repo_data, etag = session.get_repository_details_if_changed(
+                owner, repo_name
+            )
+            # The URL may have named the repository by an old name
+            repo_id, full_name = repository_identity(repo_data)
+            existing = self.find_project(*full_name.split("/"), repo_id=repo_id)
+            if existing is not None:
+                raise ProjectExistsError(existing)
+
+            project = Project(
+                user=user,
+                repo_url=repo_data["html_url"],
+                date_created=repo_data["created_at"],
+                status="in_development",
+            )
+            self._apply_repository_data(project, repo_data, etag)
+            # Fetched before the transaction, so no write lock is held across a
+            # GitHub round trip; the steps below read it from the session
+            session.get_repository_languages(*project.github_repository)
+
+            with transaction.atomic():
+                project.save()
+                self.sync_repository_languages(project, session=session)
+                self.sync_repository_topics(project, session=session)
+        except requests.exceptions.RequestException as e:
+            raise GitHubRequestError(f"Unable to create project: {str(e)}") from e
+
+        return project
+
+    def sync_project(
+        self, project: Project, session: SyncSession = None, force: bool = False
+    ) -> Project:
         """
         Performs a complete synchronization of a project with its GitHub repository data.
 
@@ -76,8 +314,14 @@ class GitHubSyncService:
         managed within the CMS. Think of it like refreshing a webpage - we're getting
         the latest version of the data while keeping our local customizations.
 
+        The sync is incremental: the repository is requested with the project's stored
+        ETag, and if GitHub reports no change (or the updated_at/pushed_at watermarks
+        match) nothing is written. Otherwise only the fields that differ are saved.
+
         Args:
             project: The Project instance to synchronize with GitHub
+            session: Optional SyncSession shared with the other steps of the operation
+            force: Ignore the stored watermarks and apply the GitHub data regardless
 
         Returns:
             The updated Project instance
@@ -87,63 +331,855 @@ class GitHubSyncService:
             The user, repo_url, and date_created fields are considered immutable
             and won't be changed even if the GitHub data differs.
         """
-        # Extract the owner and repo name from the project's repo_url
-        # Example URL: https://github.com/jeremywhitney/portfolio-cms_api
-        repo_parts = project.repo_url.split("/")
-        owner = repo_parts[-2]  # Second to last part is the owner
-        repo_name = repo_parts[-1]  # Last part is the repository name
+        try:
+            self._sync_project_fields(project, self._source(session), force)
+        except requests.exceptions.RequestException as e:
+            raise GitHubRequestError(f"Unable to sync project: {str(e)}") from e
+
+        return project
+
+    def _sync_project_fields(self, project: Project, source, force: bool) -> bool:
+        """
+        Applies upstream repository data to a project if it changed.
+
+        Returns:
+            Whether the repository had changed since the last sync
+        """
+        # The repository's current owner and name, from the identity columns (or
+        # repo_url for projects that haven't been synced yet)
+        owner, repo_name = project.github_repository
+
+        repo_data, etag = source.get_repository_details_if_changed(
+            owner, repo_name, None if force else project.github_etag or None
+        )
+        if repo_data is None:
+            return False
+        if not force and not self._watermarks_changed(project, repo_data):
+            return False
+
+        # Update only the fields that should be synchronized with GitHub
+        update_fields = self._apply_repository_data(project, repo_data, etag)
+        project.save(update_fields=update_fields)
+        return True
+
+    DATETIME_FIELDS = {
+        "last_update",
+        "github_updated_at",
+        "github_pushed_at",
+        "github_webhook_updated_at",
+        "github_webhook_pushed_at",
+    }
+
+    def _watermarks_changed(self, project: Project, repo_data: Dict) -> bool:
+        return project.github_updated_at is None or (
+            _as_datetime(project.github_updated_at)
+            != _as_datetime(repo_data["updated_at"])
+            or _as_datetime(project.github_pushed_at)
+            != _as_datetime(repo_data.get("pushed_at"))
+        )
+
+    def _apply_repository_data(
+        self,
+        project: Project,
+        repo_data: Dict,
+        etag: str = None,
+        watermarks: bool = True,
+        claimed: set = None,
+    ) -> List[str]:
+        """
+        Copies GitHub data onto a project and returns the names of changed fields.
+
+        Args:
+            watermarks: Record updated_at/pushed_at as the sync watermarks, which
+                       only a full sync (that also fetches languages) may advance.
+                       Otherwise they are recorded as the webhook watermarks.
+            claimed: Identities assigned earlier in the same batch and not yet
+                    written, which count as taken. New identities are added to it.
+        """
+        updated_field, pushed_field = (
+            ("github_updated_at", "github_pushed_at")
+            if watermarks
+            else ("github_webhook_updated_at", "github_webhook_pushed_at")
+        )
+        values = {
+            "title": repo_data["name"],
+            "description": repo_data["description"] or "",  # Handle None values
+            "last_update": repo_data["updated_at"],
+            updated_field: _as_datetime(repo_data["updated_at"]),
+            pushed_field: _as_datetime(repo_data.get("pushed_at")),
+        }
+        if etag is not None:
+            values["github_etag"] = etag
+
+        # Track the repository's current identity, following renames and transfers.
+        # A project whose repository is already linked to another project (one of
+        # the duplicates left unlinked by migration 0004) stays unlinked.
+        repo_id, full_name = repository_identity(repo_data)
+        owner, name = full_name.split("/")
+        if not self._identity_taken(project, repo_id, owner, name, claimed):
+            values["github_owner"], values["github_name"] = owner, name
+            if repo_id is not None:
+                values["github_repo_id"] = repo_id
+
+        changed = []
+        for field_name, value in values.items():
+            current = getattr(project, field_name)
+            if field_name in self.DATETIME_FIELDS:
+                unchanged = _as_datetime(current) == _as_datetime(value)
+            else:
+                unchanged = current == value
+            if not unchanged:
+                setattr(project, field_name, value)
+                changed.append(field_name)
+
+        project.last_synced_at = timezone.now()
+        changed.append("last_synced_at")
+        return changed
+
+    @staticmethod
+    def _identity_taken(
+        project: Project, repo_id: int, owner: str, name: str, claimed: set = None
+    ) -> bool:
+        """
+        Returns whether a repository identity belongs to a project other than the
+        given one, so assigning it would break the unique constraints.
+
+        Unsaved projects are not checked against the database: create_project and
+        import_repositories look for an existing project before fetching.
+        """
+        if (project.github_owner, project.github_name) == (owner, name) and (
+            repo_id is None or project.github_repo_id == repo_id
+        ):
+            # Already this project's identity
+            return False
+
+        keys = {("name", owner, name)}
+        if repo_id is not None:
+            keys.add(("id", repo_id))
+        if claimed is not None and keys & claimed:
+            return True
+
+        if project.pk is not None:
+            match = Q(github_owner=owner, github_name=name)
+            if repo_id is not None:
+                match |= Q(github_repo_id=repo_id)
+            if Project.objects.filter(match).exclude(pk=project.pk).exists():
+                return True
+
+        if claimed is not None:
+            claimed.update(keys)
+        return False
+
+    def sync_projects(
+        self,
+        projects: Iterable[Project],
+        workers: int = None,
+        batch_size: int = 100,
+        force: bool = False,
+        graphql: bool = None,
+    ) -> List[SyncResult]:
+        """
+        Syncs many projects with GitHub, fetching repositories concurrently.
+
+        GitHub payloads are fetched through AsyncGitHubClient, with up to `workers`
+        requests in flight, since that part is dominated by network latency. Each
+        project's payloads are collected in its own SyncSession. The database
+        writes then happen on the calling thread in batches: project fields are
+        written with one bulk_update per batch, and tech stack and tags reuse the
+        fetched payloads. A failure for one repository is recorded in its result and
+        doesn't stop the others.
+
+        Repositories that haven't changed since their last sync (per the stored ETag
+        and watermarks) cost no writes and no languages request, and are reported
+        with changed=False.
+
+        With GraphQL enabled, details, languages and topics for up to 100
+        repositories are fetched by a single query up front. Only repositories the
+        batch couldn't return (or every repository, if the query fails) go through
+        the per-repository REST requests.
+
+        Args:
+            projects: The projects to sync
+            workers: Maximum number of concurrent GitHub fetches. Defaults to
+                    settings.GITHUB_SYNC_WORKERS.
+            batch_size: Number of projects written per transaction
+            force: Ignore the stored watermarks and rewrite every project
+            graphql: Batch the fetches through GitHub's GraphQL API. Defaults to
+                    settings.GITHUB_SYNC_GRAPHQL.
+
+        Returns:
+            One SyncResult per project, in the order the projects were given
+        """
+        workers = workers or getattr(settings, "GITHUB_SYNC_WORKERS", 8)
+        if graphql is None:
+            graphql = getattr(settings, "GITHUB_SYNC_GRAPHQL", True)
+
+        projects = list(projects)
+        batched = (
+            self._fetch_batch([project.github_repository for project in projects])
+            if graphql and projects
+            else {}
+        )
+
+        fetched = asyncio.run(
+            self._fetch_all_for_sync(projects, force, batched, workers)
+        )
+
+        for start in range(0, len(fetched), batch_size):
+            self._write_sync_batch(fetched[start : start + batch_size], force)
+
+        return [result for result, _ in fetched]
+
+    def _fetch_batch(self, repositories: List[tuple]) -> Dict:
+        """
+        Fetches (owner, repo) pairs with GraphQL batch queries.
 
+        Returns:
+            The batch results by lowercased (owner, repo), or an empty dict if the
+            batch failed and every repository should fall back to REST
+        """
         try:
-            # Fetch the latest data from GitHub
-            repo_data = self.github_client.get_repository_details(owner, repo_name)
+            return self.github_client.get_repositories_batch(repositories)
+        except requests.exceptions.RequestException as e:
+            logger.warning("GraphQL batch fetch failed, falling back to REST: %s", e)
+            return {}
 
-            # Update only the fields that should be synchronized with GitHub
-            project.title = repo_data["name"]
-            project.description = (
-                repo_data["description"] or ""
-            )  # Handle potential None values
-            project.last_update = repo_data["updated_at"]
+    async def _fetch_all_for_sync(
+        self, projects: List[Project], force: bool, batched: Dict, workers: int
+    ) -> List[tuple]:
+        """
+        Fetches every project's sync payloads at once, at most `workers` requests
+        at a time.
+        """
+        async_client = AsyncGitHubClient(self.github_client, max_concurrency=workers)
+        try:
+            return await asyncio.gather(
+                *(
+                    self._fetch_for_sync(async_client, project, force, batched)
+                    for project in projects
+                )
+            )
+        finally:
+            async_client.close()
 
-            # Save the changes to the database
-            project.save()
+    async def _fetch_for_sync(
+        self,
+        async_client: AsyncGitHubClient,
+        project: Project,
+        force: bool,
+        batched: Dict = None,
+    ) -> tuple:
+        """
+        Fetches everything a project sync needs into a fresh session.
 
-            return project
+        Repositories already fetched by a GraphQL batch are primed into the session
+        without any further requests.
+        """
+        session = self.session()
+        result = SyncResult(project=project)
+        started = time.perf_counter()
+        try:
+            owner, repo_name = project.github_repository
+            batch_data = (batched or {}).get((owner.lower(), repo_name.lower()))
+            if batch_data is not None:
+                session.prime(owner, repo_name, **batch_data)
+                result.changed = force or self._watermarks_changed(
+                    project, batch_data["details"]
+                )
+                result.elapsed = time.perf_counter() - started
+                return result, session
 
+            repo_data, etag = await async_client.get_repository_details_if_changed(
+                owner, repo_name, None if force else project.github_etag or None
+            )
+            session.prime(owner, repo_name, details=repo_data, etag=etag)
+            result.changed = repo_data is not None and (
+                force or self._watermarks_changed(project, repo_data)
+            )
+            if result.changed:
+                languages, languages_etag = (
+                    await async_client.get_repository_languages_if_changed(
+                        owner,
+                        repo_name,
+                        None if force else project.github_languages_etag or None,
+                    )
+                )
+                session.prime(
+                    owner,
+                    repo_name,
+                    languages=languages,
+                    languages_etag=languages_etag,
+                )
         except requests.exceptions.RequestException as e:
-            raise ValueError(f"Unable to sync project: {str(e)}")
+            result.error = f"Unable to sync project: {str(e)}"
+        result.elapsed = time.perf_counter() - started
+        return result, session
+
+    def _write_sync_batch(self, batch: List[tuple], force: bool) -> None:
+        """
+        Writes the fetched GitHub data for a batch of projects in one transaction.
+
+        Only the changed projects are written, with a single bulk_update covering
+        every field that differs on at least one of them.
+        """
+        synced = []
+        update_fields = set()
+        claimed = set()
+        with transaction.atomic():
+            for result, session in batch:
+                if not result.ok or not result.changed:
+                    continue
+                owner, repo_name = result.project.github_repository
+                repo_data, etag = session.get_repository_details_if_changed(
+                    owner, repo_name
+                )
+                update_fields.update(
+                    self._apply_repository_data(
+                        result.project, repo_data, etag, claimed=claimed
+                    )
+                )
+                synced.append((result, session))
+
+            if synced:
+                Project.objects.bulk_update(
+                    [result.project for result, _ in synced], sorted(update_fields)
+                )
+                bump_generations(Project)
+
+            for result, session in synced:
+                try:
+                    # Savepoint per project, so one bad row doesn't undo the batch
+                    with transaction.atomic():
+                        self.sync_repository_languages(
+                            result.project, session=session, force=force
+                        )
+                        self.sync_repository_topics(result.project, session=session)
+                except Exception as e:
+                    result.error = f"Unable to sync project: {str(e)}"
+
+    def import_repositories(
+        self,
+        repositories: Iterable,
+        user,
+        workers: int = None,
+        graphql: bool = None,
+    ) -> List[ImportResult]:
+        """
+        Creates projects for many GitHub repositories at once.
+
+        Repositories are given by URL, "owner/name" or numeric id. Ones that already
+        have a project, or are listed more than once, are reported as "exists"
+        without being fetched. The rest are fetched concurrently, through GraphQL
+        batch queries where possible and per-repository REST requests otherwise.
+        Then every project is created with one bulk_create and linked to its tech
+        stack and tags with set-based inserts, all in one transaction. A repository
+        that can't be fetched is reported as "failed" and doesn't stop the others.
+
+        Args:
+            repositories: Repository URLs, "owner/name" strings or numeric ids
+            user: The User the projects belong to
+            workers: Maximum number of concurrent GitHub fetches. Defaults to
+                    settings.GITHUB_SYNC_WORKERS.
+            graphql: Batch the fetches through GitHub's GraphQL API. Defaults to
+                    settings.GITHUB_SYNC_GRAPHQL.
+
+        Returns:
+            One ImportResult per repository, in the order they were given
+        """
+        workers = workers or getattr(settings, "GITHUB_SYNC_WORKERS", 8)
+        if graphql is None:
+            graphql = getattr(settings, "GITHUB_SYNC_GRAPHQL", True)
+
+        repositories = list(repositories)
+        results = [ImportResult(repository=str(ref)) for ref in repositories]
+        references = []
+        for result, ref in zip(results, repositories):
+            try:
+                references.append((result, self._parse_reference(ref)))
+            except ValueError as e:
+                result.status, result.error = "failed", str(e)
+
+        # Skip what's already imported before spending any GitHub requests
+        self._skip_existing(
+            [
+                (result, ref, None) if isinstance(ref, int) else (result, None, ref)
+                for result, ref in references
+            ]
+        )
+        references = [item for item in references if item[0].status == "pending"]
+
+        pairs = [ref for _, ref in references if not isinstance(ref, int)]
+        batched = self._fetch_batch(pairs) if graphql and pairs else {}
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            fetched = list(
+                executor.map(
+                    lambda item: (item[0], self._fetch_for_import(item[1], batched)),
+                    references,
+                )
+            )
+
+        imports = []
+        for result, data in fetched:
+            if isinstance(data, Exception):
+                result.status = "failed"
+                result.error = f"Unable to create project: {str(data)}"
+            else:
+                imports.append((result, data))
+
+        # The canonical identity can differ from the reference (ids, renamed
+        # repositories), so check for existing projects again
+        self._skip_existing(
+            [
+                (result, data["details"].get("id"))
+                + (tuple(repository_identity(data["details"])[1].split("/")),)
+                for result, data in imports
+            ]
+        )
+        imports = [item for item in imports if item[0].status == "pending"]
+
+        try:
+            self._create_imported(imports, user)
+        except IntegrityError as e:
+            # Another import created one of the repositories at the same time
+            for result, _ in imports:
+                result.status, result.project = "failed", None
+                result.error = f"Unable to create project: {str(e)}"
+        return results
+
+    @staticmethod
+    def _parse_reference(ref):
+        """
+        Turns a repository reference into its numeric id or lowercased (owner, name).
+
+        Raises:
+            ValueError: If the reference is neither
+        """
+        if isinstance(ref, int) and not isinstance(ref, bool):
+            return ref
+        if not isinstance(ref, str):
+            raise ValueError(f"Not a GitHub repository: {ref}")
+        if ref.strip().isdigit():
+            return int(ref)
+        owner, name = parse_github_repo_url(ref)
+        return owner.lower(), name.lower()
+
+    @staticmethod
+    def _skip_existing(candidates: List[tuple]) -> None:
+        """
+        Marks candidates whose repository already has a project, or that repeat an
+        earlier candidate, as "exists". Looks up all of them in one query.
+
+        Args:
+            candidates: (result, repo id or None, lowercased (owner, name) or None)
+        """
+        ids = {repo_id for _, repo_id, _ in candidates if repo_id is not None}
+        names = {full_name[1] for _, _, full_name in candidates if full_name}
+        projects = list(
+            Project.objects.filter(Q(github_repo_id__in=ids) | Q(github_name__in=names))
+        )
+        by_id = {
+            project.github_repo_id: project
+            for project in projects
+            if project.github_repo_id is not None
+        }
+        by_name = {project.github_repository: project for project in projects}
+
+        seen = {}
+        for result, repo_id, full_name in candidates:
+            project = by_id.get(repo_id) or by_name.get(full_name)
+            earlier = seen.get(repo_id) or seen.get(full_name)
+            if project is not None:
+                result.status, result.project = "exists", project
+            elif earlier is not None:
+                result.status = "exists"
+                result.error = f"Listed more than once, as {earlier.repository}"
+            else:
+                seen.update({key: result for key in (repo_id, full_name) if key})
+
+    def _fetch_for_import(self, reference, batched: Dict):
+        """
+        Fetches the details and languages of a repository to import.
+
+        Returns:
+            dict with "details", "etag", "languages" and "languages_etag", or the
+            exception if the repository couldn't be fetched
+        """
+        try:
+            batch_data = batched.get(reference)
+            if batch_data is not None:
+                return {**batch_data, "etag": None, "languages_etag": None}
+
+            if isinstance(reference, int):
+                details, etag = self.github_client.get_repository_by_id_if_changed(
+                    reference
+                )
+                owner, repo_name = parse_github_repo_url(details["html_url"])
+            else:
+                owner, repo_name = reference
+                details, etag = self.github_client.get_repository_details_if_changed(
+                    owner, repo_name
+                )
+            languages, languages_etag = (
+                self.github_client.get_repository_languages_if_changed(owner, repo_name)
+            )
+            return {
+                "details": details,
+                "etag": etag,
+                "languages": languages,
+                "languages_etag": languages_etag,
+            }
+        except requests.exceptions.RequestException as e:
+            return e
+
+    def _create_imported(self, imports: List[tuple], user) -> None:
+        """
+        Creates the fetched projects and their links in one transaction.
+        """
+        if not imports:
+            return
+
+        projects = []
+        for result, data in imports:
+            project = Project(
+                user=user,
+                repo_url=data["details"]["html_url"],
+                date_created=data["details"]["created_at"],
+                status="in_development",
+                github_languages_etag=data["languages_etag"] or "",
+            )
+            self._apply_repository_data(project, data["details"], data["etag"])
+            result.status, result.project = "created", project
+            projects.append(project)
+
+        with transaction.atomic():
+            Project.objects.bulk_create(projects)
+            bump_generations(Project)
+            self._bulk_link(
+                ProjectTechStack,
+                TechStack,
+                "tech_stack",
+                [
+                    (project, self._named_shares(data["languages"]))
+                    for project, (_, data) in zip(projects, imports)
+                ],
+            )
+            self._bulk_link(
+                ProjectTag,
+                Tag,
+                "tag",
+                [
+                    (
+                        project,
+                        {topic.title(): {} for topic in data["details"]["topics"]},
+                    )
+                    for project, (_, data) in zip(projects, imports)
+                ],
+            )
+            # bulk_create sends no post_save signals
+            transaction.on_commit(invalidate_project_repositories)
+
+    @staticmethod
+    def _named_shares(languages: Dict[str, int]) -> Dict[str, Dict]:
+        # language_shares keyed by the languages' names as GitHub spells them
+        shares = language_shares(languages)
+        return {name: shares[name.lower()] for name in languages}
 
-    def _get_repo_info(self, repo_url: str) -> tuple[str, str]:
+    def _bulk_link(
+        self, through_model, model, field_name: str, links: List[tuple]
+    ) -> None:
         """
-        Extracts owner and repository name from GitHub URL.
+        Links new projects to named rows (such as languages or topics) with one
+        lookup, one insert of missing rows and one insert of links.
+
+        Args:
+            links: (project, {name: extra through row fields}) pairs
         """
-        repo_parts = repo_url.split("/")
-        return repo_parts[-2], repo_parts[-1]
+        targets = {
+            target.name.lower(): target
+            for target in self._get_or_create_named(
+                model, [name for _, names in links for name in names]
+            )
+        }
+        rows = {}
+        for project, names in links:
+            for name, values in names.items():
+                target = targets[name.lower()]
+                rows[(project.id, target.id)] = through_model(
+                    project=project, **{field_name: target}, **values, synced=True
+                )
+        through_model.objects.bulk_create(rows.values(), batch_size=500)
+        bump_generations(through_model)
+
+    # Webhook events whose payloads carry enough repository data to sync from
+    WEBHOOK_EVENTS = {"repository", "push", "release"}
 
-    def sync_repository_languages(self, project: Project) -> None:
+    def apply_webhook_event(self, event: GitHubWebhookEvent) -> Optional[Project]:
+        """
+        Applies a stored GitHub webhook event to the matching project.
+
+        The repository block in repository, push and release payloads has the same
+        fields as GET /repos/{owner}/{repo}, so the project is updated straight from
+        the payload without any API calls. Topics are reconciled for repository
+        events. A rename updates the project's repo_url. Languages aren't in any
+        payload; they are picked up by the next regular sync, since the sync
+        watermarks are left as they were and no longer match the repository's
+        updated_at/pushed_at.
+
+        GitHub doesn't guarantee delivery order, so a payload whose repository isn't
+        newer than the data the project already holds is skipped.
+
+        Args:
+            event: The recorded webhook event
+
+        Returns:
+            The updated Project, or None if the event doesn't concern any project or
+            is out of date
+        """
+        if event.event not in self.WEBHOOK_EVENTS:
+            return None
+
+        repo_data = event.payload.get("repository") or {}
+        html_url = repo_data.get("html_url")
+        if not html_url:
+            return None
+
+        # Route by the numeric id first, which survives renames and transfers, then
+        # by the current name, and for renames by the previous name
+        repo_id, full_name = repository_identity(repo_data)
+        project = self.find_project(*full_name.split("/"), repo_id=repo_id)
+        if (
+            project is None
+            and event.event == "repository"
+            and event.action == "renamed"
+        ):
+            old_name = event.payload["changes"]["repository"]["name"]["from"]
+            project = self.find_project(repo_data["owner"]["login"], old_name)
+        if project is None or not self._is_newer_delivery(project, repo_data):
+            return None
+
+        with transaction.atomic():
+            update_fields = self._apply_repository_data(
+                project, repo_data, watermarks=False
+            )
+            if project.repo_url != html_url:
+                project.repo_url = html_url
+                update_fields.append("repo_url")
+            project.save(update_fields=update_fields)
+
+            if event.event == "repository" and "topics" in repo_data:
+                tags = self._get_or_create_named(
+                    Tag, [topic.title() for topic in repo_data["topics"]]
+                )
+                self._reconcile_links(project, ProjectTag, "tag", tags)
+
+        return project
+
+    @staticmethod
+    def _is_newer_delivery(project: Project, repo_data: Dict) -> bool:
+        """
+        Whether a webhook payload's repository moved forward from what the project
+        holds, from a sync or an earlier delivery: its updated_at or pushed_at is
+        newer, and neither is older.
+        """
+        stored = {
+            "updated_at": (
+                project.github_updated_at,
+                project.github_webhook_updated_at,
+            ),
+            "pushed_at": (project.github_pushed_at, project.github_webhook_pushed_at),
+        }
+        newer = False
+        for field, values in stored.items():
+            value = _as_datetime(repo_data.get(field))
+            if value is None:
+                continue
+            seen = max((_as_datetime(v) for v in values if v is not None), default=None)
+            if seen is not None and value < seen:
+                return False
+            if seen is None or value > seen:
+                newer = True
+        return newer
+
+    def refresh_project(self, project: Project, force: bool = False) -> Project:
+        """
+        Syncs a project's fields, tech stack and tags with GitHub in one session.
+
+        The repository details are fetched once and shared by the field and topic
+        steps, so a full refresh costs at most one details and one languages request.
+        If the repository hasn't changed since the last sync, the refresh stops after
+        the details request without writing anything.
+
+        Args:
+            project: The Project instance to synchronize with GitHub
+            force: Ignore the stored watermarks and apply the GitHub data regardless
+
+        Returns:
+            The updated Project instance
+        """
+        session = self.session()
+        try:
+            changed = self._sync_project_fields(project, session, force)
+        except requests.exceptions.RequestException as e:
+            raise GitHubRequestError(f"Unable to sync project: {str(e)}") from e
+
+        if changed:
+            self.sync_repository_languages(project, session=session, force=force)
+            self.sync_repository_topics(project, session=session)
+        return project
+
+    def sync_repository_languages(
+        self, project: Project, session: SyncSession = None, force: bool = False
+    ) -> None:
         """
         Syncs GitHub repository languages with project TechStack items.
+
+        The project's tech stack is reconciled with the repository's languages:
+        missing TechStack rows are created, new links are added, the byte count and
+        percentage share of existing links are updated and links the sync added for
+        languages GitHub no longer reports are removed, all set-based in one
+        transaction. Links added in the CMS are kept. Nothing is
+        written if the languages still match the ETag stored by the previous sync.
         """
-        owner, repo_name = self._get_repo_info(project.repo_url)
-        languages = self.github_client.get_repository_languages(owner, repo_name)
+        owner, repo_name = project.github_repository
+        languages, etag = self._source(session).get_repository_languages_if_changed(
+            owner, repo_name, None if force else project.github_languages_etag or None
+        )
+        if languages is None:
+            return
 
-        # Create TechStack items and link them to project
-        for language in languages.keys():
-            tech_stack = TechStack.objects.filter(name__iexact=language).first()
-            if not tech_stack:
-                tech_stack = TechStack.objects.create(name=language)
-            project.tech_stack.add(tech_stack)
+        shares = language_shares(languages)
+        with transaction.atomic():
+            tech_stack = self._get_or_create_named(TechStack, languages.keys())
+            self._reconcile_links(
+                project,
+                ProjectTechStack,
+                "tech_stack",
+                tech_stack,
+                values={
+                    language.id: shares[language.name.lower()]
+                    for language in tech_stack
+                },
+            )
 
-    def sync_repository_topics(self, project: Project) -> None:
+            if etag and etag != project.github_languages_etag:
+                project.github_languages_etag = etag
+                project.save(update_fields=["github_languages_etag"])
+
+    def sync_repository_topics(
+        self, project: Project, session: SyncSession = None
+    ) -> None:
         """
         Syncs GitHub repository topics with project Tags.
+
+        Like sync_repository_languages, the project's tags are reconciled with the
+        repository's topics in one transaction, removing the tags the sync added for
+        dropped topics and keeping the ones added in the CMS.
+        """
+        owner, repo_name = project.github_repository
+        repo_data = self._source(session).get_repository_details(owner, repo_name)
+
+        with transaction.atomic():
+            tags = self._get_or_create_named(
+                Tag, [topic.title() for topic in repo_data["topics"]]
+            )
+            self._reconcile_links(project, ProjectTag, "tag", tags)
+
+    def _get_or_create_named(self, model, names: Iterable[str]) -> List:
+        """
+        Resolves names to model rows case-insensitively, creating the missing ones.
+
+        Existing rows are looked up in a single query and the missing ones are
+        inserted with one bulk_create. Conflicts from concurrent syncs creating the
+        same name are ignored, and the rows are read back afterwards.
         """
-        owner, repo_name = self._get_repo_info(project.repo_url)
-        repo_data = self.github_client.get_repository_details(owner, repo_name)
+        wanted = {}
+        for name in names:
+            wanted.setdefault(name.lower(), name)
+        if not wanted:
+            return []
+
+        def lookup(keys):
+            # Served by the lower(name) index; no ORDER BY needed
+            return {
+                obj.name.lower(): obj
+                for obj in model.objects.annotate(lower_name=Lower("name"))
+                .filter(lower_name__in=keys)
+                .order_by()
+            }
+
+        found = lookup(list(wanted))
+        missing = [key for key in wanted if key not in found]
+        if missing:
+            model.objects.bulk_create(
+                [model(name=wanted[key]) for key in missing], ignore_conflicts=True
+            )
+            bump_generations(model)
+            found.update(lookup(missing))
+
+        return list(found.values())
+
+    def _reconcile_links(
+        self,
+        project: Project,
+        through_model,
+        field_name: str,
+        targets: List,
+        values: Dict[int, Dict] = None,
+    ) -> None:
+        """
+        Makes a project's synced through rows match targets with at most one insert,
+        one update and one delete.
+
+        Rows the sync adds are marked synced, and only those are removed once their
+        target is no longer reported; links added in the CMS stay.
+
+        Args:
+            values: Optional extra fields for each target's through row, keyed by
+                   target id. Existing rows are only updated if one of them changed.
+        """
+        fk_name = f"{field_name}_id"
+        values = values or {}
+        fields = sorted({field for row in values.values() for field in row})
+        target_ids = {target.id for target in targets}
+        current = {
+            row[fk_name]: row
+            for row in through_model.objects.filter(project=project).values(
+                "id", "synced", fk_name, *fields
+            )
+        }
+
+        added = target_ids - current.keys()
+        if added:
+            through_model.objects.bulk_create(
+                [
+                    through_model(
+                        project=project,
+                        **{fk_name: pk},
+                        **values.get(pk, {}),
+                        synced=True,
+                    )
+                    for pk in added
+                ],
+                ignore_conflicts=True,
+            )
+
+        changed = [
+            through_model(id=current[pk]["id"], **values[pk])
+            for pk in target_ids & current.keys()
+            if any(
+                current[pk][field] != value
+                for field, value in values.get(pk, {}).items()
+            )
+        ]
+        if changed:
+            through_model.objects.bulk_update(changed, fields)
+
+        removed = {pk for pk in current.keys() - target_ids if current[pk]["synced"]}
+        if removed:
+            through_model.objects.filter(
+                project=project, **{f"{fk_name}__in": removed}
+            ).delete()
 
-        # Create Tags and link them to project
-        for topic in repo_data["topics"]:
-            formatted_name = topic.title()
-            tag = Tag.objects.filter(name__iexact=formatted_name).first()
-            if not tag:
-                tag = Tag.objects.create(name=formatted_name)
-            project.tag.add(tag)
+        if added or changed or removed:
+            # None of these writes send signals
+            bump_generations(through_model)
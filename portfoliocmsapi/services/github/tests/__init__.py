@@ -1,2 +1,10 @@
 from .test_client import *
 from .test_sync import *
+from .test_rate_limit import *
+from .test_async_client import *
+from .test_repository_cache import *
+from .test_single_flight import *
+from .test_transport import *
+from .test_graphql import *
+from .test_fake_server import *
+from .test_import import *
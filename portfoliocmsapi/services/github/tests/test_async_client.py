@@ -0,0 +1,143 @@
+import asyncio
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import pytest
+import requests
+from django.contrib.auth.models import User
+from portfoliocmsapi.projects.models import Project
+from portfoliocmsapi.services.github.async_client import AsyncGitHubClient
+from portfoliocmsapi.services.github.cache import InMemoryConditionalCache
+from portfoliocmsapi.services.github.client import GitHubClient
+from portfoliocmsapi.services.github.dev import FakeGitHubServer
+from portfoliocmsapi.services.github.sync import GitHubSyncService
+
+
+class _StubGitHubHandler(BaseHTTPRequestHandler):
+    """Answers repository requests after a fixed delay, tracking concurrency"""
+
+    def do_GET(self):
+        server = self.server
+        with server.lock:
+            server.in_flight += 1
+            server.max_in_flight = max(server.max_in_flight, server.in_flight)
+        try:
+            time.sleep(server.delay)
+            if "missing" in self.path:
+                self._respond(404, {"message": "Not Found"})
+            elif self.path.endswith("/languages"):
+                self._respond(200, {"Python": 1000})
+            elif self.path.startswith("/user/repos"):
+                self._respond(200, [{"name": "repo1"}, {"name": "repo2"}])
+            else:
+                self._respond(200, {"name": self.path.rsplit("/", 1)[-1]})
+        finally:
+            with server.lock:
+                server.in_flight -= 1
+
+    def _respond(self, status, body):
+        payload = json.dumps(body).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def log_message(self, *args):
+        pass
+
+
+class TestAsyncGitHubClient:
+    def setup_method(self):
+        """Starts a local stand-in for the GitHub API with a 50ms response time"""
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), _StubGitHubHandler)
+        self.server.delay = 0.05
+        self.server.lock = threading.Lock()
+        self.server.in_flight = 0
+        self.server.max_in_flight = 0
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+
+        host, port = self.server.server_address
+        self.github_client = GitHubClient(
+            cache=InMemoryConditionalCache(), base_url=f"http://{host}:{port}"
+        )
+
+    def teardown_method(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+    def test_fan_out_is_concurrent_and_bounded(self):
+        """Tests that fan-out overlaps requests without exceeding max_concurrency"""
+        async_client = AsyncGitHubClient(self.github_client, max_concurrency=4)
+        repositories = [("owner", f"repo{i}") for i in range(8)]
+
+        started = time.monotonic()
+        results = asyncio.run(async_client.fetch_repositories(repositories))
+        elapsed = time.monotonic() - started
+        async_client.close()
+
+        assert [result["details"]["name"] for result in results] == [
+            f"repo{i}" for i in range(8)
+        ]
+        assert all(result["languages"] == {"Python": 1000} for result in results)
+        # 16 requests at 50ms each take 800ms serially, and 200ms four at a time
+        assert elapsed < 0.6
+        assert 1 < self.server.max_in_flight <= 4
+
+    def test_fan_out_reports_errors_per_repository(self):
+        """Tests that one failing repository doesn't fail the whole batch"""
+        async_client = AsyncGitHubClient(self.github_client, max_concurrency=2)
+
+        results = asyncio.run(
+            async_client.fetch_repositories([("owner", "repo1"), ("owner", "missing")])
+        )
+        async_client.close()
+
+        assert results[0]["details"] == {"name": "repo1"}
+        assert isinstance(results[1]["error"], requests.exceptions.HTTPError)
+
+    def test_single_request_errors_propagate(self):
+        """Tests that awaiting a failed request raises the client's exception"""
+        async_client = AsyncGitHubClient(self.github_client, max_concurrency=2)
+
+        with pytest.raises(requests.exceptions.HTTPError):
+            asyncio.run(async_client.get_repository_details("owner", "missing"))
+        async_client.close()
+
+    def test_iter_repositories(self):
+        """Tests streaming repositories from async code"""
+        async_client = AsyncGitHubClient(self.github_client, max_concurrency=2)
+
+        repos = asyncio.run(async_client.get_all_repositories())
+        async_client.close()
+
+        assert [repo["name"] for repo in repos] == ["repo1", "repo2"]
+
+    def test_sync_projects_fans_out_through_the_async_client(self, db):
+        """Tests that a bulk sync overlaps its REST requests up to its workers"""
+        user = User.objects.create_user(username="testuser", password="testpass")
+        with FakeGitHubServer.synthetic(16, latency=0.05) as server:
+            projects = [
+                Project.objects.create(
+                    user=user,
+                    title=repo["name"],
+                    description="",
+                    repo_url=repo["html_url"],
+                    date_created=repo["created_at"],
+                    last_update=repo["created_at"],
+                )
+                for repo in server.repositories.values()
+            ]
+            sync_service = GitHubSyncService(
+                GitHubClient(cache=InMemoryConditionalCache(), base_url=server.url)
+            )
+
+            started = time.monotonic()
+            results = sync_service.sync_projects(projects, workers=8, graphql=False)
+            elapsed = time.monotonic() - started
+
+        assert all(result.ok and result.changed for result in results)
+        assert server.metrics()["requests"] == 32
+        # 32 requests at 50ms each take 1.6s one at a time
+        assert elapsed < 1.0
@@ -1,7 +1,16 @@
 import pytest
 from django.conf import settings
-from unittest.mock import patch
+import requests
+from unittest.mock import Mock, patch
+from portfoliocmsapi.services.github.cache import (
+    FileConditionalCache,
+    InMemoryConditionalCache,
+)
 from portfoliocmsapi.services.github.client import GitHubClient
+from portfoliocmsapi.services.github.registry import (
+    get_github_client,
+    reset_github_clients,
+)
 
 
 class TestGitHubClient:
@@ -39,6 +48,8 @@ class TestGitHubClient:
         ]
         mock_get.return_value.json.return_value = mock_repos
         mock_get.return_value.status_code = 200
+        mock_get.return_value.headers = {}
+        mock_get.return_value.links = {}
 
         repos = self.client.get_all_repositories()
 
@@ -47,6 +58,64 @@ class TestGitHubClient:
         assert "topics" in repos[0]
         assert "language" in repos[0]
 
+    def _paginated_get(self, pages):
+        """
+        Builds a Session.get side effect that serves `pages` with GitHub-style links.
+        """
+        base = f"{self.client.base_url}/user/repos?per_page=100"
+
+        def mock_response(url, *args, **kwargs):
+            page = self.client._get_page_number(url) if "page=" in url else 1
+            mock = Mock()
+            mock.status_code = 200
+            mock.headers = {}
+            mock.json.return_value = pages[page - 1]
+            mock.links = {"last": {"url": f"{base}&page={len(pages)}"}}
+            if page < len(pages):
+                mock.links["next"] = {"url": f"{base}&page={page + 1}"}
+            return mock
+
+        return mock_response
+
+    @patch("requests.Session.get")
+    def test_iter_repositories_follows_next_links(self, mock_get):
+        """Tests that every page is fetched by following Link: rel="next" headers"""
+        pages = [[{"name": f"repo{p}-{i}"} for i in range(3)] for p in range(1, 4)]
+        mock_get.side_effect = self._paginated_get(pages)
+
+        repos = list(self.client.iter_repositories(concurrency=1))
+
+        assert [repo["name"] for repo in repos] == [
+            repo["name"] for page in pages for repo in page
+        ]
+        assert mock_get.call_count == 3
+
+    @patch("requests.Session.get")
+    def test_iter_repositories_stops_early(self, mock_get):
+        """Tests that later pages aren't requested once the caller stops consuming"""
+        pages = [[{"name": f"repo{p}-{i}"} for i in range(3)] for p in range(1, 4)]
+        mock_get.side_effect = self._paginated_get(pages)
+
+        repos = self.client.iter_repositories(concurrency=1)
+        first = [next(repos) for _ in range(2)]
+        repos.close()
+
+        assert [repo["name"] for repo in first] == ["repo1-0", "repo1-1"]
+        assert mock_get.call_count == 1
+
+    @patch("requests.Session.get")
+    def test_iter_repositories_concurrently_keeps_page_order(self, mock_get):
+        """Tests that parallel page fetches still yield repositories in page order"""
+        pages = [[{"name": f"repo{p}-{i}"} for i in range(2)] for p in range(1, 7)]
+        mock_get.side_effect = self._paginated_get(pages)
+
+        repos = list(self.client.iter_repositories(concurrency=3))
+
+        assert [repo["name"] for repo in repos] == [
+            repo["name"] for page in pages for repo in page
+        ]
+        assert mock_get.call_count == 6
+
     @patch("requests.Session.get")
     def test_get_repository_details(self, mock_get):
         """Tests fetching detailed information about a specific repository"""
@@ -62,6 +131,8 @@ class TestGitHubClient:
 
         mock_get.return_value.json.return_value = mock_repo_data
         mock_get.return_value.status_code = 200
+        mock_get.return_value.headers = {}
+        mock_get.return_value.links = {}
 
         repo = self.client.get_repository_details(self.test_owner, self.test_repo)
 
@@ -77,6 +148,8 @@ class TestGitHubClient:
         mock_languages = {"Python": 33495, "Shell": 248}
         mock_get.return_value.json.return_value = mock_languages
         mock_get.return_value.status_code = 200
+        mock_get.return_value.headers = {}
+        mock_get.return_value.links = {}
 
         languages = self.client.get_repository_languages(
             self.test_owner, self.test_repo
@@ -85,7 +158,9 @@ class TestGitHubClient:
         assert languages == mock_languages
         mock_get.assert_called_once_with(
             f"{self.client.base_url}/repos/{self.test_owner}/{self.test_repo}/languages",
-            headers=self.client.session.headers,
+            headers=None,
+            params=None,
+            timeout=self.client.transport.timeout,
         )
 
     @patch("requests.Session.get")
@@ -98,6 +173,8 @@ class TestGitHubClient:
         }
         mock_get.return_value.json.return_value = mock_rate_limit
         mock_get.return_value.status_code = 200
+        mock_get.return_value.headers = {}
+        mock_get.return_value.links = {}
 
         rate_limit = self.client.check_rate_limit()
 
@@ -105,7 +182,144 @@ class TestGitHubClient:
         assert "core" in rate_limit["resources"]
         assert rate_limit["resources"]["core"]["remaining"] > 0
 
-    def test_invalid_token(self):
+    @patch("requests.Session.get")
+    def test_client_initialization_makes_no_requests(self, mock_get):
+        """Tests that creating a client doesn't call GitHub"""
+        GitHubClient(access_token="some_token")
+
+        mock_get.assert_not_called()
+
+    @patch("requests.Session.get")
+    def test_invalid_token(self, mock_get):
         """Tests that the client handles authentication errors appropriately"""
+        mock_get.return_value.raise_for_status.side_effect = (
+            requests.exceptions.HTTPError("401 Client Error: Unauthorized")
+        )
+        client = GitHubClient(access_token="invalid_token")
+
         with pytest.raises(ValueError):
-            GitHubClient(access_token="invalid_token")
+            client.verify_token()
+        assert not client.token_verified
+
+    @patch("requests.Session.get")
+    def test_verify_token_is_cached(self, mock_get):
+        """Tests that a successful token check is reused until its TTL expires"""
+        mock_get.return_value.status_code = 200
+        mock_get.return_value.headers = {}
+        mock_get.return_value.links = {}
+        client = GitHubClient(access_token="valid_token", token_ttl=60)
+
+        client.verify_token()
+        client.verify_token()
+
+        assert mock_get.call_count == 1
+        assert client.token_verified
+
+        # Forcing a check, or letting the TTL lapse, goes back to GitHub
+        client.verify_token(force=True)
+        assert mock_get.call_count == 2
+
+        client.token_ttl = 0
+        client.verify_token()
+        assert mock_get.call_count == 3
+
+    def test_registry_reuses_clients(self):
+        """Tests that the registry hands out one shared client per token"""
+        reset_github_clients()
+        try:
+            first = get_github_client("token_a")
+            assert get_github_client("token_a") is first
+            assert get_github_client("token_b") is not first
+        finally:
+            reset_github_clients()
+
+
+class TestConditionalRequestCache:
+    def setup_method(self):
+        self.cache = InMemoryConditionalCache()
+        self.client = GitHubClient(access_token="test_token", cache=self.cache)
+        self.url = f"{self.client.base_url}/repos/jeremywhitney/portfolio-cms_api"
+
+    def _response(self, status_code, body=None, etag=None):
+        mock = Mock()
+        mock.status_code = status_code
+        mock.headers = {"ETag": etag} if etag else {}
+        mock.links = {}
+        mock.json.return_value = body
+        return mock
+
+    @patch("requests.Session.get")
+    def test_not_modified_response_serves_cached_body(self, mock_get):
+        """Tests that a 304 reuses the stored body and counts as a cache hit"""
+        repo = {"name": "portfolio-cms_api", "topics": ["django"]}
+        mock_get.side_effect = [
+            self._response(200, repo, etag='"abc"'),
+            self._response(304),
+        ]
+
+        first = self.client.get_repository_details("jeremywhitney", "portfolio-cms_api")
+        second = self.client.get_repository_details(
+            "jeremywhitney", "portfolio-cms_api"
+        )
+
+        assert first == second == repo
+        assert mock_get.call_args_list[1].kwargs["headers"]["If-None-Match"] == '"abc"'
+        assert self.cache.stats()["hits"] == 1
+        assert self.cache.stats()["misses"] == 1
+
+    @patch("requests.Session.get")
+    def test_changed_response_replaces_cached_body(self, mock_get):
+        """Tests that a 200 with a new ETag overwrites the stored entry"""
+        mock_get.side_effect = [
+            self._response(200, {"Python": 100}, etag='"v1"'),
+            self._response(200, {"Python": 200}, etag='"v2"'),
+        ]
+
+        self.client.get_repository_languages("jeremywhitney", "portfolio-cms_api")
+        languages = self.client.get_repository_languages(
+            "jeremywhitney", "portfolio-cms_api"
+        )
+
+        assert languages == {"Python": 200}
+        assert self.cache.get(f"{self.url}/languages").etag == '"v2"'
+        assert self.cache.stats()["misses"] == 2
+
+    def test_memory_cache_evicts_least_recently_used(self):
+        """Tests that the in-memory backend stays within its size limit"""
+        cache = InMemoryConditionalCache(max_bytes=40)
+        cache.set("a", '"1"', "x" * 15)
+        cache.set("b", '"2"', "y" * 15)
+        cache.get("a")  # "a" is now the most recently used entry
+        cache.set("c", '"3"', "z" * 15)
+
+        assert cache.get("a") is not None
+        assert cache.get("b") is None
+        assert cache.get("c") is not None
+        assert cache.stats()["evictions"] == 1
+
+    def test_file_cache_round_trip_and_eviction(self, tmp_path):
+        """Tests that the on-disk backend persists entries and evicts by size"""
+        cache = FileConditionalCache(tmp_path, max_bytes=1024)
+        cache.set("repo", '"abc"', {"name": "repo"}, links={"next": {"url": "u"}})
+
+        # A second instance over the same directory sees the stored entry
+        entry = FileConditionalCache(tmp_path, max_bytes=1024).get("repo")
+        assert entry.etag == '"abc"'
+        assert entry.json() == {"name": "repo"}
+        assert entry.links == {"next": {"url": "u"}}
+
+        cache.set("big", '"big"', "x" * 1000)
+        assert cache.stats()["bytes"] <= 1024
+
+    @patch("requests.Session.get")
+    def test_if_changed_returns_none_for_known_etag(self, mock_get):
+        """Tests that a 304 for the caller's own ETag reports the repo as unchanged"""
+        mock_get.return_value = self._response(304)
+
+        repo_data, etag = self.client.get_repository_details_if_changed(
+            "jeremywhitney", "portfolio-cms_api", etag='"stored"'
+        )
+
+        assert repo_data is None
+        assert etag == '"stored"'
+        assert mock_get.call_args.kwargs["headers"]["If-None-Match"] == '"stored"'
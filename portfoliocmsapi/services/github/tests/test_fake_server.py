@@ -0,0 +1,154 @@
+import time
+from pathlib import Path
+import pytest
+import requests
+from django.contrib.auth.models import User
+from portfoliocmsapi.projects.models import Project
+from portfoliocmsapi.services.github.cache import InMemoryConditionalCache
+from portfoliocmsapi.services.github.client import GitHubClient
+from portfoliocmsapi.services.github.dev import (
+    FakeGitHubServer,
+    generate_repositories,
+)
+from portfoliocmsapi.services.github.rate_limit import (
+    RateLimitExceeded,
+    RateLimitScheduler,
+)
+from portfoliocmsapi.services.github.sync import GitHubSyncService
+
+RECORDING = Path(__file__).parent / "fixtures" / "github_recording.json"
+
+
+class TestFakeGitHubServer:
+    def make_client(self, server, **kwargs):
+        return GitHubClient(
+            cache=InMemoryConditionalCache(), base_url=server.url, **kwargs
+        )
+
+    def test_replays_recorded_fixtures(self):
+        """Tests that recorded repositories and languages are served as REST"""
+        with FakeGitHubServer.from_fixtures(RECORDING) as server:
+            client = self.make_client(server)
+            client.verify_token()
+
+            repos = client.get_all_repositories()
+            languages = client.get_repository_languages(
+                "jeremywhitney", "portfolio-cms_api"
+            )
+
+        assert [repo["name"] for repo in repos] == [
+            "portfolio-cms_api",
+            "portfolio-cms_client",
+        ]
+        assert "languages" not in repos[0]
+        assert languages == {"Python": 33495, "Shell": 1200}
+
+    def test_paginates_synthetic_repositories(self):
+        """Tests that thousands of repositories are paged with Link headers"""
+        with FakeGitHubServer.synthetic(2500) as server:
+            client = self.make_client(server)
+
+            repos = list(client.iter_repositories(concurrency=4))
+
+            assert len(repos) == 2500
+            assert len({repo["name"] for repo in repos}) == 2500
+            # 100 repositories per page
+            assert server.metrics()["requests"] == 25
+
+    def test_synthetic_repositories_are_repeatable(self):
+        """Tests that the same seed generates the same repositories"""
+        assert generate_repositories(50, seed=3) == generate_repositories(50, seed=3)
+        assert generate_repositories(50, seed=3) != generate_repositories(50, seed=4)
+
+    def test_etags_make_unchanged_requests_free(self):
+        """Tests that conditional requests get a 304 that costs no quota"""
+        with FakeGitHubServer.from_fixtures(RECORDING) as server:
+            client = self.make_client(server)
+
+            client.get_repository_details("jeremywhitney", "portfolio-cms_api")
+            client.get_repository_details("jeremywhitney", "portfolio-cms_api")
+            assert server.metrics()["not_modified"] == 1
+            assert server.metrics()["quota_used"] == 1
+
+            server.touch("jeremywhitney/portfolio-cms_api", description="Changed")
+            repo = client.get_repository_details("jeremywhitney", "portfolio-cms_api")
+
+            assert repo["description"] == "Changed"
+            assert server.metrics()["quota_used"] == 2
+
+    def test_rate_limit_headers_and_exhaustion(self):
+        """Tests that the quota is reported in headers and enforced with a 403"""
+        with FakeGitHubServer.from_fixtures(RECORDING, rate_limit=2) as server:
+            client = self.make_client(
+                server, rate_limiter=RateLimitScheduler(reserve=0, max_retries=0)
+            )
+
+            client.get_repository_details("jeremywhitney", "portfolio-cms_api")
+            assert client.rate_limit_metrics()["remaining"] == 1
+            client.get_repository_languages("jeremywhitney", "portfolio-cms_api")
+
+            # The scheduler sees the exhausted quota and refuses to wait an hour
+            with pytest.raises(RateLimitExceeded):
+                client.get_repository_languages("jeremywhitney", "portfolio-cms_client")
+
+            response = requests.get(
+                f"{server.url}/repos/jeremywhitney/portfolio-cms_client"
+            )
+            assert response.status_code == 403
+            assert response.headers["X-RateLimit-Remaining"] == "0"
+            assert server.metrics()["rate_limited"] == 1
+
+    def test_latency(self):
+        """Tests that every response is delayed by the configured latency"""
+        with FakeGitHubServer.from_fixtures(RECORDING, latency=0.1) as server:
+            client = self.make_client(server)
+
+            started = time.monotonic()
+            client.get_repository_details("jeremywhitney", "portfolio-cms_api")
+
+            assert time.monotonic() - started >= 0.1
+
+    def test_kept_alive_connections_add_no_latency(self):
+        """Tests that responses on a reused connection don't wait on delayed ACKs"""
+        with FakeGitHubServer.from_fixtures(RECORDING) as server:
+            with requests.Session() as session:
+                url = f"{server.url}/repos/jeremywhitney/portfolio-cms_api"
+                session.get(url)
+
+                started = time.monotonic()
+                for _ in range(20):
+                    session.get(url)
+
+                # Unbuffered, each request stalled for ~40ms
+                assert time.monotonic() - started < 0.4
+
+    def test_sync_against_fake_server(self, db, django_assert_max_num_queries):
+        """Tests a bulk sync end to end, with its quota use and query count"""
+        user = User.objects.create_user(username="testuser", password="testpass")
+        with FakeGitHubServer.synthetic(20, owner="jeremywhitney") as server:
+            projects = [
+                Project.objects.create(
+                    user=user,
+                    title=repo["name"],
+                    description="",
+                    repo_url=repo["html_url"],
+                    date_created=repo["created_at"],
+                    last_update=repo["created_at"],
+                )
+                for repo in server.repositories.values()
+            ]
+            sync_service = GitHubSyncService(self.make_client(server))
+
+            # Current cost of the per-project writes; keeps regressions visible
+            with django_assert_max_num_queries(300):
+                results = sync_service.sync_projects(projects, graphql=False)
+
+            assert all(result.ok and result.changed for result in results)
+            # One details and one languages request per repository
+            assert server.metrics()["quota_used"] == 40
+
+            server.reset_metrics()
+            results = sync_service.sync_projects(projects, graphql=False)
+
+            assert not any(result.changed for result in results)
+            assert server.metrics()["quota_used"] == 0
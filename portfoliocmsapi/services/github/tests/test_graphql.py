@@ -0,0 +1,176 @@
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from unittest.mock import patch
+from django.contrib.auth.models import User
+from portfoliocmsapi.projects.models import Project
+from portfoliocmsapi.services.github.cache import InMemoryConditionalCache
+from portfoliocmsapi.services.github.client import GitHubClient
+from portfoliocmsapi.services.github.sync import GitHubSyncService
+
+RECORDED_GRAPHQL = json.loads(
+    (Path(__file__).parent / "fixtures" / "graphql_repositories.json").read_text()
+)
+
+REST_RESPONSES = {
+    "/repos/jeremywhitney/another-project": {
+        "name": "another-project",
+        "description": "Another project",
+        "html_url": "https://github.com/jeremywhitney/another-project",
+        "created_at": "2024-01-03T00:00:00Z",
+        "updated_at": "2024-03-04T00:00:00Z",
+        "pushed_at": "2024-03-04T00:00:00Z",
+        "topics": ["web"],
+    },
+    "/repos/jeremywhitney/another-project/languages": {"JavaScript": 5000},
+    "/repos/jeremywhitney/portfolio-cms_api": {
+        "name": "portfolio-cms_api",
+        "description": "My portfolio CMS",
+        "html_url": "https://github.com/jeremywhitney/portfolio-cms_api",
+        "created_at": "2024-01-01T00:00:00Z",
+        "updated_at": "2024-03-02T00:00:00Z",
+        "pushed_at": "2024-03-01T00:00:00Z",
+        "topics": ["portfolio", "django"],
+    },
+    "/repos/jeremywhitney/portfolio-cms_api/languages": {
+        "Python": 33495,
+        "Shell": 1200,
+    },
+}
+
+
+class _GitHubStandInHandler(BaseHTTPRequestHandler):
+    """Replays the recorded GraphQL response and serves REST fallbacks"""
+
+    def do_POST(self):
+        length = int(self.headers["Content-Length"])
+        self.server.requests.append(
+            ("POST", self.path, json.loads(self.rfile.read(length)))
+        )
+        if self.server.graphql_status != 200:
+            self._respond(self.server.graphql_status, {"message": "Server Error"})
+        else:
+            self._respond(200, RECORDED_GRAPHQL)
+
+    def do_GET(self):
+        self.server.requests.append(("GET", self.path, None))
+        if self.path in REST_RESPONSES:
+            self._respond(200, REST_RESPONSES[self.path])
+        else:
+            self._respond(404, {"message": "Not Found"})
+
+    def _respond(self, status, body):
+        payload = json.dumps(body).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def log_message(self, *args):
+        pass
+
+
+class TestGraphQLBatchFetch:
+    def setup_method(self):
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), _GitHubStandInHandler)
+        self.server.requests = []
+        self.server.graphql_status = 200
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+
+        host, port = self.server.server_address
+        self.github_client = GitHubClient(
+            cache=InMemoryConditionalCache(), base_url=f"http://{host}:{port}"
+        )
+        self.sync_service = GitHubSyncService(github_client=self.github_client)
+
+    def teardown_method(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+    def create_projects(self):
+        user = User.objects.create_user(username="testuser", password="testpass")
+        return [
+            Project.objects.create(
+                user=user,
+                title=repo,
+                description="",
+                repo_url=f"https://github.com/jeremywhitney/{repo}",
+                date_created="2024-01-01T00:00:00Z",
+                last_update="2024-01-02T00:00:00Z",
+            )
+            for repo in ("portfolio-cms_api", "another-project")
+        ]
+
+    def test_batch_returns_rest_shaped_payloads(self):
+        """Tests that one query returns details, languages and topics per repo"""
+        results = self.github_client.get_repositories_batch(
+            [
+                ("jeremywhitney", "portfolio-cms_api"),
+                ("jeremywhitney", "another-project"),
+            ]
+        )
+
+        assert list(results) == [("jeremywhitney", "portfolio-cms_api")]
+        payload = results[("jeremywhitney", "portfolio-cms_api")]
+        assert payload["details"]["html_url"] == (
+            "https://github.com/jeremywhitney/portfolio-cms_api"
+        )
+        assert payload["details"]["topics"] == ["portfolio", "django"]
+        assert payload["languages"] == {"Python": 33495, "Shell": 1200}
+
+        [(method, path, body)] = self.server.requests
+        assert (method, path) == ("POST", "/graphql")
+        assert body["variables"] == {
+            "owner0": "jeremywhitney",
+            "name0": "portfolio-cms_api",
+            "owner1": "jeremywhitney",
+            "name1": "another-project",
+        }
+
+    def test_batches_are_split_at_the_limit(self):
+        """Tests that more than 100 repositories take more than one query"""
+        pairs = [("owner", f"repo{i}") for i in range(150)]
+
+        with patch.object(self.github_client, "graphql", return_value={}) as graphql:
+            self.github_client.get_repositories_batch(pairs)
+
+        assert graphql.call_count == 2
+        assert len(graphql.call_args_list[0].args[1]) == 200
+        assert len(graphql.call_args_list[1].args[1]) == 100
+
+    def test_sync_projects_uses_batch_and_falls_back_per_repository(self, db):
+        """Tests that only repositories missing from the batch hit the REST API"""
+        projects = self.create_projects()
+
+        results = self.sync_service.sync_projects(projects, workers=2)
+
+        assert all(result.ok and result.changed for result in results)
+        rest_paths = sorted(
+            path for method, path, _ in self.server.requests if method == "GET"
+        )
+        assert rest_paths == [
+            "/repos/jeremywhitney/another-project",
+            "/repos/jeremywhitney/another-project/languages",
+        ]
+
+        batched, fallback = (Project.objects.get(id=p.id) for p in projects)
+        assert batched.description == "My portfolio CMS"
+        assert {tech.name for tech in batched.tech_stack.all()} == {"Python", "Shell"}
+        assert {tag.name for tag in batched.tag.all()} == {"Portfolio", "Django"}
+        assert {tech.name for tech in fallback.tech_stack.all()} == {"JavaScript"}
+
+    def test_sync_projects_falls_back_to_rest_when_graphql_fails(self, db):
+        """Tests that a failed batch query doesn't fail the sync"""
+        self.server.graphql_status = 502
+        projects = self.create_projects()
+
+        results = self.sync_service.sync_projects(projects, workers=2)
+
+        assert all(result.ok for result in results)
+        rest_paths = [
+            path for method, path, _ in self.server.requests if method == "GET"
+        ]
+        assert len(rest_paths) == 4
+        assert Project.objects.get(id=projects[0].id).description == "My portfolio CMS"
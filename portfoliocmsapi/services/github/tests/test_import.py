@@ -0,0 +1,101 @@
+from decimal import Decimal
+import pytest
+from django.contrib.auth.models import User
+from portfoliocmsapi.projects.models import Project, ProjectTechStack
+from portfoliocmsapi.services.github.cache import InMemoryConditionalCache
+from portfoliocmsapi.services.github.client import GitHubClient
+from portfoliocmsapi.services.github.dev import FakeGitHubServer
+from portfoliocmsapi.services.github.rate_limit import RateLimitScheduler
+from portfoliocmsapi.services.github.sync import GitHubSyncService
+
+
+class TestImportRepositories:
+    @pytest.fixture
+    def server(self):
+        with FakeGitHubServer.synthetic(30, owner="octocat") as server:
+            yield server
+
+    @pytest.fixture
+    def sync_service(self, server):
+        return GitHubSyncService(
+            GitHubClient(
+                cache=InMemoryConditionalCache(),
+                rate_limiter=RateLimitScheduler(reserve=0),
+                base_url=server.url,
+            )
+        )
+
+    @pytest.fixture
+    def user(self, db):
+        return User.objects.create_user(username="testuser", password="testpass")
+
+    def test_imports_repositories_with_links(
+        self, server, sync_service, user, django_assert_max_num_queries
+    ):
+        """
+        Tests that a whole account is imported with a fixed number of queries and
+        one GraphQL request, with languages and topics linked.
+        """
+        urls = [repo["html_url"] for repo in server.repositories.values()]
+
+        # existing lookup + savepoint + bulk insert + tech stack and tags (lookup,
+        # insert, re-read, links each)
+        with django_assert_max_num_queries(14):
+            results = sync_service.import_repositories(urls, user)
+
+        assert [result.status for result in results] == ["created"] * 30
+        assert Project.objects.filter(user=user).count() == 30
+        assert server.metrics()["requests"] == 1
+        assert server.metrics()["graphql_requests"] == 1
+
+        repo = server.repositories["octocat/repo-00007"]
+        project = results[7].project
+        assert project.github_repo_id == repo["id"]
+        assert project.github_repository == ("octocat", "repo-00007")
+        assert {
+            link.tech_stack.name: link.bytes
+            for link in ProjectTechStack.objects.filter(project=project)
+        } == server.languages["octocat/repo-00007"]
+        assert sum(
+            ProjectTechStack.objects.filter(project=project).values_list(
+                "percentage", flat=True
+            )
+        ) == pytest.approx(Decimal(100), abs=Decimal("0.05"))
+        assert {tag.name for tag in project.tag.all()} == {
+            topic.title() for topic in repo["topics"]
+        }
+
+    def test_reports_each_repository(self, server, sync_service, user):
+        """
+        Tests that existing, repeated, unknown and id references are each reported
+        without stopping the rest of the import.
+        """
+        existing = sync_service.create_project("octocat", "repo-00000", user)
+        by_id = server.repositories["octocat/repo-00002"]["id"]
+
+        results = sync_service.import_repositories(
+            [
+                "https://github.com/OctoCat/Repo-00000/",
+                "octocat/repo-00001",
+                str(by_id),
+                "https://github.com/octocat/repo-00002",
+                "https://github.com/octocat/missing",
+                "not a repository",
+            ],
+            user,
+            graphql=False,
+        )
+
+        assert [result.status for result in results] == [
+            "exists",
+            "created",
+            "created",
+            "exists",
+            "failed",
+            "failed",
+        ]
+        assert results[0].project == existing
+        assert results[2].project.github_repo_id == by_id
+        assert "more than once" in results[3].error
+        assert "404" in results[4].error
+        assert Project.objects.filter(user=user).count() == 3
@@ -0,0 +1,139 @@
+import pytest
+from unittest.mock import Mock, patch
+from portfoliocmsapi.services.github.cache import InMemoryConditionalCache
+from portfoliocmsapi.services.github.client import GitHubClient
+from portfoliocmsapi.services.github.rate_limit import (
+    RateLimitExceeded,
+    RateLimitScheduler,
+)
+
+
+class FakeClock:
+    """A clock that only moves when the scheduler sleeps"""
+
+    def __init__(self, now=1_000_000.0):
+        self.now = now
+        self.sleeps = []
+
+    def __call__(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+def make_response(status_code=200, headers=None, body=None):
+    response = Mock()
+    response.status_code = status_code
+    response.headers = headers or {}
+    response.links = {}
+    response.json.return_value = body
+    return response
+
+
+class TestRateLimitScheduler:
+    def setup_method(self):
+        self.clock = FakeClock()
+        self.scheduler = RateLimitScheduler(
+            reserve=100, max_wait=600, clock=self.clock, sleep=self.clock.sleep
+        )
+
+    def quota(self, remaining, reset_in):
+        return make_response(
+            headers={
+                "X-RateLimit-Limit": "5000",
+                "X-RateLimit-Remaining": str(remaining),
+                "X-RateLimit-Reset": str(self.clock.now + reset_in),
+            }
+        )
+
+    def test_requests_are_not_delayed_with_plenty_of_quota(self):
+        """Tests that requests go straight out while quota is above the reserve"""
+        self.scheduler.update(self.quota(remaining=4000, reset_in=3600))
+
+        for _ in range(50):
+            self.scheduler.acquire()
+
+        assert self.clock.sleeps == []
+        assert self.scheduler.metrics()["remaining"] == 3950
+
+    def test_requests_are_spread_over_the_reset_window(self):
+        """Tests that a low budget is spread evenly until the quota resets"""
+        self.scheduler.update(self.quota(remaining=10, reset_in=100))
+
+        for _ in range(3):
+            self.scheduler.acquire()
+
+        # The first request goes out immediately; the 9 left share the 100s
+        # until the reset, so each following request waits 100/9 seconds
+        assert self.clock.sleeps == pytest.approx([100 / 9, 100 / 9])
+        assert self.scheduler.metrics()["throttled_requests"] == 2
+
+    def test_exhausted_quota_waits_until_reset(self):
+        """Tests that no request is sent before an exhausted quota resets"""
+        self.scheduler.update(self.quota(remaining=0, reset_in=30))
+
+        self.scheduler.acquire()
+
+        assert self.clock.sleeps == [30]
+
+    def test_wait_longer_than_max_wait_fails(self):
+        """Tests that the scheduler refuses to block a worker for too long"""
+        self.scheduler.update(self.quota(remaining=0, reset_in=3600))
+
+        with pytest.raises(RateLimitExceeded):
+            self.scheduler.acquire()
+
+    @patch("requests.Session.get")
+    def test_client_backs_off_on_secondary_rate_limit(self, mock_get):
+        """Tests that the client honours Retry-After and retries the request"""
+        client = GitHubClient(
+            access_token="test_token",
+            cache=InMemoryConditionalCache(),
+            rate_limiter=self.scheduler,
+        )
+        mock_get.side_effect = [
+            make_response(403, headers={"Retry-After": "5"}),
+            make_response(200, body={"Python": 100}),
+        ]
+
+        languages = client.get_repository_languages(
+            "jeremywhitney", "portfolio-cms_api"
+        )
+
+        assert languages == {"Python": 100}
+        assert mock_get.call_count == 2
+        assert self.clock.sleeps == [5]
+        assert client.rate_limit_metrics()["rate_limited_responses"] == 1
+
+    @patch("requests.Session.get")
+    def test_client_detects_secondary_rate_limit_without_headers(self, mock_get):
+        """
+        Tests that a 403 whose only sign of a secondary rate limit is its message
+        backs off exponentially from one minute, while other 403s fail at once.
+        """
+        client = GitHubClient(
+            access_token="test_token",
+            cache=InMemoryConditionalCache(),
+            rate_limiter=self.scheduler,
+        )
+        secondary_limit = {
+            "message": "You have exceeded a secondary rate limit. Please wait a "
+            "few minutes before you try again."
+        }
+        mock_get.side_effect = [
+            make_response(403, body=secondary_limit),
+            make_response(200, body={"Python": 100}),
+        ]
+
+        languages = client.get_repository_languages(
+            "jeremywhitney", "portfolio-cms_api"
+        )
+
+        assert languages == {"Python": 100}
+        assert self.clock.sleeps == [60]
+        assert client.rate_limit_metrics()["rate_limited_responses"] == 1
+
+        forbidden = make_response(403, body={"message": "Resource not accessible"})
+        assert not self.scheduler.is_rate_limited(forbidden)
@@ -0,0 +1,209 @@
+import os
+import subprocess
+import sys
+import tempfile
+import threading
+import pytest
+from unittest.mock import Mock
+from django.conf import settings
+from django.contrib.auth.models import User
+from django.test import override_settings
+from portfoliocmsapi.projects.models import Project
+from portfoliocmsapi.services.github.repository_cache import (
+    CircuitBreaker,
+    CircuitOpenError,
+    RepositoryListingCache,
+    get_project_repositories,
+)
+
+
+class ManualClock:
+    """A monotonic clock moved forward by hand"""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class TestCircuitBreaker:
+    def setup_method(self):
+        self.clock = ManualClock()
+        self.breaker = CircuitBreaker(
+            failure_threshold=2, reset_timeout=30, clock=self.clock
+        )
+
+    def test_opens_after_consecutive_failures(self):
+        """Tests that the breaker rejects calls once the threshold is reached"""
+        failing = Mock(side_effect=ValueError("boom"))
+
+        for _ in range(2):
+            with pytest.raises(ValueError):
+                self.breaker.call(failing)
+
+        assert self.breaker.state == "open"
+        with pytest.raises(CircuitOpenError):
+            self.breaker.call(failing)
+        assert failing.call_count == 2
+
+    def test_half_open_trial_closes_on_success(self):
+        """Tests that one successful trial after the timeout closes the breaker"""
+        for _ in range(2):
+            with pytest.raises(ValueError):
+                self.breaker.call(Mock(side_effect=ValueError("boom")))
+
+        self.clock.now += 30
+        assert self.breaker.state == "half_open"
+        assert self.breaker.call(lambda: "ok") == "ok"
+        assert self.breaker.state == "closed"
+
+    def test_half_open_trial_failure_reopens(self):
+        """Tests that a failed trial opens the breaker for another timeout"""
+        for _ in range(2):
+            with pytest.raises(ValueError):
+                self.breaker.call(Mock(side_effect=ValueError("boom")))
+
+        self.clock.now += 30
+        with pytest.raises(ValueError):
+            self.breaker.call(Mock(side_effect=ValueError("boom")))
+
+        assert self.breaker.state == "open"
+
+    def test_slow_calls_count_as_failures(self):
+        """Tests that calls slower than slow_call trip the breaker"""
+        breaker = CircuitBreaker(
+            failure_threshold=1, reset_timeout=30, slow_call=5, clock=self.clock
+        )
+
+        def slow():
+            self.clock.now += 6
+            return "late"
+
+        assert breaker.call(slow) == "late"
+        assert breaker.state == "open"
+
+
+class TestRepositoryListingCache:
+    def setup_method(self):
+        self.clock = ManualClock()
+        self.fetch = Mock(return_value=[{"name": "repo1"}])
+        self.breaker = CircuitBreaker(
+            failure_threshold=1, reset_timeout=60, clock=self.clock
+        )
+        self.listing = RepositoryListingCache(
+            self.fetch, ttl=300, breaker=self.breaker, clock=self.clock
+        )
+
+    def wait_for_refresh(self):
+        if self.listing._refreshing is not None:
+            self.listing._refreshing.join(timeout=5)
+
+    def test_fresh_snapshot_is_reused(self):
+        """Tests that GitHub is only asked once within the TTL"""
+        assert self.listing.get() == [{"name": "repo1"}]
+        self.clock.now += 299
+        assert self.listing.get() == [{"name": "repo1"}]
+
+        assert self.fetch.call_count == 1
+
+    def test_stale_snapshot_is_served_while_revalidating(self):
+        """Tests that a stale snapshot is returned immediately and refreshed behind"""
+        self.listing.get()
+        self.clock.now += 300
+
+        release = threading.Event()
+
+        def slow_fetch():
+            release.wait(timeout=5)
+            return [{"name": "repo2"}]
+
+        self.fetch.side_effect = slow_fetch
+
+        assert self.listing.get() == [{"name": "repo1"}]
+        # A second stale read doesn't start another refresh
+        assert self.listing.get() == [{"name": "repo1"}]
+
+        release.set()
+        self.wait_for_refresh()
+
+        assert self.listing.get() == [{"name": "repo2"}]
+        assert self.fetch.call_count == 2
+
+    def test_last_good_snapshot_survives_outage(self):
+        """Tests that failed refreshes keep serving the old snapshot"""
+        self.listing.get()
+        self.clock.now += 300
+        self.fetch.side_effect = ConnectionError("GitHub is down")
+
+        assert self.listing.get() == [{"name": "repo1"}]
+        self.wait_for_refresh()
+
+        # The breaker is now open, so no further refresh is attempted
+        assert self.breaker.state == "open"
+        assert self.listing.get() == [{"name": "repo1"}]
+        self.wait_for_refresh()
+        assert self.fetch.call_count == 2
+
+    def test_no_snapshot_and_open_breaker_fails_fast(self):
+        """Tests that without a snapshot an open breaker raises immediately"""
+        self.fetch.side_effect = ConnectionError("GitHub is down")
+
+        with pytest.raises(ConnectionError):
+            self.listing.get()
+        with pytest.raises(CircuitOpenError):
+            self.listing.get()
+        assert self.fetch.call_count == 1
+
+
+class TestProjectRepositories:
+    def test_invalidation_reaches_other_processes(self, db):
+        """
+        Tests that a project change in another process is seen on the next read,
+        through the shared response cache.
+        """
+        user = User.objects.create_user(username="testuser", password="testpass")
+        with tempfile.TemporaryDirectory() as location:
+            backend = {
+                "BACKEND": "django.core.cache.backends.filebased.FileBasedCache",
+                "LOCATION": location,
+            }
+            with override_settings(
+                CACHES={**settings.CACHES, "api_responses": backend}
+            ):
+                assert get_project_repositories()["names"] == set()
+                Project.objects.bulk_create(
+                    [
+                        Project(
+                            user=user,
+                            title="repo1",
+                            description="",
+                            repo_url="https://github.com/testuser/repo1",
+                            date_created="2024-01-01T00:00:00Z",
+                            last_update="2024-01-02T00:00:00Z",
+                        )
+                    ]
+                )
+                # Still served from the cache; bulk_create sends no signals
+                assert get_project_repositories()["names"] == set()
+
+                # Another worker saves a project, and its signal clears the entry
+                subprocess.run(
+                    [
+                        sys.executable,
+                        "-c",
+                        "import django; django.setup(); "
+                        "from portfoliocmsapi.services.github.repository_cache "
+                        "import invalidate_project_repositories; "
+                        "invalidate_project_repositories()",
+                    ],
+                    check=True,
+                    cwd=settings.BASE_DIR,
+                    env={
+                        **os.environ,
+                        "API_RESPONSE_CACHE_BACKEND": "file",
+                        "API_RESPONSE_CACHE_LOCATION": location,
+                    },
+                )
+
+                assert get_project_repositories()["names"] == {"testuser/repo1"}
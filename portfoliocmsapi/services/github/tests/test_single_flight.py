@@ -0,0 +1,185 @@
+import threading
+import time
+import pytest
+from django.core.cache import cache
+from unittest.mock import Mock, patch
+from portfoliocmsapi.services.github.cache import InMemoryConditionalCache
+from portfoliocmsapi.services.github.client import GitHubClient
+from portfoliocmsapi.services.github.single_flight import (
+    CacheSingleFlight,
+    SingleFlight,
+)
+
+
+def run_concurrently(func, count):
+    """Runs func on `count` threads at once and returns results or exceptions"""
+    results = [None] * count
+
+    def target(index):
+        try:
+            results[index] = func()
+        except Exception as e:
+            results[index] = e
+
+    threads = [threading.Thread(target=target, args=(i,)) for i in range(count)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join(timeout=5)
+    return results
+
+
+class TestSingleFlight:
+    def setup_method(self):
+        self.single_flight = SingleFlight()
+        self.release = threading.Event()
+        self.calls = 0
+
+    def blocking_call(self):
+        self.calls += 1
+        self.release.wait(timeout=5)
+        return {"name": "repo1"}
+
+    def release_when_all_waiting(self, waiting):
+        def release():
+            deadline = time.monotonic() + 5
+            while (
+                self.single_flight.metrics()["coalesced"] < waiting
+                and time.monotonic() < deadline
+            ):
+                time.sleep(0.01)
+            self.release.set()
+
+        threading.Thread(target=release).start()
+
+    def test_concurrent_calls_share_one_result(self):
+        """Tests that identical in-flight calls are made once"""
+        self.release_when_all_waiting(4)
+
+        results = run_concurrently(
+            lambda: self.single_flight.do("key", self.blocking_call), 5
+        )
+
+        assert self.calls == 1
+        assert all(result is results[0] for result in results)
+        assert self.single_flight.metrics() == {
+            "calls": 1,
+            "coalesced": 4,
+            "in_flight": 0,
+        }
+
+    def test_errors_are_shared(self):
+        """Tests that every waiter sees the leader's exception"""
+
+        def failing_call():
+            self.release.wait(timeout=5)
+            raise ValueError("boom")
+
+        self.release_when_all_waiting(2)
+
+        results = run_concurrently(
+            lambda: self.single_flight.do("key", failing_call), 3
+        )
+
+        assert all(isinstance(result, ValueError) for result in results)
+
+    def test_finished_calls_are_not_reused(self):
+        """Tests that coalescing only covers the in-flight window"""
+        self.release.set()
+
+        self.single_flight.do("key", self.blocking_call)
+        self.single_flight.do("key", self.blocking_call)
+
+        assert self.calls == 2
+
+
+class TestCacheSingleFlight:
+    def setup_method(self):
+        cache.clear()
+        self.single_flight = CacheSingleFlight(lock_timeout=5, poll_interval=0.01)
+
+    def test_leader_runs_the_call(self):
+        """Tests that the first process to take the lock makes the call"""
+        func = Mock(return_value={"name": "repo1"})
+
+        assert self.single_flight.do("key", func) == {"name": "repo1"}
+        func.assert_called_once()
+
+    def test_follower_reads_leader_result(self):
+        """Tests that a process waiting on another's lock reuses its result"""
+        func = Mock(return_value={"name": "local"})
+        leader = CacheSingleFlight(lock_timeout=5)
+        started = threading.Event()
+
+        def leader_call():
+            started.set()
+            time.sleep(0.1)
+            return {"name": "shared"}
+
+        thread = threading.Thread(target=leader.do, args=("key", leader_call))
+        thread.start()
+        started.wait(timeout=5)
+
+        assert self.single_flight.do("key", func) == {"name": "shared"}
+        func.assert_not_called()
+        thread.join(timeout=5)
+
+    def test_follower_calls_itself_when_leader_fails(self):
+        """Tests that a failed leader doesn't leave followers without a result"""
+        func = Mock(return_value={"name": "local"})
+        leader = CacheSingleFlight(lock_timeout=5)
+        started = threading.Event()
+
+        def leader_call():
+            started.set()
+            time.sleep(0.1)
+            raise ValueError("boom")
+
+        def run_leader():
+            with pytest.raises(ValueError):
+                leader.do("key", leader_call)
+
+        thread = threading.Thread(target=run_leader)
+        thread.start()
+        started.wait(timeout=5)
+
+        assert self.single_flight.do("key", func) == {"name": "local"}
+        func.assert_called_once()
+        thread.join(timeout=5)
+
+
+class TestGitHubClientSingleFlight:
+    @patch("requests.Session.get")
+    def test_concurrent_identical_requests_are_coalesced(self, mock_get):
+        """Tests that concurrent identical client fetches make one request"""
+        client = GitHubClient(cache=InMemoryConditionalCache())
+        release = threading.Event()
+
+        def slow_get(*args, **kwargs):
+            release.wait(timeout=5)
+            response = Mock()
+            response.status_code = 200
+            response.headers = {}
+            response.links = {}
+            response.json.return_value = {"name": "portfolio-cms_api"}
+            return response
+
+        mock_get.side_effect = slow_get
+
+        def release_when_all_waiting():
+            deadline = time.monotonic() + 5
+            while (
+                client.single_flight_metrics()["coalesced"] < 3
+                and time.monotonic() < deadline
+            ):
+                time.sleep(0.01)
+            release.set()
+
+        threading.Thread(target=release_when_all_waiting).start()
+        results = run_concurrently(
+            lambda: client.get_repository_details("jeremywhitney", "portfolio-cms_api"),
+            4,
+        )
+
+        assert mock_get.call_count == 1
+        assert all(result == {"name": "portfolio-cms_api"} for result in results)
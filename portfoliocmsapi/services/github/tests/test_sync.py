@@ -1,13 +1,41 @@
+import importlib
+from decimal import Decimal
+import pytest
+from django.apps import apps
 from django.contrib.auth.models import User
+from django.db import connection
+import requests
 from unittest.mock import Mock
-from portfoliocmsapi.services.github.sync import GitHubSyncService
-from portfoliocmsapi.projects.models import Project
+from portfoliocmsapi.services.github.sync import GitHubSyncService, ProjectExistsError
+from portfoliocmsapi.projects.models import (
+    GitHubWebhookEvent,
+    Project,
+    ProjectTechStack,
+    Tag,
+    TechStack,
+)
 
 
 class TestGitHubSyncService:
     def setup_method(self):
         self.github_client = Mock()
         self.sync_service = GitHubSyncService(github_client=self.github_client)
+        # The sync service asks for conditional fetches; answer them with the
+        # plain mocks so tests can keep configuring get_repository_details etc.
+        self.github_client.get_repository_details_if_changed.side_effect = (
+            lambda owner, repo, etag=None: (
+                self.github_client.get_repository_details(owner, repo),
+                None,
+            )
+        )
+        self.github_client.get_repository_languages_if_changed.side_effect = (
+            lambda owner, repo, etag=None: (
+                self.github_client.get_repository_languages(owner, repo),
+                None,
+            )
+        )
+        # No GraphQL batch results, so bulk syncs fall back to the REST mocks
+        self.github_client.get_repositories_batch.return_value = {}
 
         self.mock_repos = [
             {
@@ -32,7 +60,7 @@ class TestGitHubSyncService:
 
     def test_get_available_repositories(self, db):
         # Set up mock client to return sample repositories
-        self.github_client.get_all_repositories.return_value = self.mock_repos
+        self.github_client.iter_repositories.return_value = iter(self.mock_repos)
 
         # Create a test user
         test_user = User.objects.create_user(username="testuser", password="testpass")
@@ -188,3 +216,542 @@ class TestGitHubSyncService:
         assert "Portfolio" in tag_names
         assert "Django" in tag_names
         assert "Rest-Api" in tag_names
+
+    def test_refresh_project_fetches_each_resource_once(self, db):
+        """
+        Tests that a full sync shares one repository payload between its steps,
+        making exactly one details request and one languages request upstream.
+        """
+        test_user = User.objects.create_user(username="testuser", password="testpass")
+        project = Project.objects.create(
+            user=test_user,
+            title="Old Project Title",
+            description="Old description",
+            repo_url="https://github.com/jeremywhitney/portfolio-cms_api",
+            date_created="2024-01-01T00:00:00Z",
+            last_update="2024-01-02T00:00:00Z",
+        )
+        self.github_client.get_repository_details.return_value = self.mock_repos[0]
+        self.github_client.get_repository_languages.return_value = {"Python": 100}
+
+        self.sync_service.refresh_project(project)
+
+        self.github_client.get_repository_details.assert_called_once_with(
+            "jeremywhitney", "portfolio-cms_api"
+        )
+        self.github_client.get_repository_languages.assert_called_once_with(
+            "jeremywhitney", "portfolio-cms_api"
+        )
+        assert project.title == "portfolio-cms_api"
+        assert {tag.name for tag in project.tag.all()} == {"Portfolio", "Django"}
+
+    def test_sessions_do_not_share_payloads(self, db):
+        """
+        Tests that memoization is scoped to one session, so a new operation
+        sees fresh data from GitHub.
+        """
+        self.github_client.get_repository_details.return_value = self.mock_repos[0]
+
+        first = self.sync_service.session()
+        first.get_repository_details("jeremywhitney", "portfolio-cms_api")
+        first.get_repository_details("JeremyWhitney", "portfolio-cms_api")
+        self.sync_service.session().get_repository_details(
+            "jeremywhitney", "portfolio-cms_api"
+        )
+
+        assert self.github_client.get_repository_details.call_count == 2
+
+    def test_sync_projects_records_failures_per_repository(self, db):
+        """
+        Tests that a bulk sync updates every reachable repository and records
+        failures for the others without aborting the batch.
+        """
+        test_user = User.objects.create_user(username="testuser", password="testpass")
+        projects = [
+            Project.objects.create(
+                user=test_user,
+                title="Old Title",
+                description="Old description",
+                repo_url=repo["html_url"],
+                date_created="2024-01-01T00:00:00Z",
+                last_update="2024-01-01T00:00:00Z",
+            )
+            for repo in self.mock_repos
+        ]
+        broken = Project.objects.create(
+            user=test_user,
+            title="Deleted Repository",
+            description="Gone from GitHub",
+            repo_url="https://github.com/jeremywhitney/deleted",
+            date_created="2024-01-01T00:00:00Z",
+            last_update="2024-01-01T00:00:00Z",
+        )
+        repos_by_name = {repo["name"]: repo for repo in self.mock_repos}
+
+        def get_repository_details(owner, repo):
+            if repo not in repos_by_name:
+                raise requests.exceptions.HTTPError("404 Client Error: Not Found")
+            return repos_by_name[repo]
+
+        self.github_client.get_repository_details.side_effect = get_repository_details
+        self.github_client.get_repository_languages.return_value = {"Python": 100}
+
+        results = self.sync_service.sync_projects(
+            projects + [broken], workers=3, batch_size=1
+        )
+
+        assert [result.ok for result in results] == [True, True, False]
+        assert "404" in results[2].error
+        for project, repo in zip(projects, self.mock_repos):
+            project.refresh_from_db()
+            assert project.title == repo["name"]
+            assert project.tech_stack.filter(name="Python").exists()
+        broken.refresh_from_db()
+        assert broken.title == "Deleted Repository"
+
+    def test_sync_languages_reconciles_tech_stack(
+        self, db, django_assert_max_num_queries
+    ):
+        """
+        Tests that syncing languages reuses existing TechStack rows regardless of
+        case, drops languages GitHub no longer reports, and does so with a fixed
+        number of queries however many languages there are.
+        """
+        test_user = User.objects.create_user(username="testuser", password="testpass")
+        project = Project.objects.create(
+            user=test_user,
+            title="Test Project",
+            description="Test description",
+            repo_url="https://github.com/jeremywhitney/portfolio-cms_api",
+            date_created="2024-01-01T00:00:00Z",
+            last_update="2024-01-02T00:00:00Z",
+        )
+        python = TechStack.objects.create(name="python")
+        # Linked by an earlier sync
+        project.tech_stack.add(
+            python,
+            TechStack.objects.create(name="Ruby"),
+            through_defaults={"synced": True},
+        )
+
+        languages = {"Python": 1000, **{f"Language{i}": i for i in range(20)}}
+        self.github_client.get_repository_languages.return_value = languages
+
+        # savepoint + lookup + insert + re-read + current links + insert + update
+        # + delete
+        with django_assert_max_num_queries(9):
+            self.sync_service.sync_repository_languages(project)
+
+        names = set(project.tech_stack.values_list("name", flat=True))
+        assert "Ruby" not in names
+        assert names == {"python", *(f"Language{i}" for i in range(20))}
+        assert TechStack.objects.filter(name__iexact="python").count() == 1
+
+    def test_sync_languages_stores_byte_shares(self, db):
+        """
+        Tests that each language link records its byte count and percentage share,
+        and that later syncs update them.
+        """
+        test_user = User.objects.create_user(username="testuser", password="testpass")
+        project = Project.objects.create(
+            user=test_user,
+            title="Test Project",
+            description="Test description",
+            repo_url="https://github.com/jeremywhitney/portfolio-cms_api",
+            date_created="2024-01-01T00:00:00Z",
+            last_update="2024-01-02T00:00:00Z",
+        )
+
+        self.github_client.get_repository_languages.return_value = {
+            "Python": 7000,
+            "HTML": 2000,
+            "CSS": 1000,
+        }
+        self.sync_service.sync_repository_languages(project)
+
+        shares = {
+            link.tech_stack.name: (link.bytes, link.percentage)
+            for link in project.projecttechstack_set.all()
+        }
+        assert shares == {
+            "Python": (7000, Decimal("70.00")),
+            "HTML": (2000, Decimal("20.00")),
+            "CSS": (1000, Decimal("10.00")),
+        }
+
+        self.github_client.get_repository_languages.return_value = {
+            "Python": 1000,
+            "HTML": 2000,
+        }
+        self.sync_service.sync_repository_languages(project, force=True)
+
+        links = list(project.projecttechstack_set.all())
+        assert [(link.tech_stack.name, link.percentage) for link in links] == [
+            ("HTML", Decimal("66.67")),
+            ("Python", Decimal("33.33")),
+        ]
+
+    def test_sync_topics_removes_stale_tags(self, db):
+        """
+        Tests that tags for topics removed on GitHub are unlinked from the project.
+        """
+        test_user = User.objects.create_user(username="testuser", password="testpass")
+        project = Project.objects.create(
+            user=test_user,
+            title="Test Project",
+            description="Test description",
+            repo_url="https://github.com/jeremywhitney/portfolio-cms_api",
+            date_created="2024-01-01T00:00:00Z",
+            last_update="2024-01-02T00:00:00Z",
+        )
+        project.tag.add(
+            Tag.objects.create(name="Legacy"), through_defaults={"synced": True}
+        )
+        self.github_client.get_repository_details.return_value = {"topics": ["django"]}
+
+        self.sync_service.sync_repository_topics(project)
+
+        assert set(project.tag.values_list("name", flat=True)) == {"Django"}
+        # The Tag row itself is kept, since other projects or posts may use it
+        assert Tag.objects.filter(name="Legacy").exists()
+
+    def test_sync_keeps_links_added_in_the_cms(self, db):
+        """
+        Tests that tags and tech stack added by hand survive a sync that doesn't
+        report them, while links the sync added are still removed.
+        """
+        test_user = User.objects.create_user(username="testuser", password="testpass")
+        project = Project.objects.create(
+            user=test_user,
+            title="Test Project",
+            description="Test description",
+            repo_url="https://github.com/jeremywhitney/portfolio-cms_api",
+            date_created="2024-01-01T00:00:00Z",
+            last_update="2024-01-02T00:00:00Z",
+        )
+        project.tag.add(Tag.objects.create(name="Portfolio Highlight"))
+        project.tech_stack.add(TechStack.objects.create(name="PostgreSQL"))
+        self.github_client.get_repository_details.return_value = {
+            **self.mock_repos[0],
+            "topics": ["django", "api"],
+        }
+        self.github_client.get_repository_languages.return_value = {
+            "Python": 900,
+            "Shell": 100,
+        }
+        self.sync_service.refresh_project(project)
+
+        # GitHub drops a topic and a language
+        self.github_client.get_repository_details.return_value = {
+            **self.mock_repos[0],
+            "updated_at": "2024-02-01T00:00:00Z",
+            "topics": ["django"],
+        }
+        self.github_client.get_repository_languages.return_value = {"Python": 1000}
+        self.sync_service.refresh_project(project)
+
+        assert set(project.tag.values_list("name", flat=True)) == {
+            "Portfolio Highlight",
+            "Django",
+        }
+        assert set(project.tech_stack.values_list("name", flat=True)) == {
+            "PostgreSQL",
+            "Python",
+        }
+
+    def test_sync_skips_unchanged_repository(self, db, django_assert_num_queries):
+        """
+        Tests that a second sync of an unchanged repository writes nothing, and
+        that a later change only updates the fields that differ.
+        """
+        test_user = User.objects.create_user(username="testuser", password="testpass")
+        project = Project.objects.create(
+            user=test_user,
+            title="portfolio-cms_api",
+            description="Old description",
+            repo_url="https://github.com/jeremywhitney/portfolio-cms_api",
+            date_created="2024-01-01T00:00:00Z",
+            last_update="2024-01-02T00:00:00Z",
+        )
+        repo_data = {
+            **self.mock_repos[0],
+            "pushed_at": "2024-01-02T00:00:00Z",
+        }
+        self.github_client.get_repository_details.return_value = repo_data
+        self.github_client.get_repository_languages.return_value = {"Python": 100}
+
+        self.sync_service.refresh_project(project)
+        assert project.last_synced_at is not None
+        assert project.description == "My portfolio CMS"
+
+        # Nothing changed upstream: no queries at all, and no languages request
+        with django_assert_num_queries(0):
+            self.sync_service.refresh_project(project)
+        assert self.github_client.get_repository_languages.call_count == 1
+
+        # A new push only rewrites the fields that actually differ
+        self.github_client.get_repository_details.return_value = {
+            **repo_data,
+            "updated_at": "2024-02-01T00:00:00Z",
+            "pushed_at": "2024-02-01T00:00:00Z",
+        }
+        with django_assert_num_queries(1) as captured:
+            self.sync_service.sync_project(project)
+        update_sql = captured.captured_queries[0]["sql"]
+        assert '"last_update"' in update_sql
+        assert '"github_pushed_at"' in update_sql
+        assert '"title"' not in update_sql
+        assert '"description"' not in update_sql
+
+    def test_refresh_after_webhook_fetches_languages(self, db):
+        """
+        Tests that a push webhook, which carries no languages, doesn't stop the next
+        refresh from fetching them.
+        """
+        test_user = User.objects.create_user(username="testuser", password="testpass")
+        project = Project.objects.create(
+            user=test_user,
+            title="portfolio-cms_api",
+            description="Old description",
+            repo_url="https://github.com/jeremywhitney/portfolio-cms_api",
+            date_created="2024-01-01T00:00:00Z",
+            last_update="2024-01-02T00:00:00Z",
+        )
+        repo_data = {**self.mock_repos[0], "pushed_at": "2024-01-02T00:00:00Z"}
+        self.github_client.get_repository_details.return_value = repo_data
+        self.github_client.get_repository_languages.return_value = {"Python": 100}
+        self.sync_service.refresh_project(project)
+
+        pushed = {
+            **repo_data,
+            "updated_at": "2024-02-01T00:00:00Z",
+            "pushed_at": "2024-02-01T00:00:00Z",
+        }
+        self.sync_service.apply_webhook_event(
+            GitHubWebhookEvent(event="push", payload={"repository": pushed})
+        )
+        self.github_client.get_repository_details.return_value = pushed
+        self.github_client.get_repository_languages.return_value = {
+            "Python": 100,
+            "Rust": 50,
+        }
+        # As a later request would, from the row the webhook wrote
+        project.refresh_from_db()
+        self.sync_service.refresh_project(project)
+
+        assert set(project.tech_stack.values_list("name", flat=True)) == {
+            "Python",
+            "Rust",
+        }
+
+    def test_language_share_migration_refetches_languages(self, db):
+        """
+        Tests that projects synced before byte counts existed get them on the next
+        sync after the migration, even though their repositories haven't changed.
+        """
+        migration = importlib.import_module(
+            "portfoliocmsapi.projects.migrations.0005_projecttechstack_language_share"
+        )
+        test_user = User.objects.create_user(username="testuser", password="testpass")
+        project = Project.objects.create(
+            user=test_user,
+            title="portfolio-cms_api",
+            description="Test description",
+            repo_url="https://github.com/jeremywhitney/portfolio-cms_api",
+            date_created="2024-01-01T00:00:00Z",
+            last_update="2024-01-02T00:00:00Z",
+        )
+        # GitHub answers 304 while the stored ETag is current
+        self.github_client.get_repository_details_if_changed.side_effect = (
+            lambda owner, repo, etag=None: (
+                (None, '"v1"') if etag == '"v1"' else (self.mock_repos[0], '"v1"')
+            )
+        )
+        self.github_client.get_repository_languages.return_value = {"Python": 100}
+        self.sync_service.refresh_project(project)
+        # Links as they were before the migration added byte counts
+        ProjectTechStack.objects.update(bytes=0, percentage=0)
+
+        migration.reset_sync_watermarks(apps, None)
+        project.refresh_from_db()
+        self.sync_service.refresh_project(project)
+
+        link = ProjectTechStack.objects.get(project=project)
+        assert (link.bytes, link.percentage) == (100, Decimal("100.00"))
+
+    def test_sync_projects_reports_unchanged_repositories(self, db):
+        """
+        Tests that bulk syncs skip repositories whose stored ETag is still current.
+        """
+        test_user = User.objects.create_user(username="testuser", password="testpass")
+        project = Project.objects.create(
+            user=test_user,
+            title="Stored Title",
+            description="Stored description",
+            repo_url="https://github.com/jeremywhitney/portfolio-cms_api",
+            date_created="2024-01-01T00:00:00Z",
+            last_update="2024-01-02T00:00:00Z",
+            github_etag='"abc"',
+        )
+        # GitHub answers 304 Not Modified for the stored ETag
+        self.github_client.get_repository_details_if_changed.side_effect = None
+        self.github_client.get_repository_details_if_changed.return_value = (
+            None,
+            '"abc"',
+        )
+
+        [result] = self.sync_service.sync_projects([project])
+
+        assert result.ok and not result.changed
+        self.github_client.get_repository_details_if_changed.assert_called_once_with(
+            "jeremywhitney", "portfolio-cms_api", '"abc"'
+        )
+        self.github_client.get_repository_languages_if_changed.assert_not_called()
+        project.refresh_from_db()
+        assert project.title == "Stored Title"
+
+    def test_available_repositories_match_by_identity(self, db):
+        """
+        Tests that URL spelling (case, trailing slash, .git) doesn't stop a linked
+        repository from being recognised.
+        """
+        self.github_client.iter_repositories.return_value = iter(self.mock_repos)
+        test_user = User.objects.create_user(username="testuser", password="testpass")
+        Project.objects.create(
+            user=test_user,
+            title="Existing Project",
+            repo_url="https://github.com/JeremyWhitney/Portfolio-CMS_api.git/",
+            description="Test project",
+            date_created="2024-01-01T00:00:00Z",
+            last_update="2024-01-02T00:00:00Z",
+        )
+
+        available_repos = self.sync_service.get_available_repositories()
+
+        assert [repo["name"] for repo in available_repos] == ["another-project"]
+
+    def test_create_project_fetches_outside_the_transaction(self, transactional_db):
+        """
+        Tests that no GitHub request is made while create_project holds a database
+        transaction open.
+        """
+        test_user = User.objects.create_user(username="testuser", password="testpass")
+        in_transaction = []
+
+        def details(owner, repo):
+            in_transaction.append(connection.in_atomic_block)
+            return self.mock_repos[0]
+
+        def languages(owner, repo):
+            in_transaction.append(connection.in_atomic_block)
+            return {"Python": 100}
+
+        self.github_client.get_repository_details.side_effect = details
+        self.github_client.get_repository_languages.side_effect = languages
+
+        project = self.sync_service.create_project(
+            "jeremywhitney", "portfolio-cms_api", test_user
+        )
+
+        assert in_transaction == [False, False]
+        assert project.tech_stack.filter(name="Python").exists()
+        assert project.tag.filter(name="Django").exists()
+
+    def test_create_project_rejects_duplicates(self, db):
+        """
+        Tests that a repository can only be turned into a project once.
+        """
+        test_user = User.objects.create_user(username="testuser", password="testpass")
+        existing = Project.objects.create(
+            user=test_user,
+            title="Existing Project",
+            repo_url="https://github.com/jeremywhitney/portfolio-cms_api",
+            description="Test project",
+            date_created="2024-01-01T00:00:00Z",
+            last_update="2024-01-02T00:00:00Z",
+        )
+
+        with pytest.raises(ProjectExistsError) as raised:
+            self.sync_service.create_project(
+                "JeremyWhitney", "Portfolio-CMS_api", test_user
+            )
+
+        assert raised.value.project == existing
+        self.github_client.get_repository_details.assert_not_called()
+
+    def test_sync_records_repository_identity_across_renames(self, db):
+        """
+        Tests that syncing stores the numeric id and follows a renamed repository.
+        """
+        test_user = User.objects.create_user(username="testuser", password="testpass")
+        project = Project.objects.create(
+            user=test_user,
+            title="portfolio-cms_api",
+            repo_url="https://github.com/jeremywhitney/portfolio-cms_api",
+            description="Test project",
+            date_created="2024-01-01T00:00:00Z",
+            last_update="2024-01-02T00:00:00Z",
+        )
+        assert (project.github_owner, project.github_name) == (
+            "jeremywhitney",
+            "portfolio-cms_api",
+        )
+
+        # GitHub redirects the old name to the renamed repository
+        self.github_client.get_repository_details.return_value = {
+            **self.mock_repos[0],
+            "id": 4242,
+            "name": "Portfolio-API",
+            "html_url": "https://github.com/jeremywhitney/Portfolio-API",
+        }
+        self.github_client.get_repository_languages.return_value = {}
+        self.sync_service.refresh_project(project)
+
+        project.refresh_from_db()
+        assert project.github_repo_id == 4242
+        assert project.github_repository == ("jeremywhitney", "portfolio-api")
+        assert self.sync_service.find_project("jeremywhitney", "other", 4242) == project
+
+    def test_sync_leaves_duplicate_repository_projects_unlinked(self, db):
+        """
+        Tests that syncing two projects on the same repository links only the one
+        that holds it, instead of failing on the unique identity.
+        """
+        test_user = User.objects.create_user(username="testuser", password="testpass")
+        linked, duplicate = [
+            Project.objects.create(
+                user=test_user,
+                title=title,
+                repo_url=url,
+                description="Test project",
+                date_created="2024-01-01T00:00:00Z",
+                last_update="2024-01-02T00:00:00Z",
+            )
+            for title, url in (
+                ("Linked", "https://github.com/jeremywhitney/portfolio-cms_api"),
+                ("Duplicate", "https://github.com/JeremyWhitney/portfolio-cms_api/"),
+            )
+        ]
+        assert duplicate.github_owner is None
+
+        self.github_client.get_repository_details.return_value = {
+            **self.mock_repos[0],
+            "id": 4242,
+        }
+        self.github_client.get_repository_languages.return_value = {"Python": 100}
+
+        self.sync_service.refresh_project(duplicate)
+        results = self.sync_service.sync_projects(
+            Project.objects.order_by("id"), force=True, graphql=False
+        )
+
+        assert all(result.ok for result in results)
+        linked.refresh_from_db()
+        duplicate.refresh_from_db()
+        assert (linked.github_repo_id, linked.github_name) == (
+            4242,
+            "portfolio-cms_api",
+        )
+        assert (duplicate.github_repo_id, duplicate.github_name) == (None, None)
+        assert duplicate.description == "My portfolio CMS"
+        assert duplicate.tech_stack.filter(name="Python").exists()
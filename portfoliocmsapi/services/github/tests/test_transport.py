@@ -0,0 +1,109 @@
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import pytest
+import requests
+from portfoliocmsapi.services.github.transport import GitHubTransport
+
+
+class _FlakyHandler(BaseHTTPRequestHandler):
+    """Fails the first `failures` requests with a 503, then answers with JSON"""
+
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        server = self.server
+        with server.lock:
+            server.hits += 1
+            hits = server.hits
+            server.client_ports.add(self.client_address[1])
+
+        if self.path == "/hang":
+            time.sleep(server.hang)
+        if hits <= server.failures:
+            self._respond(503, {"message": "Service Unavailable"})
+        else:
+            self._respond(200, {"name": "repo1"})
+
+    def _respond(self, status, body):
+        payload = json.dumps(body).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def log_message(self, *args):
+        pass
+
+
+class TestGitHubTransport:
+    def setup_method(self):
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), _FlakyHandler)
+        self.server.lock = threading.Lock()
+        self.server.hits = 0
+        self.server.failures = 0
+        self.server.hang = 0
+        self.server.client_ports = set()
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+
+        host, port = self.server.server_address
+        self.base_url = f"http://{host}:{port}"
+        self.transport = GitHubTransport(
+            connect_timeout=1, read_timeout=0.2, max_retries=2, backoff_factor=0
+        )
+
+    def teardown_method(self):
+        self.transport.close()
+        self.server.shutdown()
+        self.server.server_close()
+
+    def test_retries_server_errors(self):
+        """Tests that 5xx responses are retried until one succeeds"""
+        self.server.failures = 2
+
+        response = self.transport.get(f"{self.base_url}/repos/owner/repo1")
+
+        assert response.status_code == 200
+        assert self.server.hits == 3
+
+    def test_returns_last_error_when_retries_run_out(self):
+        """Tests that a persistent 5xx is handed back for raise_for_status()"""
+        self.server.failures = 10
+
+        response = self.transport.get(f"{self.base_url}/repos/owner/repo1")
+
+        assert response.status_code == 503
+        assert self.server.hits == 3
+
+    def test_read_timeout(self):
+        """Tests that a hung response fails instead of blocking forever"""
+        self.server.hang = 1
+        transport = GitHubTransport(read_timeout=0.1, max_retries=0)
+
+        started = time.monotonic()
+        with pytest.raises(requests.exceptions.ConnectionError):
+            transport.get(f"{self.base_url}/hang")
+
+        assert time.monotonic() - started < 0.9
+        assert transport.metrics()["failures"] == 1
+        transport.close()
+
+    def test_connections_are_kept_alive(self):
+        """Tests that consecutive requests reuse one pooled connection"""
+        for _ in range(3):
+            self.transport.get(f"{self.base_url}/repos/owner/repo1")
+
+        assert len(self.server.client_ports) == 1
+
+    def test_metrics(self):
+        """Tests that latency and bytes received are recorded per call"""
+        self.transport.get(f"{self.base_url}/repos/owner/repo1")
+        self.transport.get(f"{self.base_url}/repos/owner/repo1")
+
+        metrics = self.transport.metrics()
+        assert metrics["requests"] == 2
+        assert metrics["failures"] == 0
+        assert metrics["bytes_received"] == 2 * len(json.dumps({"name": "repo1"}))
+        assert 0 < metrics["max_seconds"] < 1
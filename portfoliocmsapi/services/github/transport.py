@@ -0,0 +1,175 @@
+import logging
+import threading
+import time
+import requests
+from django.conf import settings
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+logger = logging.getLogger(__name__)
+
+
+class GitHubTransport:
+    """
+    The HTTP layer under GitHubClient: a pooled, keep-alive requests.Session with
+    timeouts, retries and per-call instrumentation.
+
+    Connections to GitHub are reused across requests and threads, up to
+    pool_maxsize per host. Every request has a connect and read timeout, so a hung
+    connection fails instead of blocking a worker forever. Connection errors, read
+    errors and 5xx responses to GET requests are retried with jittered exponential
+    backoff. Rate-limit responses (403/429) are left to the RateLimitScheduler.
+
+    Each call's latency and response size are logged at DEBUG level and added to the
+    counters returned by metrics().
+    """
+
+    RETRY_STATUSES = (500, 502, 503, 504)
+
+    def __init__(
+        self,
+        connect_timeout: float = None,
+        read_timeout: float = None,
+        pool_connections: int = None,
+        pool_maxsize: int = None,
+        max_retries: int = None,
+        backoff_factor: float = None,
+        backoff_jitter: float = None,
+        compress: bool = None,
+    ):
+        """
+        All arguments default to the matching key of settings.GITHUB_HTTP.
+
+        Args:
+            connect_timeout: Seconds to wait for a connection to be established
+            read_timeout: Seconds to wait between bytes of the response
+            pool_connections: Number of per-host connection pools to keep
+            pool_maxsize: Connections kept alive per host. Size it to the number of
+                        threads that talk to GitHub at once (sync workers, async
+                        concurrency, page concurrency).
+            max_retries: Retries for failed connections, reads and 5xx responses
+            backoff_factor: Base of the exponential backoff between retries, in seconds
+            backoff_jitter: Maximum random seconds added to each backoff
+            compress: Ask GitHub for gzip-compressed responses
+        """
+        config = getattr(settings, "GITHUB_HTTP", {})
+
+        def option(value, key, default):
+            return value if value is not None else config.get(key, default)
+
+        self.timeout = (
+            option(connect_timeout, "CONNECT_TIMEOUT", 5),
+            option(read_timeout, "READ_TIMEOUT", 30),
+        )
+        self.retry = Retry(
+            total=option(max_retries, "MAX_RETRIES", 3),
+            allowed_methods=frozenset(["GET", "HEAD"]),
+            status_forcelist=self.RETRY_STATUSES,
+            backoff_factor=option(backoff_factor, "BACKOFF_FACTOR", 0.5),
+            backoff_jitter=option(backoff_jitter, "BACKOFF_JITTER", 0.5),
+            # Give back the last 5xx response instead of raising, so callers see
+            # GitHub's error through raise_for_status() as before
+            raise_on_status=False,
+            # Retry-After is honoured by the rate-limit scheduler
+            respect_retry_after_header=False,
+        )
+        adapter = HTTPAdapter(
+            pool_connections=option(pool_connections, "POOL_CONNECTIONS", 10),
+            pool_maxsize=option(pool_maxsize, "POOL_MAXSIZE", 20),
+            max_retries=self.retry,
+        )
+
+        self.session = requests.Session()
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+        if not option(compress, "COMPRESS", True):
+            self.session.headers["Accept-Encoding"] = "identity"
+
+        self.requests = 0
+        self.failures = 0
+        self.total_seconds = 0.0
+        self.max_seconds = 0.0
+        self.bytes_received = 0
+        self._lock = threading.Lock()
+
+    def get(self, url: str, headers: dict = None, params: dict = None):
+        """
+        Sends a GET request on the pooled session.
+
+        Args:
+            url: The URL to request
+            headers: Headers to send in addition to the session's own
+            params: Optional query parameters
+
+        Raises:
+            requests.exceptions.RequestException: If the request fails after retries
+        """
+        return self._request("GET", url, headers=headers, params=params)
+
+    def post(self, url: str, json: dict = None, headers: dict = None):
+        """
+        Sends a POST request with a JSON body on the pooled session.
+
+        POST requests are not retried, since the transport can't know whether they
+        are safe to repeat.
+        """
+        return self._request("POST", url, headers=headers, json=json)
+
+    def _request(self, method: str, url: str, **kwargs):
+        started = time.monotonic()
+        try:
+            send = getattr(self.session, method.lower())
+            response = send(url, timeout=self.timeout, **kwargs)
+        except requests.exceptions.RequestException as e:
+            self._record(method, url, time.monotonic() - started, error=e)
+            raise
+
+        body = response.content
+        size = len(body) if isinstance(body, (bytes, bytearray)) else 0
+        self._record(
+            method, url, time.monotonic() - started, response=response, size=size
+        )
+        return response
+
+    def _record(self, method, url, elapsed, response=None, size=0, error=None) -> None:
+        with self._lock:
+            self.requests += 1
+            self.total_seconds += elapsed
+            self.max_seconds = max(self.max_seconds, elapsed)
+            self.bytes_received += size
+            if error is not None:
+                self.failures += 1
+
+        if error is not None:
+            logger.warning(
+                "%s %s failed after %.0fms: %s", method, url, elapsed * 1000, error
+            )
+        else:
+            logger.debug(
+                "%s %s -> %s in %.0fms (%d bytes)",
+                method,
+                url,
+                response.status_code,
+                elapsed * 1000,
+                size,
+            )
+
+    def metrics(self) -> dict:
+        """
+        Returns request counts, latency and bytes received since the transport was
+        created.
+        """
+        with self._lock:
+            return {
+                "requests": self.requests,
+                "failures": self.failures,
+                "total_seconds": self.total_seconds,
+                "average_seconds": (
+                    self.total_seconds / self.requests if self.requests else 0.0
+                ),
+                "max_seconds": self.max_seconds,
+                "bytes_received": self.bytes_received,
+            }
+
+    def close(self) -> None:
+        self.session.close()
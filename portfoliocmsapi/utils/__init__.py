@@ -1,2 +1,6 @@
 from .create_relationship_mixin import CreateRelationshipMixin
 from .update_relationship_mixin import UpdateRelationshipMixin
+from .github import parse_github_repo_url
+from .pagination import KeysetPagination
+from .response_cache import CachedResponseMixin, bump_generations
+from .conditional_get import ConditionalGetMixin
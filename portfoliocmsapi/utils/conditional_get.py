@@ -0,0 +1,73 @@
+import hashlib
+import math
+import time
+from typing import Optional
+from django.utils.cache import get_conditional_response, patch_cache_control
+from django.utils.http import http_date
+from rest_framework.response import Response
+from .response_cache import CachedResponseMixin, generation_time
+
+
+class ConditionalGetMixin(CachedResponseMixin):
+    """
+    Sends ETag and Last-Modified validators with list and retrieve responses, and
+    answers If-None-Match / If-Modified-Since with 304 Not Modified before any
+    query or serializer work runs.
+
+    Both validators come from the generation tokens of cache_models, which every
+    write to those models replaces (see CachedResponseMixin), so checking them costs
+    a cache read and no queries:
+
+    - ETag hashes the tokens with the absolute URL and the negotiated media type.
+    - Last-Modified is the time of the latest write to any of cache_models. It is
+      left out while that write is still within the current second, as HTTP dates
+      can't tell it apart from a later write in the same second.
+
+    Responses are sent with Cache-Control: no-cache, so clients revalidate instead
+    of guessing a freshness lifetime from Last-Modified.
+    """
+
+    def cached_response(self, request, handler, *args, **kwargs) -> Response:
+        if request.method not in ("GET", "HEAD") or self.action not in (
+            self.cached_actions
+        ):
+            return super().cached_response(request, handler, *args, **kwargs)
+
+        etag = self.get_etag(request)
+        last_modified = self.get_last_modified()
+        response = get_conditional_response(
+            request, etag=etag, last_modified=last_modified
+        )
+        if response is None:
+            response = super().cached_response(request, handler, *args, **kwargs)
+
+        if response.status_code in (200, 304):
+            response.headers["ETag"] = etag
+            if last_modified is not None:
+                response.headers["Last-Modified"] = http_date(last_modified)
+            patch_cache_control(response, no_cache=True)
+        return response
+
+    def get_etag(self, request) -> str:
+        digest = hashlib.sha256(
+            "\n".join(
+                [
+                    request.build_absolute_uri(),
+                    request.accepted_media_type or "",
+                    *self.response_generations(),
+                ]
+            ).encode()
+        ).hexdigest()
+        # Weak, as the same data may be sent with different encodings
+        return f'W/"{digest[:32]}"'
+
+    def get_last_modified(self) -> Optional[int]:
+        latest = max(
+            (generation_time(token) for token in self.response_generations()),
+            default=None,
+        )
+        if latest is None:
+            return None
+        # Rounded up, so a write after the response was built is always later
+        last_modified = math.ceil(latest)
+        return last_modified if last_modified <= time.time() else None
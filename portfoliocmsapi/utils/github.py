@@ -0,0 +1,29 @@
+from urllib.parse import urlparse
+
+
+def parse_github_repo_url(repo_url: str) -> tuple[str, str]:
+    """
+    Extracts the owner and repository name from a GitHub repository URL.
+
+    Trailing slashes, a .git suffix, query strings and deeper paths (such as
+    /tree/main) are ignored, so every way of writing the same repository gives the
+    same result. Case is kept as written; GitHub itself treats names
+    case-insensitively.
+
+    Example:
+        parse_github_repo_url("https://github.com/jeremywhitney/portfolio-cms_api/")
+        # ("jeremywhitney", "portfolio-cms_api")
+
+    Raises:
+        ValueError: If the URL has no owner/name path
+    """
+    segments = [
+        segment for segment in urlparse(repo_url.strip()).path.split("/") if segment
+    ]
+    if len(segments) < 2:
+        raise ValueError(f"Not a GitHub repository URL: {repo_url}")
+
+    owner, name = segments[0], segments[1]
+    if name.endswith(".git"):
+        name = name[: -len(".git")]
+    return owner, name
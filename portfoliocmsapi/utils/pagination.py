@@ -0,0 +1,163 @@
+import base64
+import json
+from datetime import date, datetime
+from decimal import Decimal
+from django.conf import settings
+from django.db.models import Q
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import BasePagination
+from rest_framework.response import Response
+from rest_framework.utils.urls import replace_query_param
+
+
+class KeysetPagination(BasePagination):
+    """
+    Cursor pagination that seeks straight to the next page by its sort key.
+
+    Pages follow the queryset's ordering (its order_by, or the model's Meta
+    ordering), with the primary key appended as a tie-breaker so every row has a
+    unique position. The cursor holds the sort key of the last row on the page, and
+    the next page is read with WHERE (date_created, id) < (...) instead of OFFSET,
+    so each page costs the same however deep it is, served by a composite index on
+    the ordering columns. Rows inserted while a client pages through are never
+    skipped or repeated, and no COUNT(*) is run.
+
+    Responses look like {"next": url, "previous": url, "results": [...]}.
+    Clients may ask for ?page_size= up to settings.PAGINATION["MAX_PAGE_SIZE"].
+
+    Only plain, non-null fields (including annotations) can be paged by.
+    """
+
+    cursor_query_param = "cursor"
+    page_size_query_param = "page_size"
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.request = request
+        self.page_size = self.get_page_size(request)
+        self.ordering = self.get_ordering(queryset)
+
+        cursor = self.decode_cursor(request)
+        reverse = cursor is not None and cursor["reverse"]
+        ordering = (
+            [self._reverse(field) for field in self.ordering]
+            if reverse
+            else self.ordering
+        )
+
+        queryset = queryset.order_by(*ordering)
+        if cursor is not None:
+            queryset = queryset.filter(self._after(ordering, cursor["position"]))
+
+        # One extra row tells whether there is another page beyond this one
+        rows = list(queryset[: self.page_size + 1])
+        has_more = len(rows) > self.page_size
+        rows = rows[: self.page_size]
+        if reverse:
+            rows.reverse()
+
+        self.next_position = self.previous_position = None
+        if rows:
+            if has_more or reverse:
+                self.next_position = self._position(rows[-1])
+            if cursor is not None and (has_more or not reverse):
+                self.previous_position = self._position(rows[0])
+        return rows
+
+    def get_paginated_response(self, data):
+        return Response(
+            {
+                "next": self.get_link(self.next_position, reverse=False),
+                "previous": self.get_link(self.previous_position, reverse=True),
+                "results": data,
+            }
+        )
+
+    def get_paginated_response_schema(self, schema):
+        return {
+            "type": "object",
+            "required": ["results"],
+            "properties": {
+                "next": {"type": "string", "nullable": True, "format": "uri"},
+                "previous": {"type": "string", "nullable": True, "format": "uri"},
+                "results": schema,
+            },
+        }
+
+    def get_page_size(self, request) -> int:
+        config = getattr(settings, "PAGINATION", {})
+        page_size = config.get("PAGE_SIZE", 50)
+        requested = request.query_params.get(self.page_size_query_param)
+        if requested is not None:
+            try:
+                page_size = int(requested)
+            except ValueError:
+                pass
+        return max(1, min(page_size, config.get("MAX_PAGE_SIZE", 200)))
+
+    @staticmethod
+    def get_ordering(queryset) -> list:
+        """
+        The queryset's ordering with the primary key added as the final tie-breaker.
+        """
+        ordering = list(queryset.query.order_by or queryset.model._meta.ordering)
+        if not any(field.lstrip("-") in ("id", "pk") for field in ordering):
+            descending = bool(ordering) and ordering[0].startswith("-")
+            ordering.append("-id" if descending else "id")
+        return ordering
+
+    def decode_cursor(self, request):
+        encoded = request.query_params.get(self.cursor_query_param)
+        if encoded is None:
+            return None
+        try:
+            cursor = json.loads(base64.urlsafe_b64decode(encoded.encode()))
+            position = cursor["p"]
+            if len(position) != len(self.ordering):
+                raise ValueError("Cursor doesn't match the ordering")
+            return {"position": position, "reverse": bool(cursor.get("r"))}
+        except (TypeError, ValueError, KeyError):
+            raise NotFound("Invalid cursor")
+
+    def encode_cursor(self, position: list, reverse: bool) -> str:
+        cursor = {"p": position, "r": 1} if reverse else {"p": position}
+        return base64.urlsafe_b64encode(json.dumps(cursor).encode()).decode()
+
+    def get_link(self, position, reverse: bool):
+        if position is None:
+            return None
+        url = self.request.build_absolute_uri()
+        return replace_query_param(
+            url, self.cursor_query_param, self.encode_cursor(position, reverse)
+        )
+
+    def _position(self, row) -> list:
+        position = []
+        for field in self.ordering:
+            value = getattr(row, field.lstrip("-"))
+            # Full precision, so the row itself compares equal to its position
+            if isinstance(value, (date, datetime)):
+                value = value.isoformat()
+            elif isinstance(value, Decimal):
+                value = str(value)
+            position.append(value)
+        return position
+
+    @staticmethod
+    def _reverse(field: str) -> str:
+        return field[1:] if field.startswith("-") else f"-{field}"
+
+    @staticmethod
+    def _after(ordering: list, position: list) -> Q:
+        """
+        Rows that sort after position: (a, b, c) > (x, y, z) as
+        a > x OR (a = x AND b > y) OR (a = x AND b = y AND c > z), with > read as <
+        for descending fields.
+        """
+        condition = Q()
+        equal = {}
+        for field, value in zip(ordering, position):
+            name = field.lstrip("-")
+            lookup = "lt" if field.startswith("-") else "gt"
+            condition |= Q(**equal, **{f"{name}__{lookup}": value})
+            equal[name] = value
+        return condition
@@ -0,0 +1,85 @@
+import re
+from typing import Callable, Dict, List
+from django.db import connection
+
+# Plan lines that read a whole table: SQLite's "SCAN <table>" (in index order if
+# USING INDEX follows), PostgreSQL's "Seq Scan on <table>"
+SQLITE_SCAN = re.compile(
+    r"^SCAN (?:TABLE )?(\w+)(?: AS \w+)?(?P<index> USING (?:COVERING )?INDEX \w+)?$"
+)
+POSTGRESQL_SCAN = re.compile(r"Seq Scan on (\w+)")
+LIMIT = re.compile(r"\bLIMIT\b", re.IGNORECASE)
+
+
+def capture_queries(func: Callable) -> List[tuple]:
+    """
+    Runs func and returns the (sql, params) of every SELECT it sent.
+    """
+    queries = []
+
+    def record(execute, sql, params, many, context):
+        if sql.lstrip().upper().startswith("SELECT"):
+            queries.append((sql, params))
+        return execute(sql, params, many, context)
+
+    with connection.execute_wrapper(record):
+        func()
+    return queries
+
+
+def explain(sql: str, params=None) -> List[str]:
+    """
+    Returns the database's query plan for a statement, one line per plan step.
+    """
+    prefix = "EXPLAIN QUERY PLAN " if connection.vendor == "sqlite" else "EXPLAIN "
+    with connection.cursor() as cursor:
+        cursor.execute(prefix + sql, params)
+        rows = cursor.fetchall()
+    if connection.vendor == "sqlite":
+        # (id, parent, notused, detail)
+        return [row[-1] for row in rows]
+    return [" ".join(str(column) for column in row) for row in rows]
+
+
+def full_scans(plan: List[str], sql: str = "") -> List[str]:
+    """
+    Returns the tables a query plan reads in full.
+
+    On SQLite, walking a whole table in index order only counts if the query has no
+    LIMIT: with one (as on every paginated list), the scan stops after a page.
+    """
+    tables = []
+    for line in plan:
+        if connection.vendor == "sqlite":
+            match = SQLITE_SCAN.match(line.strip())
+            if match and not (match.group("index") and LIMIT.search(sql)):
+                tables.append(match.group(1))
+        elif connection.vendor == "postgresql":
+            tables.extend(POSTGRESQL_SCAN.findall(line))
+    return tables
+
+
+def check_query_plans(checks: Dict[str, Callable]) -> List[Dict]:
+    """
+    Runs each check, EXPLAINs every SELECT it sends and flags full table scans.
+
+    Args:
+        checks: Maps a label (such as an endpoint) to a function that runs its
+               queries, for example by requesting the endpoint
+
+    Returns:
+        One dict per query, with "label", "sql", "plan" and "full_scans"
+    """
+    results = []
+    for label, func in checks.items():
+        for sql, params in capture_queries(func):
+            plan = explain(sql, params)
+            results.append(
+                {
+                    "label": label,
+                    "sql": sql,
+                    "plan": plan,
+                    "full_scans": full_scans(plan, sql),
+                }
+            )
+    return results
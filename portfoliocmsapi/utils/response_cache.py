@@ -0,0 +1,143 @@
+import hashlib
+import time
+import uuid
+from typing import Iterable, List
+from django.conf import settings
+from django.core.cache import caches
+from django.db import transaction
+from rest_framework.response import Response
+
+RESPONSE_CACHE_ALIAS = "api_responses"
+GENERATION_KEY = "api:generation:{}"
+RESPONSE_KEY = "api:response:{}"
+
+
+def get_response_cache():
+    return caches[RESPONSE_CACHE_ALIAS]
+
+
+def response_cache_enabled() -> bool:
+    return getattr(settings, "API_RESPONSE_CACHE", {}).get("ENABLED", True)
+
+
+def new_generation() -> str:
+    # The time of the write, then a random part so tokens never repeat
+    return f"{time.time():.6f}-{uuid.uuid4().hex}"
+
+
+def generation_time(generation: str) -> float:
+    return float(generation.split("-", 1)[0])
+
+
+def get_generations(models: Iterable) -> List[str]:
+    """
+    Returns the current generation token of each model, creating missing ones.
+
+    A token is replaced (never incremented) on every write, so a token that was
+    evicted or lost comes back as a new value, with a later time, and can only
+    cause misses, never a stale hit.
+    """
+    cache = get_response_cache()
+    keys = [GENERATION_KEY.format(model._meta.label_lower) for model in models]
+    generations = cache.get_many(keys)
+    for key in keys:
+        if key not in generations:
+            # add() so concurrent first readers agree on one token
+            cache.add(key, new_generation(), None)
+            generations[key] = cache.get(key)
+    return [generations[key] for key in keys]
+
+
+def bump_generations(*models) -> None:
+    """
+    Invalidates every cached response that read any of models.
+
+    The tokens are replaced now, so reads later in the same transaction miss, and
+    again once the transaction commits, so a response cached by another request
+    from the data as it was before the commit isn't served afterwards.
+    """
+    if not models:
+        return
+
+    def bump():
+        get_response_cache().set_many(
+            {
+                GENERATION_KEY.format(model._meta.label_lower): new_generation()
+                for model in models
+            },
+            None,
+        )
+
+    bump()
+    transaction.on_commit(bump)
+
+
+def invalidate_cached_responses(sender, action=None, **kwargs):
+    """
+    Signal receiver for post_save, post_delete and m2m_changed that bumps the
+    generation of the model (or many-to-many through model) that changed.
+    """
+    if action is not None and not action.startswith("post_"):
+        return
+    bump_generations(sender)
+
+
+class CachedResponseMixin:
+    """
+    Serves GET list and retrieve responses (and any other action listed in
+    cached_actions) from the API response cache.
+
+    Entries are keyed by the absolute URL and the generation tokens of
+    cache_models, which must include every model the responses read, including
+    many-to-many through models. Writes through the ORM bump the tokens via the
+    signal receivers registered by each app; bulk writes, which send no signals,
+    must call bump_generations themselves.
+
+    Only the response data is cached, so content negotiation and rendering still
+    happen per request. Responses must not depend on the requesting user.
+    """
+
+    cache_models = ()
+    cached_actions = ("list", "retrieve")
+
+    def list(self, request, *args, **kwargs):
+        return self.cached_response(request, super().list, *args, **kwargs)
+
+    def retrieve(self, request, *args, **kwargs):
+        return self.cached_response(request, super().retrieve, *args, **kwargs)
+
+    def cached_response(self, request, handler, *args, **kwargs) -> Response:
+        """
+        Returns the cached response for request, or calls handler and caches a
+        successful result.
+        """
+        if (
+            request.method != "GET"
+            or self.action not in self.cached_actions
+            or not response_cache_enabled()
+        ):
+            return handler(request, *args, **kwargs)
+
+        cache = get_response_cache()
+        key = self.response_cache_key(request)
+        data = cache.get(key)
+        if data is not None:
+            return Response(data)
+
+        response = handler(request, *args, **kwargs)
+        if response.status_code == 200:
+            cache.set(key, response.data)
+        return response
+
+    def response_generations(self) -> List[str]:
+        # The view instance lives for one request, so the tokens are read once
+        if not hasattr(self, "_response_generations"):
+            self._response_generations = get_generations(self.cache_models)
+        return self._response_generations
+
+    def response_cache_key(self, request) -> str:
+        generations = self.response_generations()
+        digest = hashlib.sha256(
+            "\n".join([request.build_absolute_uri(), *generations]).encode()
+        ).hexdigest()
+        return RESPONSE_KEY.format(digest)
@@ -1,4 +1,5 @@
 import os
+import tempfile
 from dotenv import load_dotenv
 from pathlib import Path
 
@@ -40,6 +41,7 @@ INSTALLED_APPS = [
     "portfoliocmsapi.projects",
     "portfoliocmsapi.blog",
     "portfoliocmsapi.users",
+    "portfoliocmsapi.jobs",
 ]
 
 REST_FRAMEWORK = {
@@ -51,6 +53,13 @@ REST_FRAMEWORK = {
     ],
 }
 
+# Keyset pagination of the project, post and media lists. Clients can ask for up to
+# MAX_PAGE_SIZE rows per page with ?page_size=.
+PAGINATION = {
+    "PAGE_SIZE": int(os.getenv("PAGINATION_PAGE_SIZE", "50")),
+    "MAX_PAGE_SIZE": int(os.getenv("PAGINATION_MAX_PAGE_SIZE", "200")),
+}
+
 CORS_ORIGIN_WHITELIST = (
     "http://localhost:3000",
     "http://127.0.0.1:3000",
@@ -150,3 +159,151 @@ MEDIA_URL = "/media/"
 MEDIA_ROOT = BASE_DIR / "media"
 
 GITHUB_ACCESS_TOKEN = os.getenv("GITHUB_ACCESS_TOKEN")
+
+# Root of the GitHub REST API (override for GitHub Enterprise or a local stand-in)
+GITHUB_API_URL = os.getenv("GITHUB_API_URL", "https://api.github.com")
+
+# How long (in seconds) a successful GitHub token check is trusted before
+# the shared client verifies it again
+GITHUB_TOKEN_VERIFY_TTL = int(os.getenv("GITHUB_TOKEN_VERIFY_TTL", "300"))
+
+# Maximum number of repository list pages fetched from GitHub in parallel
+GITHUB_PAGE_CONCURRENCY = int(os.getenv("GITHUB_PAGE_CONCURRENCY", "1"))
+
+# ETag cache used for conditional (If-None-Match) GitHub requests.
+# BACKEND is "memory" (per-process LRU), "file" (shared on-disk) or "none".
+GITHUB_CONDITIONAL_CACHE = {
+    "BACKEND": os.getenv("GITHUB_CONDITIONAL_CACHE_BACKEND", "memory"),
+    "LOCATION": BASE_DIR / ".github_cache",
+    "MAX_BYTES": 50 * 1024 * 1024,
+}
+
+# Number of repositories fetched from GitHub in parallel by bulk syncs
+GITHUB_SYNC_WORKERS = int(os.getenv("GITHUB_SYNC_WORKERS", "8"))
+
+# Whether bulk syncs fetch repositories in batches of 100 through GitHub's GraphQL
+# API, falling back to per-repository REST requests
+GITHUB_SYNC_GRAPHQL = os.getenv("GITHUB_SYNC_GRAPHQL", "true").lower() == "true"
+
+# Largest number of repositories one POST /api/projects/github/import may list
+GITHUB_IMPORT_MAX_REPOSITORIES = int(
+    os.getenv("GITHUB_IMPORT_MAX_REPOSITORIES", "1000")
+)
+
+# Pacing of GitHub requests. Once the remaining quota drops to RESERVE, requests
+# are spread over the rest of the rate-limit window; rate-limited responses are
+# retried up to MAX_RETRIES times, waiting at most MAX_WAIT seconds each time.
+GITHUB_RATE_LIMIT = {
+    "RESERVE": 100,
+    "MAX_RETRIES": 3,
+    "MAX_WAIT": 60,
+}
+
+# Shared secret used to verify the X-Hub-Signature-256 of GitHub webhook deliveries
+GITHUB_WEBHOOK_SECRET = os.getenv("GITHUB_WEBHOOK_SECRET")
+
+# Background job queue. Failed jobs are retried with exponential backoff starting
+# at RETRY_BACKOFF seconds; running jobs whose worker hasn't finished them within
+# LOCK_TIMEOUT seconds are put back in the queue.
+JOB_QUEUE = {
+    "MAX_ATTEMPTS": 5,
+    "RETRY_BACKOFF": 30,
+    "MAX_RETRY_BACKOFF": 3600,
+    "LOCK_TIMEOUT": 600,
+    "POLL_INTERVAL": 1.0,
+}
+
+# Maximum number of GitHub requests the async client runs at once, when the caller
+# doesn't set it (sync_projects uses its workers)
+GITHUB_ASYNC_CONCURRENCY = int(os.getenv("GITHUB_ASYNC_CONCURRENCY", "10"))
+
+# Whether the GitHub sync endpoints queue a job and answer 202 by default.
+# Clients can also ask for this per request with ?async=true.
+GITHUB_SYNC_ASYNC = os.getenv("GITHUB_SYNC_ASYNC", "false").lower() == "true"
+
+# Snapshot of the repository list behind GET /api/projects/github. It is served for
+# TTL seconds, then served stale while a background refresh runs. After
+# FAILURE_THRESHOLD failed (or SLOW_CALL-second) refreshes, GitHub is left alone for
+# RESET_TIMEOUT seconds. The repositories that already have projects are cached
+# until a project changes, or for PROJECT_REPOSITORIES_TTL seconds.
+GITHUB_REPOSITORY_CACHE = {
+    "TTL": int(os.getenv("GITHUB_REPOSITORY_CACHE_TTL", "300")),
+    "FAILURE_THRESHOLD": 3,
+    "RESET_TIMEOUT": 60,
+    "SLOW_CALL": 10,
+    "PROJECT_REPOSITORIES_TTL": 300,
+}
+
+# Concurrent identical GitHub requests share one upstream call. With CROSS_PROCESS,
+# processes using the same cache backend coalesce too, via a lock in the cache
+# held for at most LOCK_TIMEOUT seconds.
+GITHUB_SINGLE_FLIGHT = {
+    "CROSS_PROCESS": os.getenv("GITHUB_SINGLE_FLIGHT_CROSS_PROCESS", "false").lower()
+    == "true",
+    "LOCK_TIMEOUT": 30,
+    "POLL_INTERVAL": 0.05,
+}
+
+# HTTP transport used for GitHub requests. Connections are kept alive in a pool of
+# POOL_MAXSIZE per host, which should cover the sync workers and async concurrency.
+# Connection errors and 5xx responses are retried MAX_RETRIES times with jittered
+# exponential backoff.
+GITHUB_HTTP = {
+    "CONNECT_TIMEOUT": float(os.getenv("GITHUB_CONNECT_TIMEOUT", "5")),
+    "READ_TIMEOUT": float(os.getenv("GITHUB_READ_TIMEOUT", "30")),
+    "POOL_CONNECTIONS": 10,
+    "POOL_MAXSIZE": int(os.getenv("GITHUB_POOL_MAXSIZE", "20")),
+    "MAX_RETRIES": 3,
+    "BACKOFF_FACTOR": 0.5,
+    "BACKOFF_JITTER": 0.5,
+    "COMPRESS": True,
+}
+
+# Cache of GET responses from the project, post, tag and tech stack endpoints.
+# Entries are keyed by URL and by a generation token per model that every write to
+# the model replaces, so writes show up on the next read and TTL only bounds how
+# long unread entries linger. The generation tokens live in the same cache, so it
+# must be shared by every server process. BACKEND is "file" (on disk at LOCATION,
+# shared by the processes on one host; defaults to a directory under the system
+# temp directory, outside the source tree), "redis" (a Redis server at LOCATION,
+# shared across hosts; needs the redis package) or "locmem" (per process, so a
+# write in one worker leaves the others serving stale responses; only for a single
+# process). The test suite swaps in locmem, see conftest.py.
+API_RESPONSE_CACHE = {
+    "ENABLED": os.getenv("API_RESPONSE_CACHE_ENABLED", "true").lower() == "true",
+    "BACKEND": os.getenv("API_RESPONSE_CACHE_BACKEND", "file"),
+    "LOCATION": os.getenv("API_RESPONSE_CACHE_LOCATION"),
+    "TTL": int(os.getenv("API_RESPONSE_CACHE_TTL", "600")),
+    "MAX_ENTRIES": 5000,
+}
+
+_API_RESPONSE_CACHE_BACKENDS = {
+    "locmem": (
+        "django.core.cache.backends.locmem.LocMemCache",
+        "api-responses",
+    ),
+    "file": (
+        "django.core.cache.backends.filebased.FileBasedCache",
+        os.path.join(tempfile.gettempdir(), "portfoliocms-api-responses"),
+    ),
+    "redis": (
+        "django.core.cache.backends.redis.RedisCache",
+        "redis://127.0.0.1:6379/1",
+    ),
+}
+_backend, _location = _API_RESPONSE_CACHE_BACKENDS[API_RESPONSE_CACHE["BACKEND"]]
+
+CACHES = {
+    "default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"},
+    "api_responses": {
+        "BACKEND": _backend,
+        "LOCATION": API_RESPONSE_CACHE["LOCATION"] or _location,
+        "TIMEOUT": API_RESPONSE_CACHE["TTL"],
+        # Redis evicts by its own maxmemory policy
+        "OPTIONS": (
+            {}
+            if API_RESPONSE_CACHE["BACKEND"] == "redis"
+            else {"MAX_ENTRIES": API_RESPONSE_CACHE["MAX_ENTRIES"]}
+        ),
+    },
+}
@@ -6,4 +6,5 @@ urlpatterns = [
     path("api/", include("portfoliocmsapi.projects.urls")),
     path("api/", include("portfoliocmsapi.blog.urls")),
     path("api/", include("portfoliocmsapi.users.urls")),
+    path("api/", include("portfoliocmsapi.jobs.urls")),
 ] + static(settings.MEDIA_URL, document_root=settings.MEDIA_ROOT)